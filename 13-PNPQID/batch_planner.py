@@ -0,0 +1,80 @@
+import threading
+from typing import Iterator, List
+
+
+class QueryTimeout(Exception):
+    """Raised when the SPARQL endpoint times out on a VALUES batch."""
+
+
+def is_timeout_response(status_code: int, text: str) -> bool:
+    # WDQS reports query timeouts as HTTP 500 with a Java TimeoutException body
+    if status_code == 504:
+        return True
+    return status_code == 500 and "TimeoutException" in (text or "")
+
+
+class BatchPlanner:
+    """Grows or shrinks the VALUES batch size from observed query cost.
+
+    After each batch the planner keeps a moving average of bindings per QID
+    and seconds per QID, and sizes the next batch so that it should return
+    about `target_bindings` rows within `target_latency` seconds. A timeout
+    halves the current size immediately. Safe to share between threads.
+    """
+
+    def __init__(self, initial_size: int, min_size: int = 1, max_size: int = 200,
+                 target_bindings: int = 20000, target_latency: float = 10.0,
+                 smoothing: float = 0.3):
+        self.size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_bindings = target_bindings
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+        self.bindings_per_qid = None
+        self.latency_per_qid = None
+        self.lock = threading.Lock()
+
+    def _average(self, current, sample):
+        if current is None:
+            return sample
+        return (1 - self.smoothing) * current + self.smoothing * sample
+
+    def _clamp(self, size) -> int:
+        return max(self.min_size, min(self.max_size, int(size)))
+
+    def record(self, batch_size: int, bindings: int, latency: float):
+        if batch_size <= 0:
+            return
+        with self.lock:
+            self.bindings_per_qid = self._average(self.bindings_per_qid, bindings / batch_size)
+            self.latency_per_qid = self._average(self.latency_per_qid, latency / batch_size)
+            candidates = []
+            if self.bindings_per_qid > 0:
+                candidates.append(self.target_bindings / self.bindings_per_qid)
+            if self.latency_per_qid > 0:
+                candidates.append(self.target_latency / self.latency_per_qid)
+            if candidates:
+                # Never more than double in one step so a lucky batch cannot overshoot
+                self.size = self._clamp(min(min(candidates), self.size * 2))
+
+    def on_timeout(self, batch_size: int):
+        with self.lock:
+            self.size = self._clamp(min(self.size, batch_size // 2))
+
+    def next_size(self) -> int:
+        with self.lock:
+            return self.size
+
+    def batches(self, qids: List[str]) -> Iterator[List[str]]:
+        """Lazily slice `qids`, re-reading the planned size before each batch."""
+        i = 0
+        while i < len(qids):
+            size = self.next_size()
+            yield qids[i : i + size]
+            i += size
+
+
+def split_batch(qids: List[str]):
+    mid = len(qids) // 2
+    return qids[:mid], qids[mid:]
@@ -7,7 +7,8 @@ import requests
 import argparse
 import os
 from collections import defaultdict
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Tuple
+from batch_planner import BatchPlanner, QueryTimeout, is_timeout_response, split_batch
 
 # --- Configuration ---
 class Config:
@@ -18,11 +19,23 @@ class Config:
         "Bot/1.0 (Research project; contact@example.com)"
     ]
     MAX_RETRIES = 3
-    BATCH_SIZE = 50
+    BATCH_SIZE = 50  # Initial size; adjusted by BatchPlanner for entity queries
+    MIN_BATCH_SIZE = 1
+    MAX_BATCH_SIZE = 200
+    TARGET_BINDINGS = 20000
+    TARGET_LATENCY = 15.0
     MIN_DELAY = 1.5
     MAX_DELAY = 3.0
     TIMEOUT = 45
     OUTPUT_FILE = os.path.join("output", "sponsor_painter_kg.jsonld")
+    CONTEXT = {
+        "wd": "http://www.wikidata.org/entity/",
+        "wdt": "http://www.wikidata.org/prop/direct/",
+        "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+        "schema": "http://schema.org/",
+        "xsd": "http://www.w3.org/2001/XMLSchema#",
+        "ex": "http://example.org/ontology/"
+    }
     LOG_FILE = os.path.join("logs", "kg_extraction.log")
 
 # --- Logger ---
@@ -53,37 +66,85 @@ class WikidataFetcher:
     def _get_headers(self):
         return {'User-Agent': random.choice(Config.USER_AGENTS), 'Accept': 'application/json'}
 
-    def execute_query(self, query: str) -> List[Dict]:
+    def execute_query(self, query: str, raise_on_timeout: bool = False) -> List[Dict]:
+        return self.execute_query_timed(query, raise_on_timeout)[0]
+
+    def execute_query_timed(self, query: str, raise_on_timeout: bool = False) -> Tuple[List[Dict], float]:
+        """Bindings plus the HTTP round trip of the successful attempt, excluding the
+        polite delay, rate-limit waits and failed retries (0.0 when every attempt failed)."""
         for attempt in range(Config.MAX_RETRIES):
             try:
                 time.sleep(random.uniform(Config.MIN_DELAY, Config.MAX_DELAY))
+                sent = time.monotonic()
                 response = self.session.get(
                     Config.WIKIDATA_ENDPOINT, 
                     params={'query': query, 'format': 'json'}, 
                     headers=self._get_headers(),
                     timeout=Config.TIMEOUT
                 )
+                latency = time.monotonic() - sent
                 
                 if response.status_code == 200:
-                    return response.json().get('results', {}).get('bindings', [])
+                    return response.json().get('results', {}).get('bindings', []), latency
                 elif response.status_code == 429:
                     wait = (2 ** attempt) * 5
                     logger.warning(f"Rate limited. Waiting {wait}s...")
                     time.sleep(wait)
+                elif raise_on_timeout and is_timeout_response(response.status_code, response.text):
+                    raise QueryTimeout()
                 else:
                     logger.error(f"HTTP {response.status_code}: {response.text[:100]}")
+            except requests.exceptions.Timeout as e:
+                if raise_on_timeout:
+                    raise QueryTimeout() from e
+                logger.error(f"Request failed: {e}")
             except Exception as e:
                 logger.error(f"Request failed: {e}")
-        return []
+        return [], 0.0
+
+# --- Streaming Writer ---
+class StreamingJSONLDWriter:
+    """Writes a JSON-LD document node by node instead of building `@graph` in memory.
+
+    Entity nodes are appended as soon as they are complete; property nodes and
+    `@context` are written by `close`, so the document is only valid JSON once
+    the writer is closed.
+    """
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.count = 0
+        self.f = open(filepath, 'w', encoding='utf-8')
+        self.f.write('{\n  "@graph": [')
+
+    def write_node(self, node: Dict):
+        self.f.write(",\n    " if self.count else "\n    ")
+        self.f.write(json.dumps(node, ensure_ascii=False))
+        self.count += 1
+
+    def close(self, context: Dict):
+        self.f.write("\n  ],\n  \"@context\": ")
+        self.f.write(json.dumps(context, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+        self.f.write("\n}\n")
+        self.f.close()
 
 # --- Logic ---
 class KGExtractor:
-    def __init__(self, input_file):
+    def __init__(self, input_file, writer: StreamingJSONLDWriter = None):
         self.input_file = input_file
         self.fetcher = WikidataFetcher()
         self.all_properties = set()
         self.entities = {} # Map QID -> Node Data
+        self.seen_values = {} # Map QID -> set of (prop, canonical value) keys for O(1) dedup
         self.property_labels = {} # Map PID -> Labels
+        # When set, entities are written and dropped after each batch (streaming mode)
+        self.writer = writer
+        self.planner = BatchPlanner(
+            Config.BATCH_SIZE,
+            min_size=Config.MIN_BATCH_SIZE,
+            max_size=Config.MAX_BATCH_SIZE,
+            target_bindings=Config.TARGET_BINDINGS,
+            target_latency=Config.TARGET_LATENCY,
+        )
 
     def load_input_qids(self, limit=None) -> List[Dict]:
         qids = []
@@ -100,29 +161,45 @@ class KGExtractor:
             return []
 
     def fetch_entity_data(self, input_data: List[Dict]):
-        qids = [row['Original-QID'] for row in input_data]
+        # De-duplicate so an entity is never split across batches (and streamed twice)
+        qids = list(dict.fromkeys(row['Original-QID'] for row in input_data))
         input_map = {row['Original-QID']: row for row in input_data}
         
-        # Process in batches
-        for i in range(0, len(qids), Config.BATCH_SIZE):
-            batch = qids[i : i + Config.BATCH_SIZE]
-            logger.info(f"Fetching batch {i} - {i+len(batch)}...")
-            
-            # SPARQL: Get all direct properties (wdt:), values, and labels
-            # We fetch ?item ?itemLabel ?p ?o ?oLabel
-            # Note: ?p will be a URI like http://www.wikidata.org/prop/direct/P31
-            values_clause = " ".join([f"wd:{qid}" for qid in batch])
-            query = f"""
-            SELECT ?item ?itemLabel ?p ?o ?oLabel WHERE {{
-              VALUES ?item {{ {values_clause} }}
-              ?item ?p ?o .
-              FILTER(STRSTARTS(STR(?p), "http://www.wikidata.org/prop/direct/"))
-              SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en,zh". }}
-            }}
-            """
-            
-            results = self.fetcher.execute_query(query)
+        # Process in batches sized by the planner
+        done = 0
+        for batch in self.planner.batches(qids):
+            logger.info(f"Fetching batch {done} - {done+len(batch)}...")
+            results = self.fetch_entity_batch(batch)
             self._process_batch_results(results, input_map)
+            if self.writer:
+                self.flush_entities()
+            done += len(batch)
+
+    def fetch_entity_batch(self, batch: List[str]) -> List[Dict]:
+        """Fetch direct claims for a batch, halving it on timeout instead of resending it."""
+        # SPARQL: Get all direct properties (wdt:), values, and labels
+        # We fetch ?item ?itemLabel ?p ?o ?oLabel
+        # Note: ?p will be a URI like http://www.wikidata.org/prop/direct/P31
+        values_clause = " ".join([f"wd:{qid}" for qid in batch])
+        query = f"""
+        SELECT ?item ?itemLabel ?p ?o ?oLabel WHERE {{
+          VALUES ?item {{ {values_clause} }}
+          ?item ?p ?o .
+          FILTER(STRSTARTS(STR(?p), "http://www.wikidata.org/prop/direct/"))
+          SERVICE wikibase:label {{ bd:serviceParam wikibase:language "en,zh". }}
+        }}
+        """
+        try:
+            results, latency = self.fetcher.execute_query_timed(query, raise_on_timeout=len(batch) > 1)
+        except QueryTimeout:
+            self.planner.on_timeout(len(batch))
+            left, right = split_batch(batch)
+            logger.warning(f"Query timed out for {len(batch)} QIDs. Splitting into {len(left)} + {len(right)}...")
+            return self.fetch_entity_batch(left) + self.fetch_entity_batch(right)
+
+        if results:
+            self.planner.record(len(batch), len(results), latency)
+        return results
 
     def _process_batch_results(self, results, input_map):
         for binding in results:
@@ -138,6 +215,7 @@ class KGExtractor:
                     "rdfs:label": label,
                     "ex:originalInfo": input_map.get(qid, {})
                 }
+                self.seen_values[qid] = set()
             
             # Process Property
             p_uri = binding['p']['value']
@@ -179,10 +257,40 @@ class KGExtractor:
             if prop_key not in self.entities[qid]:
                 self.entities[qid][prop_key] = []
             
-            # Avoid duplicates if possible (simple check)
-            if value_node not in self.entities[qid][prop_key]:
+            # Avoid duplicates via a hashed canonical key instead of a list scan
+            value_key = (prop_key, json.dumps(value_node, sort_keys=True, ensure_ascii=False))
+            if value_key not in self.seen_values[qid]:
+                self.seen_values[qid].add(value_key)
                 self.entities[qid][prop_key].append(value_node)
 
+    @staticmethod
+    def _clean_node(data: Dict) -> Dict:
+        # Flatten single-item lists for cleaner JSON
+        clean_data = {}
+        for k, v in data.items():
+            if isinstance(v, list) and len(v) == 1:
+                clean_data[k] = v[0]
+            else:
+                clean_data[k] = v
+        return clean_data
+
+    def _property_nodes(self) -> List[Dict]:
+        return [
+            {
+                "@id": f"wdt:{pid}",
+                "@type": "rdf:Property",
+                "rdfs:label": label
+            }
+            for pid, label in self.property_labels.items()
+        ]
+
+    def flush_entities(self):
+        """Stream every completed entity to the writer and release its memory."""
+        for data in self.entities.values():
+            self.writer.write_node(self._clean_node(data))
+        self.entities.clear()
+        self.seen_values.clear()
+
     def fetch_property_labels(self):
         if not self.all_properties:
             return
@@ -210,37 +318,27 @@ class KGExtractor:
                 self.property_labels[pid] = label
 
     def save_jsonld(self):
+        if self.writer:
+            # Entities were streamed per batch; only properties and @context remain
+            self.flush_entities()
+            for node in self._property_nodes():
+                self.writer.write_node(node)
+            self.writer.close(Config.CONTEXT)
+            logger.info(f"Streamed {self.writer.count} JSON-LD nodes to {Config.OUTPUT_FILE}")
+            return
+
         graph = []
         
         # 1. Add Entities
         for qid, data in self.entities.items():
-            # Flatten single-item lists for cleaner JSON
-            clean_data = {}
-            for k, v in data.items():
-                if isinstance(v, list) and len(v) == 1:
-                    clean_data[k] = v[0]
-                else:
-                    clean_data[k] = v
-            graph.append(clean_data)
+            graph.append(self._clean_node(data))
             
         # 2. Add Properties
-        for pid, label in self.property_labels.items():
-            graph.append({
-                "@id": f"wdt:{pid}",
-                "@type": "rdf:Property",
-                "rdfs:label": label
-            })
+        graph.extend(self._property_nodes())
             
         # 3. Construct Final Object
         output = {
-            "@context": {
-                "wd": "http://www.wikidata.org/entity/",
-                "wdt": "http://www.wikidata.org/prop/direct/",
-                "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-                "schema": "http://schema.org/",
-                "xsd": "http://www.w3.org/2001/XMLSchema#",
-                "ex": "http://example.org/ontology/"
-            },
+            "@context": Config.CONTEXT,
             "@graph": graph
         }
         
@@ -252,6 +350,7 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--test", action="store_true", help="Run with 5 records")
     parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--stream", action="store_true", help="Write entities per batch to bound memory by batch size")
     args = parser.parse_args()
     
     limit = 5 if args.test else args.limit
@@ -262,6 +361,8 @@ def main():
     input_data = extractor.load_input_qids(limit)
     if not input_data:
         return
+    if args.stream:
+        extractor.writer = StreamingJSONLDWriter(Config.OUTPUT_FILE)
         
     # 2. Fetch Entity Data (and collect used Properties)
     extractor.fetch_entity_data(input_data)
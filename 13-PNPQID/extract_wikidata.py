@@ -7,9 +7,13 @@ import requests
 import argparse
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from collections import defaultdict
-from typing import List, Dict, Set, Any
+from email.utils import parsedate_to_datetime
+from collections import defaultdict, deque
+from typing import List, Dict, Set, Any, Iterable, Iterator, Optional, Tuple
+from batch_planner import BatchPlanner, QueryTimeout, is_timeout_response, split_batch
 
 # --- Configuration ---
 class Config:
@@ -21,12 +25,20 @@ class Config:
         "Bot/1.0 (Research project; contact@example.com)"
     ]
     MAX_RETRIES = 3
-    BATCH_SIZE = 50  # Number of QIDs per SPARQL query
-    MIN_DELAY = 1.5
-    MAX_DELAY = 3.0
+    BATCH_SIZE = 50  # Initial number of QIDs per SPARQL query
+    MIN_BATCH_SIZE = 1
+    MAX_BATCH_SIZE = 200
+    TARGET_BINDINGS = 20000  # Rows a single batch should aim to return
+    TARGET_LATENCY = 10.0  # Seconds a single batch should aim to take
     TIMEOUT = 30
+    MAX_WORKERS = 4  # Concurrent SPARQL requests in flight
+    RATE_LIMIT = 1.0  # Sustained requests per second across all workers
+    RATE_BURST = 2  # Token bucket capacity
+    MAX_RETRY_AFTER = 120  # Upper bound (s) for a server-supplied Retry-After
     OUTPUT_FILE = os.path.join("output", "sponsor_painter_kg.jsonl")
-    CHECKPOINT_FILE = os.path.join("output", "checkpoint.json")
+    CHECKPOINT_FILE = os.path.join("output", "checkpoint.journal")
+    LEGACY_CHECKPOINT_FILE = os.path.join("output", "checkpoint.json")
+    COMPACT_EVERY = 200  # Journal entries before the log is compacted
     LOG_FILE = os.path.join("logs", "extraction.log")
 
 # --- Logger Setup ---
@@ -50,31 +62,110 @@ logger = setup_logger()
 
 # --- Checkpoint Manager ---
 class CheckpointManager:
-    def __init__(self, filepath):
+    """Append-only, fsync'd checkpoint journal reconciled against the output JSONL.
+
+    Each line of the journal is a JSON record `{"op": "done"|"missing", "qids": [...]}`.
+    Output records are written and fsync'd before their journal entry, so on
+    restart the QIDs actually present in the output file are the source of
+    truth: a crash between the two writes loses nothing, and a batch whose
+    fetch failed is never recorded at all. `missing` marks QIDs that were
+    fetched successfully but returned no data (deleted or invalid items).
+    """
+    def __init__(self, filepath, output_file):
         self.filepath = filepath
+        self.output_file = output_file
         self.processed_qids = set()
+        self.missing_qids = set()
+        self.entries = 0
         self.load()
+        self._journal = open(self.filepath, 'a', encoding='utf-8')
+
+    @staticmethod
+    def _read_lines(filepath):
+        """Yield parsed JSON lines. A torn final line left by a crash is truncated; an
+        undecodable line anywhere else is skipped with a warning and kept on disk."""
+        if not os.path.exists(filepath):
+            return
+        offset = 0
+        bad_line = None  # (line number, start offset) of the last undecodable line
+        with open(filepath, 'rb') as f:
+            for line_no, raw in enumerate(f, 1):
+                if bad_line:
+                    logger.warning(f"Skipping undecodable line {bad_line[0]} of {filepath}")
+                    bad_line = None
+                try:
+                    record = json.loads(raw) if raw.endswith(b"\n") else None
+                except json.JSONDecodeError:
+                    record = None
+                if record is None:
+                    bad_line = (line_no, offset)
+                else:
+                    yield record
+                offset += len(raw)
+        if bad_line:
+            logger.warning(f"Truncating partial record at end of {filepath} (line {bad_line[0]})")
+            with open(filepath, 'r+b') as f:
+                f.truncate(bad_line[1])
 
     def load(self):
-        if os.path.exists(self.filepath):
-            try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.processed_qids = set(data.get("processed_qids", []))
-                logger.info(f"Loaded checkpoint. {len(self.processed_qids)} QIDs already processed.")
-            except Exception as e:
-                logger.error(f"Failed to load checkpoint: {e}")
-
-    def save(self):
-        try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump({"processed_qids": list(self.processed_qids)}, f)
-        except Exception as e:
-            logger.error(f"Failed to save checkpoint: {e}")
+        journaled = set()
+        for record in self._read_lines(self.filepath):
+            self.entries += 1
+            if record.get("op") == "missing":
+                self.missing_qids.update(record.get("qids", []))
+            else:
+                journaled.update(record.get("qids", []))
+
+        written = {record["id"] for record in self._read_lines(self.output_file) if record.get("id")}
+        self.processed_qids = written | self.missing_qids
+
+        lost = journaled - written
+        if lost:
+            logger.warning(f"{len(lost)} journaled QIDs are absent from the output and will be re-fetched.")
+        if os.path.exists(Config.LEGACY_CHECKPOINT_FILE):
+            logger.info(f"Ignoring legacy {Config.LEGACY_CHECKPOINT_FILE}; progress is reconciled from the output file.")
+        logger.info(f"Loaded checkpoint. {len(self.processed_qids)} QIDs already processed "
+                    f"({len(written)} written, {len(self.missing_qids)} without data).")
+        self.compact(written)
 
-    def add(self, qids: List[str]):
-        self.processed_qids.update(qids)
-        self.save()
+    def _append(self, op: str, qids: List[str]):
+        self._journal.write(json.dumps({"op": op, "qids": qids}) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self.entries += 1
+
+    def add(self, written_qids: List[str], missing_qids: List[str] = ()):
+        if written_qids:
+            self._append("done", list(written_qids))
+        if missing_qids:
+            self._append("missing", list(missing_qids))
+            self.missing_qids.update(missing_qids)
+        self.processed_qids.update(written_qids)
+        self.processed_qids.update(missing_qids)
+        if self.entries >= Config.COMPACT_EVERY:
+            self.compact()
+
+    def compact(self, written=None):
+        """Atomically replace the journal with at most one `done` and one `missing` entry."""
+        written = self.processed_qids - self.missing_qids if written is None else written
+        tmp_path = self.filepath + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if written:
+                f.write(json.dumps({"op": "done", "qids": sorted(written)}) + "\n")
+            if self.missing_qids:
+                f.write(json.dumps({"op": "missing", "qids": sorted(self.missing_qids)}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        if getattr(self, "_journal", None):
+            self._journal.close()
+        os.replace(tmp_path, self.filepath)
+        self.entries = int(bool(written)) + int(bool(self.missing_qids))
+        if getattr(self, "_journal", None):
+            self._journal = open(self.filepath, 'a', encoding='utf-8')
+
+    def close(self):
+        self.compact()
+        self._journal.close()
 
     def is_processed(self, qid):
         return qid in self.processed_qids
@@ -104,50 +195,148 @@ class DataLoader:
             logger.error(f"Error loading data: {e}")
             raise
 
+# --- Rate Limiter ---
+class RateLimiter:
+    """Thread-safe token bucket shared by all fetch workers.
+
+    Tokens refill at `rate` per second up to `burst`. A 429 response can
+    `pause` the whole bucket so every worker honours the server's Retry-After.
+    """
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
 # --- Wikidata Fetcher ---
 class WikidataFetcher:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, limiter: RateLimiter = None, planner: BatchPlanner = None):
+        self.limiter = limiter or RateLimiter(Config.RATE_LIMIT, Config.RATE_BURST)
+        self.planner = planner
+        # requests.Session is not guaranteed thread-safe, so keep one per worker
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
     
     def get_random_user_agent(self):
         return random.choice(Config.USER_AGENTS)
+
+    @staticmethod
+    def parse_retry_after(value, default: float) -> float:
+        """Retry-After may be delta-seconds or an HTTP date."""
+        if not value:
+            return default
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+                seconds = (retry_at - datetime.now(retry_at.tzinfo)).total_seconds()
+            except (TypeError, ValueError):
+                return default
+        return min(max(seconds, 0.0), Config.MAX_RETRY_AFTER)
     
-    def fetch_batch(self, qids: List[str]) -> List[Dict]:
+    def fetch_batch(self, qids: List[str]) -> Optional[List[Dict]]:
+        """Fetch one VALUES batch, splitting it in half whenever the endpoint times out.
+
+        Returns None when the batch could not be fetched, so callers can tell a
+        failure apart from QIDs that genuinely have no data.
+        """
         if not qids:
             return []
-            
+
+        try:
+            bindings, latency = self._fetch_once(qids)
+        except QueryTimeout:
+            if self.planner:
+                self.planner.on_timeout(len(qids))
+            left, right = split_batch(qids)
+            logger.warning(f"Query timed out for {len(qids)} QIDs. Splitting into {len(left)} + {len(right)}...")
+            left_bindings = self.fetch_batch(left)
+            right_bindings = self.fetch_batch(right)
+            if left_bindings is None or right_bindings is None:
+                return None
+            return left_bindings + right_bindings
+
+        if self.planner and bindings:
+            self.planner.record(len(qids), len(bindings), latency)
+        return bindings
+
+    def _fetch_once(self, qids: List[str]) -> Tuple[Optional[List[Dict]], float]:
+        """Bindings (None on failure) plus the HTTP round trip of the successful attempt.
+
+        The latency excludes limiter waits, Retry-After pauses and failed attempts, so
+        queueing behind other workers does not make batches look slow to the planner.
+        """
         sparql_query = self._build_query(qids)
         headers = {'User-Agent': self.get_random_user_agent(), 'Accept': 'application/json'}
         
         for attempt in range(Config.MAX_RETRIES):
             try:
-                time.sleep(random.uniform(Config.MIN_DELAY, Config.MAX_DELAY))
+                self.limiter.acquire()
+                sent = time.monotonic()
                 response = self.session.get(
                     Config.WIKIDATA_ENDPOINT, 
                     params={'query': sparql_query, 'format': 'json'}, 
                     headers=headers,
                     timeout=Config.TIMEOUT
                 )
+                latency = time.monotonic() - sent
                 
                 if response.status_code == 200:
                     try:
                         data = response.json()
-                        return data.get('results', {}).get('bindings', [])
+                        return data.get('results', {}).get('bindings', []), latency
                     except json.JSONDecodeError:
                         logger.error("JSON Decode Error")
                         continue
                 elif response.status_code == 429:
-                    wait_time = (2 ** attempt) * 5
-                    logger.warning(f"Rate limited (429). Waiting {wait_time}s...")
-                    time.sleep(wait_time)
+                    wait_time = self.parse_retry_after(response.headers.get('Retry-After'), (2 ** attempt) * 5)
+                    logger.warning(f"Rate limited (429). Pausing all workers for {wait_time:.1f}s...")
+                    self.limiter.pause(wait_time)
+                elif is_timeout_response(response.status_code, response.text):
+                    # Re-sending the same payload would time out again; let the caller split it
+                    if len(qids) > 1:
+                        raise QueryTimeout()
+                    logger.error(f"Query timed out for single QID {qids[0]}")
                 else:
                     logger.error(f"HTTP {response.status_code}: {response.text[:100]}")
                     
+            except requests.exceptions.Timeout as e:
+                if len(qids) > 1:
+                    raise QueryTimeout() from e
+                logger.error(f"Request timed out for single QID {qids[0]}")
             except requests.exceptions.RequestException as e:
                 logger.error(f"Request error: {e}")
                 
         logger.error(f"Failed to fetch batch after {Config.MAX_RETRIES} attempts.")
-        return []
+        return None, 0.0
 
     def _build_query(self, qids: List[str]) -> str:
         values = " ".join([f"wd:{qid}" for qid in qids])
@@ -170,6 +359,33 @@ class WikidataFetcher:
         """
         return query
 
+# --- Concurrent Fetch Engine ---
+class FetchEngine:
+    """Keeps several batches in flight and yields results in submission order.
+
+    At most `max_workers * 2` batches are queued at once so memory stays
+    bounded, and results come back in input order so the checkpoint only
+    ever advances over a contiguous prefix of the work list.
+    """
+    def __init__(self, fetcher: WikidataFetcher, max_workers: int = Config.MAX_WORKERS):
+        self.fetcher = fetcher
+        self.max_workers = max_workers
+
+    def run(self, batches: Iterable[List[str]]) -> Iterator[Tuple[List[str], Optional[List[Dict]]]]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = deque()
+            batch_iter = iter(batches)
+            for batch in batch_iter:
+                pending.append((batch, pool.submit(self.fetcher.fetch_batch, batch)))
+                if len(pending) >= self.max_workers * 2:
+                    break
+            while pending:
+                batch, future = pending.popleft()
+                yield batch, future.result()
+                next_batch = next(batch_iter, None)
+                if next_batch is not None:
+                    pending.append((next_batch, pool.submit(self.fetcher.fetch_batch, next_batch)))
+
 # --- Data Processor ---
 class DataProcessor:
     @staticmethod
@@ -251,6 +467,8 @@ def main():
     parser = argparse.ArgumentParser(description="Extract Wikidata KG for Patrons and Painters")
     parser.add_argument("--test", action="store_true", help="Run in test mode (limit to 5 records)")
     parser.add_argument("--limit", type=int, default=None, help="Limit number of records to process")
+    parser.add_argument("--workers", type=int, default=Config.MAX_WORKERS, help="Concurrent SPARQL requests")
+    parser.add_argument("--rate", type=float, default=Config.RATE_LIMIT, help="Max requests per second")
     args = parser.parse_args()
 
     limit = 5 if args.test else args.limit
@@ -268,46 +486,58 @@ def main():
     all_qids = list(input_map.keys())
     
     # 2. Checkpoint
-    checkpoint = CheckpointManager(Config.CHECKPOINT_FILE)
+    checkpoint = CheckpointManager(Config.CHECKPOINT_FILE, Config.OUTPUT_FILE)
     qids_to_process = [qid for qid in all_qids if not checkpoint.is_processed(qid)]
     
     logger.info(f"Total QIDs: {len(all_qids)}, Remaining: {len(qids_to_process)}")
     
     # 3. Process in Batches
-    fetcher = WikidataFetcher()
+    planner = BatchPlanner(
+        Config.BATCH_SIZE,
+        min_size=Config.MIN_BATCH_SIZE,
+        max_size=Config.MAX_BATCH_SIZE,
+        target_bindings=Config.TARGET_BINDINGS,
+        target_latency=Config.TARGET_LATENCY,
+    )
+    fetcher = WikidataFetcher(RateLimiter(args.rate, Config.RATE_BURST), planner)
+    engine = FetchEngine(fetcher, max_workers=args.workers)
     processor = DataProcessor()
     
     total_processed = 0
+    # Batches are sliced lazily so each one picks up the planner's latest size
+    batches = planner.batches(qids_to_process)
     
     with open(Config.OUTPUT_FILE, 'a', encoding='utf-8') as f_out:
-        for i in range(0, len(qids_to_process), Config.BATCH_SIZE):
-            batch_qids = qids_to_process[i : i + Config.BATCH_SIZE]
-            logger.info(f"Processing batch {i//Config.BATCH_SIZE + 1} ({len(batch_qids)} QIDs)...")
+        # Results arrive in input order, so writes and checkpoints stay sequential
+        for batch_no, (batch_qids, raw_results) in enumerate(engine.run(batches), 1):
+            logger.info(f"Processing batch {batch_no} ({len(batch_qids)} QIDs, next size {planner.next_size()})...")
             
-            # Fetch
-            raw_results = fetcher.fetch_batch(batch_qids)
-            
-            if not raw_results:
-                logger.warning(f"No results for batch starting with {batch_qids[0]}")
-                # We still mark them as processed to avoid infinite loop on broken IDs? 
-                # Or we just skip. Let's skip updating checkpoint if failed completely.
-                # But fetcher returns empty on failure after retries.
-                # If it's empty, maybe the QIDs are invalid. We should log them.
-                pass
+            if raw_results is None:
+                # Fetch failed after retries: leave these QIDs out of the checkpoint so the next run retries them
+                logger.warning(f"Fetch failed for batch starting with {batch_qids[0]}; will retry on next run.")
+                continue
             
             # Process
             clean_data = processor.process_results(raw_results, input_map)
             
-            # Write
+            # Write and fsync output before journaling, so the journal never runs ahead of the data
             for item in clean_data:
                 f_out.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f_out.flush()
+            os.fsync(f_out.fileno())
                 
             # Update Checkpoint
-            # Note: We mark the whole batch as processed, even if some QIDs returned no data (deleted/invalid)
-            checkpoint.add(batch_qids)
+            written_qids = [item["id"] for item in clean_data]
+            written_set = set(written_qids)
+            missing_qids = [qid for qid in batch_qids if qid not in written_set]
+            if missing_qids:
+                logger.warning(f"No data for {len(missing_qids)} QIDs (deleted/invalid?): {missing_qids[:10]}")
+            checkpoint.add(written_qids, missing_qids)
             total_processed += len(batch_qids)
             
             logger.info(f"Saved {len(clean_data)} items. Total processed: {total_processed}")
 
+    checkpoint.close()
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,9 @@
 import pandas as pd
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Process-Python'))
+from entity_clusters import load_clusters
 
 input_file = r'c:\Users\001\Desktop\14-Relation\07-Merged-Data\All_Triples_Merged.csv'
 output_file = r'c:\Users\001\Desktop\14-Relation\07-Merged-Data\All_Triples_Merged_NoDup.csv'
@@ -27,6 +31,22 @@ def main():
     semantic_duplicates = df[df.duplicated(subset=subset_cols, keep=False)]
     semantic_dup_count = len(semantic_duplicates)
 
+    # Entity-level duplicates: Subject and Object mentions are clustered together by
+    # name, QID and alias links (see entity_clusters), so "Venice" / "Venezia" with the
+    # same QID, or one name under two QIDs, count as the same entity. The cluster table
+    # lists the Subject mentions first, then the Object mentions.
+    mentions = pd.concat([
+        df[['Subject', 'Subject QID']].set_axis(['Entity', 'QID'], axis=1),
+        df[['Object', 'Object QID']].set_axis(['Entity', 'QID'], axis=1),
+    ], ignore_index=True)
+    clusters = load_clusters(input_file, 'Entity', qid_columns=['QID'], df=mentions)
+    df['Subject_Cluster'] = clusters['Cluster_ID'].to_numpy()[:total_rows]
+    df['Object_Cluster'] = clusters['Cluster_ID'].to_numpy()[total_rows:]
+    entity_cols = ['Subject_Cluster', 'Predicate', 'Object_Cluster']
+    entity_duplicates = df[df.duplicated(subset=entity_cols, keep=False)
+                           & ~df.duplicated(subset=subset_cols, keep=False)]
+    df = df.drop(columns=['Subject_Cluster', 'Object_Cluster'])
+
     print(f"\nExact duplicates (all columns): {duplicate_count}")
     if duplicate_count > 0:
         print(duplicates.head(10))
@@ -35,6 +55,10 @@ def main():
     if semantic_dup_count > 0:
         print(semantic_duplicates.sort_values(by=subset_cols).head(20))
 
+    print(f"\nEntity-level duplicates (same Subject / Object entity under another name or QID): {len(entity_duplicates)}")
+    if len(entity_duplicates) > 0:
+        print(entity_duplicates.sort_values(by=entity_cols)[subset_cols + ['Subject QID', 'Object QID']].head(20))
+
     # Remove exact duplicates
     if duplicate_count > 0:
         print("\nRemoving exact duplicates...")
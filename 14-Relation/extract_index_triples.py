@@ -2,6 +2,11 @@ import pandas as pd
 import re
 import os
 import glob
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Process-Python'))
+from letter_executor import run_per_file
+from table_io import write_table, TRIPLE_SCHEMA
 
 # Configuration
 input_dir = r'c:\Users\001\Desktop\14-Relation\05-Cleaned-Index'
@@ -202,34 +207,35 @@ def extract_triples(df):
 
     return pd.DataFrame(triples)
 
-def main():
+def process_file(file_path):
+    """Writes the triples of one letter file to output_dir; returns the number of triples."""
+    filename = os.path.basename(file_path)
+    # Construct output filename: A_refined.csv -> A_refined_Triples.csv
+    base_name = os.path.splitext(filename)[0]
+    output_filename = f"{base_name}_Triples.csv"
+    output_path = os.path.join(output_dir, output_filename)
+    
+    print(f"Processing {filename}...")
+    
+    df = pd.read_csv(file_path)
+    triples_df = extract_triples(df)
+    
+    # Add Index column
+    triples_df.insert(0, '序号', range(1, len(triples_df) + 1))
+    
+    print(f"Saving {len(triples_df)} triples to {output_path}...")
+    write_table(triples_df, output_path, TRIPLE_SCHEMA)
+    return len(triples_df)
+
+def main(workers=None):
     print(f"Scanning {input_dir}...")
     
     # Get all csv files
     files = glob.glob(os.path.join(input_dir, '*.csv'))
     print(f"Found {len(files)} files to process.")
 
-    for file_path in files:
-        filename = os.path.basename(file_path)
-        # Construct output filename: A_refined.csv -> A_refined_Triples.csv
-        base_name = os.path.splitext(filename)[0]
-        output_filename = f"{base_name}_Triples.csv"
-        output_path = os.path.join(output_dir, output_filename)
-        
-        print(f"Processing {filename}...")
-        
-        try:
-            df = pd.read_csv(file_path)
-            triples_df = extract_triples(df)
-            
-            # Add Index column
-            triples_df.insert(0, '序号', range(1, len(triples_df) + 1))
-            
-            print(f"Saving {len(triples_df)} triples to {output_path}...")
-            triples_df.to_csv(output_path, index=False, encoding='utf-8-sig')
-            
-        except Exception as e:
-            print(f"Error processing {filename}: {e}")
+    # Letter files are independent: fan them out to a process pool
+    run_per_file(process_file, files, workers=workers)
             
     print("All files processed.")
 
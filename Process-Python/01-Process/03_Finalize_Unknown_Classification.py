@@ -1,6 +1,10 @@
 import os
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cidoc_classifier import KeywordMatcher, apply_type_overrides
+
 enrich_dir = r"c:\Users\001\Desktop\list\04-Enrich"
 
 # Comprehensive mapping for remaining Unknowns
@@ -139,6 +143,16 @@ type_mapping = {
     'Titles granted to artists': 'E28 Conceptual Object',
 }
 
+# Encoding-mangled entries ("Monsù Desiderio", "Würzburg Residenz") are recognised by their intact parts
+MANGLED_TERMS = KeywordMatcher([
+    ('E53 Place', [("W", "rzburg")]),
+    ('E21 Person', [("Mons", "Desiderio")]),
+], ignore_case=False)
+
+def classify_term(term):
+    """New type for a Main Entry, or None to leave it unchanged."""
+    return MANGLED_TERMS.first(str(term)) or type_mapping.get(term)
+
 def apply_updates():
     files = [f for f in os.listdir(enrich_dir) if f.endswith(".csv")]
     total_updated = 0
@@ -150,40 +164,8 @@ def apply_updates():
             if 'Main Entry' not in df.columns or 'Type' not in df.columns:
                 continue
                 
-            updated_in_file = 0
+            updated_in_file = apply_type_overrides(df, classify_term)
             
-            for index, row in df.iterrows():
-                term = row['Main Entry']
-                current_type = str(row['Type']).strip()
-                
-                # Handle encoding issues for specific terms
-                if "Mons" in term and "Desiderio" in term:
-                    term = "Monsù Desiderio" # Normalize key
-                if "W" in term and "rzburg" in term:
-                    term = "Würzburg Residenz" # Normalize key
-                
-                # Check if we have a mapping
-                if term in type_mapping:
-                    new_type = type_mapping[term]
-                    if current_type != new_type:
-                        df.at[index, 'Type'] = new_type
-                        updated_in_file += 1
-                
-                # Also handle the encoding-mangled keys directly if they exist in the dict
-                # (The dict above uses clean keys, but the CSV might have mangled ones)
-                # We'll rely on the exact string match from the CSV unless we fuzzy match
-                
-                # Fuzzy match for the mangled ones
-                if "Mons" in str(row['Main Entry']) and "Desiderio" in str(row['Main Entry']):
-                     if current_type != 'E21 Person':
-                        df.at[index, 'Type'] = 'E21 Person'
-                        updated_in_file += 1
-                
-                if "W" in str(row['Main Entry']) and "rzburg" in str(row['Main Entry']):
-                     if current_type != 'E53 Place':
-                        df.at[index, 'Type'] = 'E53 Place'
-                        updated_in_file += 1
-
             if updated_in_file > 0:
                 df.to_csv(path, index=False, encoding='utf-8-sig')
                 print(f"Updated {updated_in_file} entries in {filename}")
@@ -1,6 +1,10 @@
 import os
+import sys
 import pandas as pd
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cidoc_classifier import apply_type_overrides
+
 enrich_dir = r"c:\Users\001\Desktop\list\04-Enrich"
 
 # Updates based on the verification report
@@ -17,6 +21,11 @@ updates = {
     "Wars of late 17th century, influence on art patronage": "E28 Conceptual Object"
 }
 
+def fixed_type(term):
+    """Type from the verification report, also for terms wrapped in quotes; None if not listed."""
+    clean_term = str(term).strip("'")
+    return updates.get(clean_term, updates.get(term))
+
 def apply_fixes():
     files = [f for f in os.listdir(enrich_dir) if f.endswith(".csv")]
     total_updated = 0
@@ -28,25 +37,8 @@ def apply_fixes():
             if 'Main Entry' not in df.columns or 'Type' not in df.columns:
                 continue
                 
-            updated_in_file = 0
+            updated_in_file = apply_type_overrides(df, fixed_type)
             
-            for index, row in df.iterrows():
-                term = row['Main Entry']
-                current_type = str(row['Type']).strip()
-                
-                # Check exact match
-                if term in updates:
-                    if current_type != updates[term]:
-                        df.at[index, 'Type'] = updates[term]
-                        updated_in_file += 1
-                
-                # Check if term is wrapped in quotes (just in case)
-                clean_term = term.strip("'")
-                if clean_term in updates:
-                     if current_type != updates[clean_term]:
-                        df.at[index, 'Type'] = updates[clean_term]
-                        updated_in_file += 1
-
             if updated_in_file > 0:
                 df.to_csv(path, index=False, encoding='utf-8-sig')
                 print(f"Updated {updated_in_file} entries in {filename}")
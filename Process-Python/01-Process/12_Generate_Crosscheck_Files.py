@@ -1,70 +1,12 @@
 import pandas as pd
 import os
 import glob
-import re
+import sys
 
-# --- Configuration & Dictionaries ---
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from name_normalization import normalize_person, normalize_place_group, normalize_work, normalize_for_type
 
-TITLES = [
-    'Sir', 'Lord', 'Lady', 'Duke', 'Duchess', 'Count', 'Countess', 'Earl', 'Baron', 
-    'Prince', 'Princess', 'King', 'Queen', 'Cardinal', 'Pope', 'Bishop', 'Abbot', 
-    'Fra', 'Don', 'Donna', 'Marchese', 'Marchesa', 'Cavaliere', 'Abate', 'Monsignor'
-]
-
-ABBREVIATIONS = {
-    r'\bS\.\s': 'San ',       
-    r'\bSt\.\s': 'Saint ',    
-    r'\bSta\.\s': 'Santa ',   
-    r'\bSS\.\s': 'Santi ',    
-    r'\bPza\.\s': 'Piazza ',  
-    r'\bPal\.\s': 'Palazzo ', 
-    r'\bCh\.\s': 'Church ',   
-    r'\bAcad\.\s': 'Academy ' 
-}
-
-# --- Normalization Functions ---
-
-def clean_text(text):
-    if not isinstance(text, str):
-        return ""
-    text = text.strip().strip('"').strip("'")
-    text = " ".join(text.split())
-    return text
-
-def strip_titles(name):
-    for title in TITLES:
-        pattern = r'\b' + re.escape(title) + r'\b\.?'
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-    return " ".join(name.split())
-
-def expand_abbreviations(name):
-    for pattern, replacement in ABBREVIATIONS.items():
-        name = re.sub(pattern, replacement, name, flags=re.IGNORECASE)
-    return name
-
-def flip_name(name):
-    if "," in name:
-        parts = name.split(",", 1)
-        if len(parts) == 2:
-            return f"{parts[1].strip()} {parts[0].strip()}"
-    return name
-
-def normalize_person(name):
-    if "," in name:
-        name = flip_name(name)
-    name = strip_titles(name)
-    return name.lower().strip()
-
-def normalize_place_group(name):
-    name = expand_abbreviations(name)
-    if name.lower().startswith("the "):
-        name = name[4:]
-    return name.lower().strip()
-
-def normalize_work(name):
-    if name.lower().startswith("the "):
-        name = name[4:]
-    return name.lower().strip()
+# Normalization pipelines (titles, abbreviations, ...) live in name_normalization.py
 
 # --- Matching Logic ---
 
@@ -156,14 +98,8 @@ def generate_crosscheck_files(base_dir, lookup):
                 
                 raw_name = str(main_entry)
                 
-                # Determine normalization
-                norm_name = ""
-                if cidoc_type == 'E21 Person':
-                    norm_name = normalize_person(raw_name)
-                elif cidoc_type in ['E53 Place', 'E74 Group']:
-                    norm_name = normalize_place_group(raw_name)
-                else:
-                    norm_name = normalize_work(raw_name)
+                # Normalization depends on the CIDOC Type (memoized per name and type)
+                norm_name = normalize_for_type(raw_name, cidoc_type)
                 
                 match_info = None
                 match_type = None
@@ -1,21 +1,26 @@
 import pandas as pd
 import os
 import glob
+import sys
 
-def analyze_entities():
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from letter_executor import run_per_file
+
+def read_index_file(path):
+    try:
+        return pd.read_csv(path)
+    except:
+        return None
+
+def analyze_entities(workers=None):
     input_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset\04-Index-Enrich'
     output_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset\99-Python\02-Analysis'
     output_report = os.path.join(output_dir, 'Entity_Analysis_Report.md')
     
     all_files = glob.glob(os.path.join(input_dir, "*_refined.csv"))
     
-    df_list = []
-    for filename in all_files:
-        try:
-            df = pd.read_csv(filename)
-            df_list.append(df)
-        except:
-            pass
+    # Letter files are read in parallel and concatenated in alphabetical order
+    df_list = [df for _, df in run_per_file(read_index_file, all_files, workers=workers) if df is not None]
 
     if not df_list:
         print("No data found.")
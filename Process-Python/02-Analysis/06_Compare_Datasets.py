@@ -2,6 +2,7 @@ import pandas as pd
 import os
 import glob
 import re
+import numpy as np
 
 def normalize_name(name):
     if not isinstance(name, str):
@@ -72,6 +73,53 @@ def load_handmade_data(base_dir):
             
     return lookup
 
+def lookup_table(lookup):
+    """First candidate per normalized key, as a frame indexed by key."""
+    first = {key: matches[0] for key, matches in lookup.items()}
+    return pd.DataFrame.from_dict(first, orient='index',
+                                  columns=['qid', 'source_file', 'compatible_types', 'original_name'])
+
+def match_index_frame(df, table, files):
+    """Match Index rows against the lookup table; returns one detail row per non-empty entry.
+    `files` holds the source file name of each row (a Series aligned with df)."""
+    entry = df['Index_Main Entry'] if 'Index_Main Entry' in df.columns else pd.Series('', index=df.index)
+    cidoc = df['CIDOC_Type'] if 'CIDOC_Type' in df.columns else pd.Series('', index=df.index)
+    
+    keep = entry.notna() & entry.astype(str).str.strip().ne('')
+    entry, cidoc = entry[keep], cidoc[keep]
+    
+    # Same steps as normalize_name(): strip quotes, collapse whitespace
+    norm = entry.astype(str).str.strip().str.strip('"').str.strip("'").str.split().str.join(" ")
+    
+    # 1. Try Exact Match, 2. then the flipped form of "Last, First" entries
+    exact = norm.str.lower().isin(table.index)
+    parts = norm.str.split(",", n=1)
+    flipped_key = (parts.str[1].str.strip() + " " + parts.str[0].str.strip()).str.lower()
+    flipped = ~exact & norm.str.contains(",", regex=False) & flipped_key.isin(table.index)
+    key = norm.str.lower().where(exact, flipped_key)
+    matched = exact | flipped
+    
+    details = pd.DataFrame({
+        'File': files[keep],
+        'Index_Entry': entry,
+        'CIDOC_Type': cidoc,
+        'Match_Type': np.where(exact, "Exact", np.where(flipped, "Flipped", "None")),
+    })
+    for column, field in [('Matched_QID', 'qid'), ('Matched_Name', 'original_name'), ('Source_Table', 'source_file')]:
+        details[column] = key.map(table[field]).astype(object).where(matched, None)
+    
+    # Check Category Compatibility against the source table's types
+    # Loose check for Groups in Place file
+    compatible = pd.Series(False, index=details.index)
+    sources = table.drop_duplicates('source_file')
+    for source, types in zip(sources['source_file'], sources['compatible_types']):
+        from_source = details['Source_Table'] == source
+        compatible |= from_source & cidoc.isin(types)
+        if source == 'gio-English_table.csv':
+            compatible |= from_source & (cidoc == 'E74 Group')
+    details['Category_Compatible'] = compatible.astype(object).where(matched, None)
+    return details
+
 def process_index_files(base_dir, lookup):
     index_dir = os.path.join(base_dir, "04-Index-Enrich")
     csv_files = glob.glob(os.path.join(index_dir, "*_refined.csv"))
@@ -87,87 +135,29 @@ def process_index_files(base_dir, lookup):
     
     print(f"Processing {len(csv_files)} files from {index_dir}...")
     
+    frames, names = [], []
     for filepath in csv_files:
         filename = os.path.basename(filepath)
         try:
-            df = pd.read_csv(filepath)
-            
-            for _, row in df.iterrows():
-                results['total_entries'] += 1
-                
-                main_entry = row.get('Index_Main Entry', '')
-                cidoc_type = row.get('CIDOC_Type', '')
-                
-                if pd.isna(main_entry) or not str(main_entry).strip():
-                    continue
-                    
-                norm_name = normalize_name(str(main_entry))
-                key = norm_name.lower()
-                
-                match_found = False
-                match_type = "None"
-                match_info = None
-                
-                # 1. Try Exact Match
-                if key in lookup:
-                    match_found = True
-                    match_type = "Exact"
-                    match_info = lookup[key]
-                
-                # 2. Try Flipped Match (if contains comma)
-                if not match_found and "," in norm_name:
-                    flipped = flip_name(norm_name)
-                    flipped_key = flipped.lower()
-                    if flipped_key in lookup:
-                        match_found = True
-                        match_type = "Flipped"
-                        match_info = lookup[flipped_key]
-                
-                if match_found:
-                    # Check Category Compatibility
-                    # match_info is a list of potential matches (usually 1)
-                    best_match = match_info[0] # Take first for now
-                    
-                    is_compatible = False
-                    if cidoc_type in best_match['compatible_types']:
-                        is_compatible = True
-                    # Loose check for Groups in Place file
-                    elif cidoc_type == 'E74 Group' and 'gio-English_table.csv' == best_match['source_file']:
-                        is_compatible = True
-                        
-                    if is_compatible:
-                        if match_type == "Exact":
-                            results['exact_matches'] += 1
-                        else:
-                            results['flipped_matches'] += 1
-                    else:
-                        results['category_mismatches'] += 1
-                        
-                    results['details'].append({
-                        'File': filename,
-                        'Index_Entry': main_entry,
-                        'CIDOC_Type': cidoc_type,
-                        'Match_Type': match_type,
-                        'Matched_QID': best_match['qid'],
-                        'Matched_Name': best_match['original_name'],
-                        'Source_Table': best_match['source_file'],
-                        'Category_Compatible': is_compatible
-                    })
-                else:
-                    results['no_matches'] += 1
-                    results['details'].append({
-                        'File': filename,
-                        'Index_Entry': main_entry,
-                        'CIDOC_Type': cidoc_type,
-                        'Match_Type': "None",
-                        'Matched_QID': None,
-                        'Matched_Name': None,
-                        'Source_Table': None,
-                        'Category_Compatible': None
-                    })
-                    
+            frames.append(pd.read_csv(filepath))
+            names.append(filename)
         except Exception as e:
             print(f"Error processing {filename}: {e}")
+    if not frames:
+        return results
+    
+    # All files are matched in one pass; the File column keeps them apart
+    df = pd.concat(frames, ignore_index=True)
+    files = pd.Series(np.repeat(names, [len(f) for f in frames]), index=df.index)
+    results['total_entries'] = len(df)
+    
+    details = match_index_frame(df, lookup_table(lookup), files)
+    compatible = details['Category_Compatible'].eq(True)
+    results['exact_matches'] = int((compatible & (details['Match_Type'] == "Exact")).sum())
+    results['flipped_matches'] = int((compatible & (details['Match_Type'] == "Flipped")).sum())
+    results['category_mismatches'] = int(details['Category_Compatible'].eq(False).sum())
+    results['no_matches'] = int((details['Match_Type'] == "None").sum())
+    results['details'] = details.to_dict('records')
             
     return results
 
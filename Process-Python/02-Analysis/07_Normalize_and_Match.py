@@ -1,94 +1,12 @@
 import pandas as pd
 import os
 import glob
-import re
+import sys
 
-# --- Configuration & Dictionaries ---
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from name_normalization import normalize_person, normalize_place_group, normalize_work, normalize_for_type
 
-# Titles to strip for Person matching
-TITLES = [
-    'Sir', 'Lord', 'Lady', 'Duke', 'Duchess', 'Count', 'Countess', 'Earl', 'Baron', 
-    'Prince', 'Princess', 'King', 'Queen', 'Cardinal', 'Pope', 'Bishop', 'Abbot', 
-    'Fra', 'Don', 'Donna', 'Marchese', 'Marchesa', 'Cavaliere', 'Abate', 'Monsignor'
-]
-
-# Abbreviations to expand for Place/Group matching
-ABBREVIATIONS = {
-    r'\bS\.\s': 'San ',       # S. -> San (Italian context default)
-    r'\bSt\.\s': 'Saint ',    # St. -> Saint
-    r'\bSta\.\s': 'Santa ',   # Sta. -> Santa
-    r'\bSS\.\s': 'Santi ',    # SS. -> Santi
-    r'\bPza\.\s': 'Piazza ',  # Pza. -> Piazza
-    r'\bPal\.\s': 'Palazzo ', # Pal. -> Palazzo
-    r'\bCh\.\s': 'Church ',   # Ch. -> Church
-    r'\bAcad\.\s': 'Academy ' # Acad. -> Academy
-}
-
-# Stopwords that might cause noise in "Contains" matching
-STOPWORDS = {'the', 'of', 'de', 'di', 'da', 'del', 'della', 'and', '&', 'a', 'in'}
-
-# --- Normalization Functions ---
-
-def clean_text(text):
-    if not isinstance(text, str):
-        return ""
-    # Remove quotes and extra spaces
-    text = text.strip().strip('"').strip("'")
-    text = " ".join(text.split())
-    return text
-
-def strip_titles(name):
-    """Removes known titles from the name."""
-    # Create a regex pattern for titles (case insensitive)
-    # We look for Title at start of string or after a space
-    for title in TITLES:
-        # Pattern: Word boundary + Title + (Space or End of string)
-        pattern = r'\b' + re.escape(title) + r'\b\.?'
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-    return " ".join(name.split())
-
-def expand_abbreviations(name):
-    """Expands common abbreviations."""
-    for pattern, replacement in ABBREVIATIONS.items():
-        name = re.sub(pattern, replacement, name, flags=re.IGNORECASE)
-    return name
-
-def flip_name(name):
-    """Flips 'Last, First' to 'First Last'."""
-    if "," in name:
-        parts = name.split(",", 1)
-        if len(parts) == 2:
-            return f"{parts[1].strip()} {parts[0].strip()}"
-    return name
-
-def normalize_person(name):
-    """Pipeline for Person names."""
-    # 1. Flip if comma exists (Index format: Last, First)
-    if "," in name:
-        name = flip_name(name)
-    
-    # 2. Strip Titles (e.g., "Cardinal Annibale Albani" -> "Annibale Albani")
-    name = strip_titles(name)
-    
-    return name.lower().strip()
-
-def normalize_place_group(name):
-    """Pipeline for Places and Groups."""
-    # 1. Expand Abbreviations (e.g., "S. Luca" -> "San Luca")
-    name = expand_abbreviations(name)
-    
-    # 2. Remove "The" at start (optional, but often helpful)
-    if name.lower().startswith("the "):
-        name = name[4:]
-        
-    return name.lower().strip()
-
-def normalize_work(name):
-    """Pipeline for Works/Concepts."""
-    # Similar to Place/Group but maybe less aggressive on abbreviations
-    if name.lower().startswith("the "):
-        name = name[4:]
-    return name.lower().strip()
+# Normalization pipelines (titles, abbreviations, ...) live in name_normalization.py
 
 # --- Matching Logic ---
 
@@ -182,14 +100,8 @@ def process_index_files(base_dir, lookup):
                 
                 raw_name = str(main_entry)
                 
-                # Determine which normalization to apply based on CIDOC Type
-                norm_name = ""
-                if cidoc_type == 'E21 Person':
-                    norm_name = normalize_person(raw_name)
-                elif cidoc_type in ['E53 Place', 'E74 Group']:
-                    norm_name = normalize_place_group(raw_name)
-                else:
-                    norm_name = normalize_work(raw_name)
+                # Normalization depends on the CIDOC Type (memoized per name and type)
+                norm_name = normalize_for_type(raw_name, cidoc_type)
                 
                 match_found = False
                 match_info = None
@@ -1,140 +1,11 @@
 import pandas as pd
 import os
-import re
+import sys
 
-# --- Configuration & Dictionaries ---
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from name_normalization import normalize_person_full, normalize_place_full, normalize_work_full, has_title
 
-# Titles to strip (Person)
-TITLES = [
-    'Sir', 'Lord', 'Lady', 'Duke', 'Duchess', 'Count', 'Countess', 'Earl', 'Baron', 
-    'Prince', 'Princess', 'King', 'Queen', 'Cardinal', 'Pope', 'Bishop', 'Abbot', 
-    'Fra', 'Don', 'Donna', 'Marchese', 'Marchesa', 'Cavaliere', 'Abate', 'Monsignor',
-    'President', 'Président', 'Mme', 'Mlle', 'Mr', 'Mrs', 'Dr', 'Prof', 'Archbishop-Elector'
-]
-
-# Nickname Mapping (Based on research)
-NICKNAMES = {
-    'baciccio': 'Giovanni Battista Gaulli',
-    'baciccia': 'Giovanni Battista Gaulli',
-    'monsù desiderio': 'François de Nomé',
-    'il guercino': 'Giovanni Francesco Barbieri',
-    'guercino': 'Giovanni Francesco Barbieri',
-    'canaletto': 'Giovanni Antonio Canal',
-    'tintoretto': 'Jacopo Robusti',
-    'domenichino': 'Domenico Zampieri',
-    'parmigianino': 'Girolamo Francesco Maria Mazzola',
-    'pontormo': 'Jacopo Carucci',
-    'bronzino': 'Agnolo di Cosimo',
-    'veronese': 'Paolo Caliari',
-    'bernini': 'Gian Lorenzo Bernini', # Often just listed as Bernini
-    'borromini': 'Francesco Borromini'
-}
-
-# Place/Building Rules
-# "X palace" -> "Palazzo X"
-# "X villa" -> "Villa X"
-
-# --- Normalization Functions ---
-
-def clean_text(text):
-    if not isinstance(text, str):
-        return ""
-    text = text.strip().strip('"').strip("'")
-    text = " ".join(text.split())
-    return text
-
-def remove_parentheses(name):
-    # Remove content in parentheses e.g. (Pope Clement XI)
-    return re.sub(r'\(.*?\)', '', name).strip()
-
-def strip_titles(name):
-    for title in TITLES:
-        pattern = r'\b' + re.escape(title) + r'\b\.?'
-        name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-    return " ".join(name.split())
-
-def flip_name(name):
-    if "," in name:
-        parts = name.split(",", 1)
-        if len(parts) == 2:
-            # Handle "Acqua, Cristoforo dall'" -> "Cristoforo dall' Acqua"
-            # Handle "Bacon, Sir Francis" -> "Sir Francis Bacon"
-            return f"{parts[1].strip()} {parts[0].strip()}"
-    return name
-
-def normalize_person_full(name):
-    # 1. Check Nickname Dictionary first (Exact match on raw or simple clean)
-    simple_name = name.lower().strip().strip("'").strip('"')
-    if simple_name in NICKNAMES:
-        return NICKNAMES[simple_name]
-    
-    # 2. Remove Parentheses (Roles, Aliases)
-    # e.g. "Albani, Gianfrancesco (Pope Clement XI)" -> "Albani, Gianfrancesco"
-    name = remove_parentheses(name)
-    
-    # 3. Flip Name (Last, First -> First Last)
-    name = flip_name(name)
-    
-    # 4. Strip Titles
-    # e.g. "Cardinal Annibale Albani" -> "Annibale Albani"
-    name = strip_titles(name)
-    
-    # 5. Clean extra spaces
-    name = " ".join(name.split())
-    
-    return name
-
-def normalize_place_full(name):
-    # 1. Remove Parentheses
-    # e.g. "Alticchiero (Querini villa)" -> "Alticchiero"
-    # But wait, research said "Alticchiero (Querini villa)" -> "Villa Alticchiero"
-    # This is tricky. Let's try to detect "villa" or "palace" inside parens or outside.
-    
-    lower_name = name.lower()
-    
-    # Special Case: "Alticchiero (Querini villa)"
-    if 'alticchiero' in lower_name and 'villa' in lower_name:
-        return "Villa Alticchiero"
-    
-    name = remove_parentheses(name)
-    
-    # 2. Standardize Building Types (English -> Italian)
-    # "X Palace" -> "Palazzo X"
-    if lower_name.endswith(' palace'):
-        # Extract X
-        core = name[:-7].strip() # remove " palace"
-        return f"Palazzo {core}"
-    
-    # "X Villa" -> "Villa X" (if not already Villa X)
-    if lower_name.endswith(' villa'):
-        core = name[:-6].strip()
-        return f"Villa {core}"
-        
-    # 3. Expand Abbreviations
-    name = name.replace("S.", "San").replace("St.", "Saint")
-    
-    return name.strip()
-
-def normalize_work_full(name):
-    # 1. Remove quotes
-    name = clean_text(name)
-    
-    # 2. Expand Abbreviations common in titles
-    name = name.replace("St.", "Saint").replace("S.", "San")
-    
-    # 3. Handle Inversions "Artists, status of" -> "Status of artists"
-    if "," in name:
-        parts = name.split(",", 1)
-        p1 = parts[0].strip()
-        p2 = parts[1].strip()
-        
-        # Heuristic: if p2 is short and looks like a prefix?
-        # "Artists, status of" -> "Status of Artists"
-        # "Magi, Adoration of the" -> "Adoration of the Magi"
-        if p2.lower().startswith(('status of', 'development of', 'adoration of', 'portrait of', 'view of')):
-             return f"{p2} {p1}"
-             
-    return name
+# Titles, nicknames and the Person/Place/Work pipelines live in name_normalization.py
 
 def normalize_audit_list_comprehensive():
     base_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset'
@@ -197,16 +68,12 @@ def normalize_audit_list_comprehensive():
             # We do a quick check for obvious misclassifications
             lower_raw = raw_name.lower()
             
-            # Use regex for titles to avoid substring matches (e.g. "King" in "Seeking")
-            title_pattern = r'\b(' + '|'.join(re.escape(t.lower()) for t in TITLES) + r')\b'
-            has_title = bool(re.search(title_pattern, lower_raw))
-            
             # If it contains "Palace" or "Villa", treat as Place
             if 'palace' in lower_raw or 'villa' in lower_raw:
                 formal_name = normalize_place_full(raw_name)
                 category = 'Place (Reclassified)'
-            # If it contains noble titles, treat as Person
-            elif has_title:
+            # If it contains noble titles as whole words (not "King" in "Seeking"), treat as Person
+            elif has_title(raw_name):
                 formal_name = normalize_person_full(raw_name)
                 category = 'Person (Reclassified)'
             else:
@@ -0,0 +1,416 @@
+import argparse
+import glob
+import importlib.util
+import os
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+PROCESS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROCESS_DIR)
+from location_kb import get_kb, normalize_term
+from name_normalization import flip_name
+from similarity import pair_scores
+
+# Before/after timing for the stages rebuilt on column-wise pandas operations.
+# Each stage runs its old row-wise loop (kept below as legacy_*) and the current
+# vectorized function on frames built from the real 03-Index CSVs, checks that
+# both produce the same CSV output, and reports the best of several rounds.
+
+BASE_DIR = os.path.dirname(PROCESS_DIR)
+INDEX_DIR = os.path.join(BASE_DIR, "03-Index", "03-4-Index-Enrich")
+HANDMADE_DIR = os.path.join(BASE_DIR, "04-HandmadeDataset")
+ROUNDS = 3
+
+
+def load_script(relpath):
+    """Imports a numbered pipeline script (e.g. 08_Add_Location_Columns.py) as a module."""
+    path = os.path.join(PROCESS_DIR, relpath)
+    name = "stage_" + re.sub(r'\W', '_', os.path.splitext(os.path.basename(path))[0])
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_index(repeat=1):
+    """All *_refined.csv files of 03-Index, optionally repeated to a larger frame."""
+    frames = []
+    for path in sorted(glob.glob(os.path.join(INDEX_DIR, "*_refined.csv"))):
+        df = pd.read_csv(path, encoding='utf-8-sig')
+        df['File'] = os.path.basename(path)
+        frames.append(df)
+    df = pd.concat(frames, ignore_index=True)
+    return pd.concat([df] * repeat, ignore_index=True)
+
+
+def best_time(func, make_input):
+    """Best wall time over ROUNDS runs (inputs are rebuilt outside the timed call) and the last result."""
+    best, result = None, None
+    for _ in range(ROUNDS):
+        args = make_input()
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def same_output(a, b):
+    if isinstance(a, pd.DataFrame):
+        return a.to_csv(index=False) == b.to_csv(index=False)
+    return pd.DataFrame(a).to_csv(index=False) == pd.DataFrame(b).to_csv(index=False)
+
+
+# --- 08_Add_Location_Columns.enrich_files ---
+
+def legacy_08(df, location_map, key_map):
+    if 'Proposed Location' not in df.columns:
+        df['Proposed Location'] = ""
+    if 'Notes' not in df.columns:
+        df['Notes'] = ""
+    for index, row in df.iterrows():
+        term = str(row['Index_Main Entry']).strip()
+        clean_term = term.strip("'")
+        loc = ""
+        note = ""
+        if term in location_map:
+            loc = location_map[term]
+            note = "Auto-enriched from Knowledge Base"
+        elif clean_term in location_map:
+            loc = location_map[clean_term]
+            note = "Auto-enriched from Knowledge Base"
+        elif normalize_term(term) in key_map:
+            loc = location_map[key_map[normalize_term(term)]]
+            note = "Auto-enriched from Knowledge Base"
+        if loc:
+            if pd.isna(row['Proposed Location']) or row['Proposed Location'] == "":
+                df.at[index, 'Proposed Location'] = loc
+                df.at[index, 'Notes'] = note
+    return df
+
+
+def bench_08(index):
+    stage = load_script(os.path.join("01-Process", "08_Add_Location_Columns.py"))
+    kb = get_kb()
+    location_map = {term: location for term, (location, _) in kb.as_dict().items()}
+    key_map = kb.key_to_term.to_dict()
+
+    def make_input():
+        # The stage runs before 'Proposed Location' exists; blank every other known location
+        df = index.drop(columns=['Proposed Location'])
+        df['Proposed Location'] = index['Proposed Location'].where(index.index % 2 == 0, "")
+        return (df,)
+
+    before = best_time(lambda df: legacy_08(df, location_map, key_map), make_input)
+    after = best_time(lambda df: (stage.apply_location_map(df), df)[1], make_input)
+    return before, after
+
+
+# --- 37_Verify_And_Enrich_QIDs.process_verification ---
+
+DESCRIPTIONS = ["Italian painter", "city in Italy", "painting by Titian", "art museum in Rome",
+                "Roman Catholic cardinal", "human settlement", "book", "style of art", ""]
+
+
+def verification_input(index):
+    """Index rows as recheck rows with a QID each, plus fake wbgetentities data for those QIDs."""
+    rng = np.random.default_rng(0)
+    names = index['Index_Main Entry'].map(str)
+    df = pd.DataFrame({
+        'Refined_Formal_Name': names.map(flip_name),
+        'Refined_Category': index['CIDOC_Type'].map({'E21 Person': 'Person', 'E53 Place': 'Place',
+                                                     'E74 Group': 'Organization/Group'}),
+        'QID': ['Q%d' % (k + 1) for k in range(len(index))],
+    })
+    df.loc[rng.random(len(df)) < 0.05, 'QID'] = np.nan
+    entity_data = {}
+    for qid, name in zip(df['QID'], df['Refined_Formal_Name']):
+        if pd.isna(qid) or rng.random() < 0.05:
+            continue  # QID not found in Wikidata
+        roll = rng.random()
+        label = name if roll < 0.6 else (name.split(' ')[-1] if roll < 0.8 else "Unrelated Label")
+        entity_data[qid] = {
+            'labels': {'en': {'value': label}},
+            'descriptions': {'en': {'value': DESCRIPTIONS[rng.integers(len(DESCRIPTIONS))]}},
+            'aliases': {'en': [{'value': name.upper()}] if roll > 0.9 else []},
+        }
+    return df, entity_data
+
+
+def legacy_37(df, entity_data, check_category_match):
+    for idx, row in df.iterrows():
+        qid = row['QID']
+        if pd.isna(qid) or not str(qid).startswith('Q'):
+            df.at[idx, 'Verify_Result'] = "Skipped"
+            continue
+        entity = entity_data.get(qid)
+        if not entity:
+            df.at[idx, 'Verify_Result'] = "Invalid"
+            df.at[idx, 'Verify_Reason'] = "QID not found in Wikidata"
+            continue
+        labels = entity.get('labels', {})
+        wiki_label = labels.get('en', {}).get('value', '')
+        descriptions = entity.get('descriptions', {})
+        wiki_desc = descriptions.get('en', {}).get('value', '')
+        aliases = [a['value'] for a in entity.get('aliases', {}).get('en', [])]
+        df.at[idx, 'Wiki_Label_Found'] = wiki_label
+        df.at[idx, 'Wiki_Description_Found'] = wiki_desc
+        local_name = str(row['Refined_Formal_Name']).strip().lower()
+        wiki_label_lower = wiki_label.lower()
+        aliases_lower = [a.lower() for a in aliases]
+        name_status = "Mismatch"
+        if local_name == wiki_label_lower or local_name in aliases_lower:
+            name_status = "Match"
+        elif local_name in wiki_label_lower or wiki_label_lower in local_name:
+            name_status = "Partial"
+        cat_status = check_category_match(row['Refined_Category'], wiki_desc, [])
+        if name_status == "Match" and cat_status == "Match":
+            df.at[idx, 'Verify_Result'] = "Valid"
+            df.at[idx, 'Verify_Reason'] = f"Exact name match + Category match ({wiki_desc})"
+        elif name_status == "Match" and cat_status == "Conflict":
+            df.at[idx, 'Verify_Result'] = "Invalid"
+            df.at[idx, 'Verify_Reason'] = f"Name match but Category conflict (Expected {row['Refined_Category']}, got {wiki_desc})"
+        elif name_status == "Match":
+            df.at[idx, 'Verify_Result'] = "Review"
+            df.at[idx, 'Verify_Reason'] = f"Name match but Category unknown/neutral ({wiki_desc})"
+        elif name_status == "Partial" and cat_status == "Match":
+            df.at[idx, 'Verify_Result'] = "Review"
+            df.at[idx, 'Verify_Reason'] = "Partial name match + Category match"
+        elif name_status == "Mismatch":
+            df.at[idx, 'Verify_Result'] = "Invalid"
+            df.at[idx, 'Verify_Reason'] = f"Name mismatch (Wiki: {wiki_label})"
+        else:
+            df.at[idx, 'Verify_Result'] = "Review"
+            df.at[idx, 'Verify_Reason'] = f"Complex case: Name {name_status}, Cat {cat_status}"
+    return df
+
+
+def bench_37(index):
+    stage = load_script("37_Verify_And_Enrich_QIDs.py")
+    base, entity_data = verification_input(index)
+
+    def make_input():
+        df = base.copy()
+        stage.init_verification_columns(df)
+        return (df,)
+
+    before = best_time(lambda df: legacy_37(df, entity_data, stage.check_category_match), make_input)
+    after = best_time(lambda df: (stage.process_verification(df, entity_data), df)[1], make_input)
+    return before, after
+
+
+# --- 06_Compare_Datasets.process_index_files ---
+
+HANDMADE_TYPES = {
+    "name-English_table.csv": ["E21 Person"],
+    "gio-English_table.csv": ["E53 Place", "E74 Group"],
+    "work-English_table.csv": ["E22 Man-Made Object", "E28 Conceptual Object", "E55 Type", "E1 CRM Entity"]
+}
+
+
+def handmade_lookup(normalize_name):
+    """Same lookup as 06's load_handmade_data, read from 04-HandmadeDataset."""
+    lookup = {}
+    for filename, types in HANDMADE_TYPES.items():
+        path = os.path.join(HANDMADE_DIR, filename)
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path, encoding='gbk')
+        qids = df['QID'] if 'QID' in df.columns else pd.Series(None, index=df.index)
+        for raw_name, qid in zip(df['统一英文全名'], qids):
+            key = normalize_name(raw_name).lower()
+            if key:
+                lookup.setdefault(key, []).append({'qid': qid, 'source_file': filename,
+                                                   'compatible_types': types, 'original_name': raw_name})
+    return lookup
+
+
+def legacy_06(index, lookup, normalize_name):
+    details = []
+    for filename, df in index.groupby('File', sort=False):
+        for _, row in df.iterrows():
+            main_entry = row.get('Index_Main Entry', '')
+            cidoc_type = row.get('CIDOC_Type', '')
+            if pd.isna(main_entry) or not str(main_entry).strip():
+                continue
+            norm_name = normalize_name(str(main_entry))
+            key = norm_name.lower()
+            match_found, match_type, match_info = False, "None", None
+            if key in lookup:
+                match_found, match_type, match_info = True, "Exact", lookup[key]
+            if not match_found and "," in norm_name:
+                flipped_key = flip_name(norm_name).lower()
+                if flipped_key in lookup:
+                    match_found, match_type, match_info = True, "Flipped", lookup[flipped_key]
+            if match_found:
+                best_match = match_info[0]
+                is_compatible = (cidoc_type in best_match['compatible_types']
+                                 or (cidoc_type == 'E74 Group' and best_match['source_file'] == 'gio-English_table.csv'))
+                details.append({'File': filename, 'Index_Entry': main_entry, 'CIDOC_Type': cidoc_type,
+                                'Match_Type': match_type, 'Matched_QID': best_match['qid'],
+                                'Matched_Name': best_match['original_name'],
+                                'Source_Table': best_match['source_file'], 'Category_Compatible': is_compatible})
+            else:
+                details.append({'File': filename, 'Index_Entry': main_entry, 'CIDOC_Type': cidoc_type,
+                                'Match_Type': "None", 'Matched_QID': None, 'Matched_Name': None,
+                                'Source_Table': None, 'Category_Compatible': None})
+    return details
+
+
+def vectorized_06(index, lookup, stage):
+    return stage.match_index_frame(index, stage.lookup_table(lookup), index['File']).to_dict('records')
+
+
+def bench_06(index):
+    stage = load_script(os.path.join("02-Analysis", "06_Compare_Datasets.py"))
+    lookup = handmade_lookup(stage.normalize_name)
+    before = best_time(lambda: legacy_06(index, lookup, stage.normalize_name), tuple)
+    after = best_time(lambda: vectorized_06(index, lookup, stage), tuple)
+    return before, after
+
+
+# --- 23_Deep_Line_Analysis ---
+
+def line_analysis_input(index):
+    """Index rows as recheck rows: entry -> flipped formal name, with the source note as status."""
+    return pd.DataFrame({
+        'Original_Entry': index['Index_Main Entry'],
+        'Refined_Formal_Name': index['Index_Main Entry'].map(str).map(flip_name),
+        'Refined_Category': index['CIDOC_Type'],
+        'Status/Notes': index['备注/来源'],
+    })
+
+
+def legacy_23(df):
+    df['Analysis_Tag'] = ''
+    df['Similarity_Score'] = 0.0
+    df['Issue_Flag'] = ''
+    similarities = pair_scores(df['Original_Entry'].astype(str).str.strip().tolist(),
+                               df['Refined_Formal_Name'].astype(str).str.strip().tolist())
+    for pos, (index, row) in enumerate(df.iterrows()):
+        note = str(row['Status/Notes']).strip()
+        sim_score = similarities[pos]
+        df.at[index, 'Similarity_Score'] = round(sim_score, 2)
+        if sim_score < 0.6 and sim_score > 0.1:
+            if "Disambiguation" not in note and "Nick" not in note and "alias" not in note.lower():
+                df.at[index, 'Issue_Flag'] += 'Low_Similarity; '
+        if pd.isna(row['Status/Notes']) or row['Status/Notes'] == 'nan':
+            df.at[index, 'Analysis_Tag'] = 'Missing_Note'
+        elif '[' in note and ']' in note:
+            tag_match = re.search(r'\[(.*?)\]', note)
+            if tag_match:
+                df.at[index, 'Analysis_Tag'] = tag_match.group(1)
+        else:
+            df.at[index, 'Analysis_Tag'] = 'Unstructured'
+            if any(x in note.lower() for x in ['painter', 'artist', 'sculptor', 'architect']):
+                df.at[index, 'Issue_Flag'] += 'Role_Description; '
+            elif any(x in note.lower() for x in ['city', 'town', 'region', 'church', 'palace']):
+                df.at[index, 'Issue_Flag'] += 'Place_Description; '
+    return df
+
+
+def bench_23(index):
+    stage = load_script("23_Deep_Line_Analysis.py")
+    base = line_analysis_input(index)
+    make_input = lambda: (base.copy(),)
+    before = best_time(legacy_23, make_input)
+    after = best_time(lambda df: (stage.analyze_frame(df), df)[1], make_input)
+    return before, after
+
+
+# --- 19_Deduplicate_Merged_Entity.normalize_name ---
+
+def dedup_input(index):
+    """Index rows plus a 'Manual' copy of every third row, with a mapping for every fifth Index name."""
+    index_rows = pd.DataFrame({
+        'Entity_Name': index['Index_Main Entry'],
+        'Type': index['CIDOC_Type'],
+        'Source': 'Index',
+        'QID': np.where(index.index % 4 == 0, 'Q' + index.index.astype(str), None),
+        'Page_Numbers': index['Index_Page Numbers'],
+        'Original_File': index['File'],
+    })
+    manual_rows = index_rows.iloc[::3].assign(Source='Manual', Original_File='name-English_table.csv',
+                                             Entity_Name=lambda d: d['Entity_Name'].map(str).map(flip_name))
+    df = pd.concat([index_rows, manual_rows], ignore_index=True)
+    names = index_rows['Entity_Name'].dropna().iloc[::5]
+    index_to_manual = dict(zip(names, names.map(str).map(flip_name)))
+    return df, index_to_manual
+
+
+def legacy_19(df, index_to_manual):
+    def normalize_name(row):
+        if row['Source'] == 'Index':
+            name = row['Entity_Name']
+            if name in index_to_manual:
+                return index_to_manual[name]
+        return row['Entity_Name']
+
+    def aggregate_group(group):
+        types = group['Type'].dropna().unique()
+        final_type = types[0] if len(types) > 0 else ''
+        sources = group['Source'].dropna().unique()
+        qids = group['QID'].dropna().astype(str)
+        qids = qids[(qids != '') & (qids != 'nan')]
+        pages = group['Page_Numbers'].dropna().astype(str)
+        pages = pages[(pages != '') & (pages != 'nan')]
+        files = group['Original_File'].dropna().unique()
+        return pd.Series({
+            'Entity_Name': group['Normalized_Name'].iloc[0],
+            'Type': final_type,
+            'Source': ' + '.join(sorted(sources)),
+            'QID': qids.iloc[0] if len(qids) > 0 else '',
+            'Page_Numbers': '; '.join(sorted(set(pages))),
+            'Original_Files': '; '.join(sorted(files)),
+            'Original_Count': len(group)
+        })
+
+    df['Normalized_Name'] = df.apply(normalize_name, axis=1)
+    return df.groupby('Normalized_Name')[list(df.columns)].apply(aggregate_group).reset_index(drop=True)
+
+
+def vectorized_19(df, index_to_manual, stage):
+    df['Normalized_Name'] = stage.normalize_names(df, index_to_manual)
+    return stage.aggregate_entities(df)
+
+
+def bench_19(index):
+    stage = load_script("19_Deduplicate_Merged_Entity.py")
+    base, index_to_manual = dedup_input(index)
+    make_input = lambda: (base.copy(),)
+    before = best_time(lambda df: legacy_19(df, index_to_manual), make_input)
+    after = best_time(lambda df: vectorized_19(df, index_to_manual, stage), make_input)
+    return before, after
+
+
+STAGES = {
+    '08': ("08_Add_Location_Columns.enrich_files", bench_08),
+    '37': ("37_Verify_And_Enrich_QIDs.process_verification", bench_37),
+    '06': ("06_Compare_Datasets.process_index_files", bench_06),
+    '23': ("23_Deep_Line_Analysis", bench_23),
+    '19': ("19_Deduplicate_Merged_Entity.normalize_name", bench_19),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time row-wise vs vectorized pipeline stages on the 03-Index CSVs")
+    parser.add_argument("--stages", nargs="+", choices=sorted(STAGES), default=list(STAGES),
+                        help="Stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeat the Index rows N times for a larger input")
+    args = parser.parse_args()
+
+    index = load_index(args.repeat)
+    print(f"Loaded {len(index)} rows from {INDEX_DIR}")
+    print(f"{'Stage':<50} {'Before (s)':>11} {'After (s)':>10} {'Speedup':>8}  Same output")
+    for key in args.stages:
+        label, bench = STAGES[key]
+        (before, old), (after, new) = bench(index)
+        print(f"{label:<50} {before:>11.3f} {after:>10.3f} {before / max(after, 1e-9):>7.1f}x  {same_output(old, new)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
 import pandas as pd
 import os
-import csv
+from getty_matcher import GettyScanIndex, ULAN_FILE
 
 def query_local_ulan():
     # Configuration
-    ulan_file = r'c:\Users\001\Desktop\Github-Project\PnPDataset\Getty\The Union List of Artist Names (ULAN)\ULANOut_Full.nt'
+    ulan_file = ULAN_FILE
     target_csv = r'c:\Users\001\Desktop\Github-Project\PnPDataset\04-Index-Enrich\H_refined.csv'
     output_file = r'c:\Users\001\Desktop\Github-Project\PnPDataset\99-Python\02-Analysis\H_Local_Getty_Results.txt'
     
@@ -20,33 +20,13 @@ def query_local_ulan():
     
     print(f"Looking for {len(targets)} unique names: {list(targets)[:5]}...")
     
-    # 2. Scan ULAN File
-    print(f"Scanning {ulan_file} (This may take a while)...")
-    
+    # 2. Scan ULAN File (single pass for all names, reused across runs)
     found_data = {name: [] for name in targets}
-    
-    try:
-        with open(ulan_file, 'r', encoding='utf-8', errors='ignore') as f:
-            line_count = 0
-            for line in f:
-                line_count += 1
-                if line_count % 1000000 == 0:
-                    print(f"Processed {line_count/1000000:.1f}M lines...")
-                
-                # Optimization: Check if line contains any of the target names
-                # This is still O(N*M) per line where M is num targets. 
-                # Since M is small (~25), it's okay.
-                # We look for the name enclosed in quotes to be safer, e.g. "Hogarth, William"
-                
-                for name in targets:
-                    # Simple check: is the name in the line?
-                    # We try to match literal format: "Name"
-                    if f'"{name}"' in line:
-                        found_data[name].append(line.strip())
-                        
-    except FileNotFoundError:
+    if not os.path.exists(ulan_file):
         print(f"Error: ULAN file not found at {ulan_file}")
         return
+    for name, hits in GettyScanIndex().lookup('ULAN', targets, ulan_file).items():
+        found_data[name] = [h['line'] for h in hits]
 
     # 3. Process and Save Results
     print("Processing results...")
@@ -1,7 +1,8 @@
-import os
+from getty_index import GettyIndex
+from getty_matcher import ULAN_FILE
 
 def get_hogarth_details():
-    ulan_file = r'c:\Users\001\Desktop\Github-Project\PnPDataset\Getty\The Union List of Artist Names (ULAN)\ULANOut_Full.nt'
+    ulan_file = ULAN_FILE
     output_file = r'c:\Users\001\Desktop\Github-Project\PnPDataset\99-Python\02-Analysis\Hogarth_Details.txt'
     
     target_ids = {
@@ -10,23 +11,32 @@ def get_hogarth_details():
         '500377518'
     }
     
-    print(f"Scanning {ulan_file} for details on IDs: {target_ids}...")
-    
     found_lines = []
-    
-    try:
-        with open(ulan_file, 'r', encoding='utf-8', errors='ignore') as f:
-            for line in f:
-                # Check if the line starts with one of our target IDs
-                # The format is <http://vocab.getty.edu/ulan/ID>
-                for tid in target_ids:
-                    if line.startswith(f'<http://vocab.getty.edu/ulan/{tid}>'):
-                        found_lines.append(line.strip())
-                        break
-                        
-    except FileNotFoundError:
-        print(f"Error: ULAN file not found at {ulan_file}")
-        return
+
+    getty_index = GettyIndex.open_existing()
+    if getty_index is not None and 'ULAN' in getty_index.built_datasets():
+        # Pre-built index: label/scope note/parent/type triples per ID
+        print(f"Looking up IDs {target_ids} in {getty_index.path}...")
+        for tid in target_ids:
+            subject = f'<http://vocab.getty.edu/ulan/{tid}>'
+            for predicate, obj, lang in getty_index.triples_for(subject):
+                found_lines.append(f"{subject} {predicate} {obj}" + (f" @{lang}" if lang else ""))
+        getty_index.close()
+    else:
+        print(f"Scanning {ulan_file} for details on IDs: {target_ids}...")
+        try:
+            with open(ulan_file, 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    # Check if the line starts with one of our target IDs
+                    # The format is <http://vocab.getty.edu/ulan/ID>
+                    for tid in target_ids:
+                        if line.startswith(f'<http://vocab.getty.edu/ulan/{tid}>'):
+                            found_lines.append(line.strip())
+                            break
+
+        except FileNotFoundError:
+            print(f"Error: ULAN file not found at {ulan_file}")
+            return
 
     print(f"Found {len(found_lines)} triples.")
     
@@ -1,7 +1,18 @@
+from getty_index import GettyIndex
+from getty_matcher import ULAN_FILE
+
 def get_scopenote():
-    ulan_file = r'c:\Users\001\Desktop\Github-Project\PnPDataset\Getty\The Union List of Artist Names (ULAN)\ULANOut_Full.nt'
+    ulan_file = ULAN_FILE
     target_note_id = '<http://vocab.getty.edu/ulan/scopeNote/31502>'
-    
+
+    getty_index = GettyIndex.open_existing()
+    if getty_index is not None and 'ULAN' in getty_index.built_datasets():
+        # Pre-built index: direct lookup of the scope note text
+        print(f"Looking up scope note: {target_note_id}...")
+        print(getty_index.scope_note(target_note_id))
+        getty_index.close()
+        return
+
     print(f"Scanning for scope note: {target_note_id}...")
     
     try:
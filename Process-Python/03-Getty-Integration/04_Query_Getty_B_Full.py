@@ -1,19 +1,10 @@
 import pandas as pd
 import os
-import csv
+from getty_matcher import GettyScanIndex, BASE_DIR, ULAN_FILE, TGN_FILE, AAT_FILE
 
 def query_getty_datasets():
-    # Configuration - Note the folder swap correction
-    base_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset'
-    
-    # ULAN is in ULAN folder
-    ulan_file = os.path.join(base_dir, r'Getty\The Union List of Artist Names (ULAN)\ULANOut_Full.nt')
-    
-    # TGN is in AAT folder (based on previous list_dir)
-    tgn_file = os.path.join(base_dir, r'Getty\The Art & Architecture Thesaurus (AAT)\TGNOut_Full.nt')
-    
-    # AAT is in TGN folder (based on previous list_dir)
-    aat_file = os.path.join(base_dir, r'Getty\The Getty Thesaurus of Geographic Names (TGN)\AATOut_Full.nt')
+    # Configuration - Getty dump paths (incl. the TGN/AAT folder swap) live in getty_matcher
+    base_dir = BASE_DIR
     
     input_csv = os.path.join(base_dir, r'04-Index-Enrich\B_refined.csv')
     output_file = os.path.join(base_dir, r'99-Python\02-Analysis\B_Getty_Full_Results.txt')
@@ -46,43 +37,17 @@ def query_getty_datasets():
     
     results = {} # Key: Name, Value: List of matching lines
 
-    # Helper function to scan a file
-    def scan_file(filepath, targets, dataset_name):
-        print(f"Scanning {dataset_name} at {filepath}...")
-        if not os.path.exists(filepath):
-            print(f"  Error: File not found: {filepath}")
-            return
-
-        count = 0
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    count += 1
-                    if count % 5000000 == 0:
-                        print(f"  Processed {count/1000000:.1f}M lines...")
-                    
-                    # Optimization: Check for literal string match first
-                    # We look for "Name" to avoid partial matches inside other words if possible, 
-                    # but simple substring is faster for this scale than regex
-                    for name in targets:
-                        if f'"{name}"' in line:
-                            if name not in results: results[name] = []
-                            results[name].append(f"[{dataset_name}] {line.strip()}")
-        except Exception as e:
-            print(f"  Error reading file: {e}")
-
-    # 2. Execute Scans
-    # Scan ULAN
-    if ulan_targets:
-        scan_file(ulan_file, ulan_targets, "ULAN")
-        
-    # Scan TGN
-    if tgn_targets:
-        scan_file(tgn_file, tgn_targets, "TGN")
-        
-    # Scan AAT
-    if aat_targets:
-        scan_file(aat_file, aat_targets, "AAT")
+    # 2. Execute Scans - one pass per dump for all of its targets
+    scan_index = GettyScanIndex()
+    for dataset_name, filepath, targets in [
+        ("ULAN", ULAN_FILE, ulan_targets),
+        ("TGN", TGN_FILE, tgn_targets),
+        ("AAT", AAT_FILE, aat_targets),
+    ]:
+        if not targets:
+            continue
+        for name, hits in scan_index.lookup(dataset_name, targets, filepath).items():
+            results.setdefault(name, []).extend(f"[{dataset_name}] {h['line']}" for h in hits)
 
     # 3. Write Results
     print("Writing results...")
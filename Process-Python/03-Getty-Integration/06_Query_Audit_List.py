@@ -1,7 +1,7 @@
 import pandas as pd
 import os
-import csv
-import re
+from getty_matcher import GettyScanIndex, ULAN_FILE, TGN_FILE, AAT_FILE
+from getty_index import GettyIndex
 
 def query_getty_for_audit_list():
     base_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset'
@@ -10,26 +10,7 @@ def query_getty_for_audit_list():
     input_csv = os.path.join(base_dir, r'06-Crosscheck\Audit_List_Combined.csv')
     output_csv = os.path.join(base_dir, r'06-Crosscheck\Audit_List_Getty_Matches.csv')
     
-    # Getty Files
-    ulan_file = os.path.join(base_dir, r'Getty\The Union List of Artist Names (ULAN)\ULANOut_Full.nt')
-    tgn_file = os.path.join(base_dir, r'Getty\The Getty Thesaurus of Geographic Names (TGN)\TGNOut_Full.nt') # Corrected path based on previous list_dir
-    aat_file = os.path.join(base_dir, r'Getty\The Art & Architecture Thesaurus (AAT)\AATOut_Full.nt') # Corrected path based on previous list_dir
-    
-    # Note: In previous turns, I noticed folder names might be swapped or confusing. 
-    # Let's double check paths from previous `list_dir` output if needed.
-    # Previous `list_dir` showed:
-    # Getty/The Art & Architecture Thesaurus (AAT)/TGNOut_Full.nt  <-- TGN is in AAT folder?
-    # Getty/The Getty Thesaurus of Geographic Names (TGN)/AATOut_Full.nt <-- AAT is in TGN folder?
-    # Let's re-verify or use the paths that worked in 04_Query_Getty_B_Full.py
-    
-    # From 04_Query_Getty_B_Full.py content read previously:
-    # ulan_file = ... ULANOut_Full.nt
-    # tgn_file = ... Getty\The Art & Architecture Thesaurus (AAT)\TGNOut_Full.nt
-    # aat_file = ... Getty\The Getty Thesaurus of Geographic Names (TGN)\AATOut_Full.nt
-    # I will use these specific paths to be safe.
-    
-    tgn_file = os.path.join(base_dir, r'Getty\The Art & Architecture Thesaurus (AAT)\TGNOut_Full.nt')
-    aat_file = os.path.join(base_dir, r'Getty\The Getty Thesaurus of Geographic Names (TGN)\AATOut_Full.nt')
+    # Getty Files: paths (incl. the TGN/AAT folder swap) come from getty_matcher
 
     print(f"Loading targets from {input_csv}...")
     df = pd.read_csv(input_csv)
@@ -93,79 +74,45 @@ def query_getty_for_audit_list():
             print(f"Skipping {dataset_name} (no targets).")
             return
 
-        print(f"Scanning {dataset_name} at {filepath}...")
-        
-        # Pre-compile regex or set for fast lookup
-        # We look for literal matches of the name in the N-Triples
-        # N-Triples format: <subject> <predicate> "object"@lang .
-        # We want to match the "object" part.
-        
-        # Optimization: Create a set of target names for O(1) lookup
-        target_set = set(target_dict.keys())
-        
-        count = 0
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    count += 1
-                    if count % 5000000 == 0:
-                        print(f"  Processed {count/1000000:.1f}M lines...")
-                        
-                    # Fast check: is any target in the line? 
-                    # This is slow if we iterate all targets.
-                    # Better: Extract the literal from the line and check if it's in target_set.
-                    
-                    # Line format usually: ... <...#label> "Name"@en .
-                    if '"' not in line: continue
-                    
-                    try:
-                        # Extract text between first and last quote (simplified)
-                        # A safer way for N-Triples literals
-                        start = line.find('"')
-                        end = line.rfind('"')
-                        if start == -1 or end == -1 or start >= end: continue
-                        
-                        literal = line[start+1:end]
-                        
-                        # Check exact match
-                        if literal in target_set:
-                            # Found a match!
-                            # Extract ID
-                            # Subject is usually <http://vocab.getty.edu/dataset/id>
-                            parts = line.split(' ', 1)
-                            subject = parts[0]
-                            
-                            # Extract numeric ID
-                            # e.g. <http://vocab.getty.edu/ulan/500000833>
-                            # or <http://vocab.getty.edu/ulan/term/1500002262> (Term ID, skip or map to Subject?)
-                            # We prefer the main Subject ID (digits only usually)
-                            
-                            is_term = '/term/' in subject
-                            
-                            # We store this match
-                            for idx in target_dict[literal]:
-                                if idx not in matches: matches[idx] = []
-                                
-                                # Avoid duplicates
-                                existing_ids = [m['id'] for m in matches[idx]]
-                                if subject not in existing_ids:
-                                    matches[idx].append({
-                                        'id': subject,
-                                        'term': literal,
-                                        'dataset': dataset_name,
-                                        'is_term': is_term
-                                    })
-                                    
-                    except Exception:
-                        continue
-                        
-        except FileNotFoundError:
-            print(f"Error: File not found {filepath}")
+        if getty_index is not None and dataset_name in getty_index.built_datasets():
+            # Pre-built index: exact label -> IRI lookups, no dump scan
+            print(f"Looking up {dataset_name} in {getty_index.path}...")
+            hits_by_name = getty_index.lookup_labels(dataset_name, target_dict.keys())
+        else:
+            # N-Triples format: <subject> <predicate> "object"@lang .
+            # One shared pass finds every line with a quoted target; we keep the
+            # exact-literal matches (text between the first and last quote).
+            hits_by_name = {}
+            for literal, hits in scan_index.lookup(dataset_name, target_dict.keys(), filepath).items():
+                hits_by_name[literal] = [h for h in hits
+                                         if h['line'][h['line'].find('"') + 1:h['line'].rfind('"')] == literal]
+        for literal, hits in hits_by_name.items():
+            for hit in hits:
+                subject = hit['subject']
+                # Term IDs (<.../ulan/term/1500002262>) rank below main Subject IDs
+                is_term = '/term/' in subject
+
+                for idx in target_dict[literal]:
+                    if idx not in matches: matches[idx] = []
+
+                    # Avoid duplicates
+                    existing_ids = [m['id'] for m in matches[idx]]
+                    if subject not in existing_ids:
+                        matches[idx].append({
+                            'id': subject,
+                            'term': literal,
+                            'dataset': dataset_name,
+                            'is_term': is_term
+                        })
 
     # Execute Scans
-    scan_file(ulan_file, targets_by_dataset['ULAN'], 'ULAN')
-    scan_file(tgn_file, targets_by_dataset['TGN'], 'TGN')
-    scan_file(aat_file, targets_by_dataset['AAT'], 'AAT')
+    scan_index = GettyScanIndex()
+    getty_index = GettyIndex.open_existing()
+    scan_file(ULAN_FILE, targets_by_dataset['ULAN'], 'ULAN')
+    scan_file(TGN_FILE, targets_by_dataset['TGN'], 'TGN')
+    scan_file(AAT_FILE, targets_by_dataset['AAT'], 'AAT')
+    if getty_index is not None:
+        getty_index.close()
     
     # Write Results
     print("Writing results...")
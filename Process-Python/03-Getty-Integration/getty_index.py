@@ -0,0 +1,257 @@
+import argparse
+import os
+import sqlite3
+import time
+
+from getty_matcher import BASE_DIR, DUMP_FILES, iter_blocks
+
+# Pre-built local Getty vocabulary index.
+# One build pass over ULANOut_Full.nt / TGNOut_Full.nt / AATOut_Full.nt keeps only
+# the label, alternate label, scope note, parent and type triples in a SQLite file.
+# Lookup scripts then answer label -> IRI and IRI -> details queries from the
+# index in milliseconds instead of re-reading the multi-GB dumps.
+#
+# Build once (or after downloading new dumps):
+#   python getty_index.py --build
+#   python getty_index.py --build --datasets ULAN
+
+# --- Configuration ---
+INDEX_DB = os.path.join(BASE_DIR, r'Getty\getty_index.sqlite')
+INSERT_BATCH = 50000
+
+# Predicate local names kept in the index (IRI part after the last '#' or '/')
+LABEL_PREDICATES = {'prefLabel', 'altLabel', 'label', 'literalForm', 'term'}
+DETAIL_PREDICATES = LABEL_PREDICATES | {
+    'scopeNote', 'value', 'parentString', 'broader', 'broaderPreferred',
+    'broaderGeneric', 'type', 'placeTypePreferred',
+}
+
+
+def split_object(obj):
+    """Returns (object, is_literal, lang) for the object part of an N-Triples line."""
+    obj = obj.rstrip()
+    if obj.endswith('.'):
+        obj = obj[:-1].rstrip()
+    if obj.startswith('"'):
+        end = obj.rfind('"')
+        text = obj[1:end] if end > 0 else obj[1:]
+        tail = obj[end + 1:] if end > 0 else ''
+        lang = tail[1:] if tail.startswith('@') else ''
+        return text.replace('\\"', '"').replace('\\\\', '\\'), True, lang
+    return obj, False, ''
+
+
+def local_name(predicate):
+    iri = predicate.strip('<>')
+    return iri.rsplit('#', 1)[-1].rsplit('/', 1)[-1]
+
+
+class GettyIndex:
+    """
+    SQLite index over the Getty dumps.
+
+    Tables: `triples` (the kept triples, by subject), `labels` (literal label ->
+    subject), `term_links` (term node -> the concept that uses it as a
+    skosxl pref/alt label) and `meta` (which dump each dataset was built from).
+    If SQLite has FTS5, `labels_fts` allows word search over all labels.
+    """
+
+    def __init__(self, path=INDEX_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS triples (
+                dataset TEXT NOT NULL, subject TEXT NOT NULL, predicate TEXT NOT NULL,
+                object TEXT NOT NULL, is_literal INTEGER NOT NULL, lang TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_triples_subject ON triples(subject);
+            CREATE TABLE IF NOT EXISTS labels (
+                label TEXT NOT NULL, subject TEXT NOT NULL, dataset TEXT NOT NULL, predicate TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_labels_label ON labels(label);
+            CREATE TABLE IF NOT EXISTS term_links (
+                term TEXT NOT NULL, concept TEXT NOT NULL, dataset TEXT NOT NULL, predicate TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_term_links_term ON term_links(term);
+            CREATE TABLE IF NOT EXISTS meta (dataset TEXT PRIMARY KEY, dump TEXT, size INTEGER, mtime REAL, built REAL);
+        """)
+        self.has_fts = True
+        try:
+            self.conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS labels_fts USING fts5("
+                              "label, content='labels', content_rowid='rowid')")
+        except sqlite3.OperationalError:
+            self.has_fts = False  # SQLite built without FTS5: exact lookups still work
+        self.conn.commit()
+
+    @classmethod
+    def open_existing(cls, path=INDEX_DB):
+        """Returns the index if it has been built, else None (callers fall back to scanning)."""
+        if not os.path.exists(path):
+            return None
+        index = cls(path)
+        if not index.built_datasets():
+            index.close()
+            return None
+        return index
+
+    def built_datasets(self):
+        return {row[0] for row in self.conn.execute("SELECT dataset FROM meta")}
+
+    def is_stale(self, dataset, filepath=None):
+        filepath = filepath or DUMP_FILES[dataset]
+        row = self.conn.execute("SELECT size, mtime FROM meta WHERE dataset = ?", (dataset,)).fetchone()
+        if row is None or not os.path.exists(filepath):
+            return row is None
+        stat = os.stat(filepath)
+        return (row[0], row[1]) != (stat.st_size, stat.st_mtime)
+
+    # --- Build ---
+
+    def build(self, dataset, filepath=None):
+        """(Re)builds one dataset from its dump in a single streaming pass."""
+        filepath = filepath or DUMP_FILES[dataset]
+        if not os.path.exists(filepath):
+            print(f"  Error: File not found: {filepath}")
+            return 0
+        print(f"Indexing {dataset} from {filepath}...")
+        start = time.time()
+        with self.conn:
+            self.conn.execute("DELETE FROM triples WHERE dataset = ?", (dataset,))
+            self.conn.execute("DELETE FROM labels WHERE dataset = ?", (dataset,))
+            self.conn.execute("DELETE FROM term_links WHERE dataset = ?", (dataset,))
+            self.conn.execute("DELETE FROM meta WHERE dataset = ?", (dataset,))
+
+        triples, labels, links = [], [], []
+        kept = 0
+        scanned = 0
+        for block in iter_blocks(filepath):
+            for line in block.splitlines():
+                parts = line.split(' ', 2)
+                if len(parts) < 3:
+                    continue
+                subject, predicate, rest = parts
+                name = local_name(predicate)
+                if name not in DETAIL_PREDICATES:
+                    continue
+                # rdf:value is only kept for scope note nodes (the note text)
+                if name == 'value' and '/scopeNote/' not in subject:
+                    continue
+                obj, is_literal, lang = split_object(rest)
+                triples.append((dataset, subject, name, obj, int(is_literal), lang))
+                if name in LABEL_PREDICATES:
+                    if is_literal:
+                        labels.append((obj, subject, dataset, name))
+                    elif name in ('prefLabel', 'altLabel'):
+                        links.append((obj, subject, dataset, name))
+                kept += 1
+                if len(triples) >= INSERT_BATCH:
+                    self._insert(triples, labels, links)
+            scanned += len(block)
+            print(f"  {dataset}: scanned {scanned / 1e9:.2f} G chars, kept {kept} triples...")
+        self._insert(triples, labels, links)
+
+        stat = os.stat(filepath)
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (dataset, dump, size, mtime, built) VALUES (?, ?, ?, ?, ?)",
+                              (dataset, os.path.abspath(filepath), stat.st_size, stat.st_mtime, time.time()))
+            if self.has_fts:
+                self.conn.execute("INSERT INTO labels_fts(labels_fts) VALUES('rebuild')")
+        print(f"  {dataset}: {kept} triples indexed in {time.time() - start:.0f}s")
+        return kept
+
+    def _insert(self, triples, labels, links):
+        with self.conn:
+            self.conn.executemany("INSERT INTO triples VALUES (?, ?, ?, ?, ?, ?)", triples)
+            self.conn.executemany("INSERT INTO labels VALUES (?, ?, ?, ?)", labels)
+            self.conn.executemany("INSERT INTO term_links VALUES (?, ?, ?, ?)", links)
+        triples.clear()
+        labels.clear()
+        links.clear()
+
+    # --- Lookups ---
+
+    def lookup_labels(self, dataset, names):
+        """
+        Exact label -> subject lookup.
+        Returns {name: [{'subject', 'predicate'}, ...]}; a label on a term node also
+        yields the concept that uses the term, so callers can prefer concept IRIs.
+        """
+        found = {}
+        for name in set(n for n in names if n):
+            rows = self.conn.execute("SELECT subject, predicate FROM labels WHERE label = ? AND dataset = ?",
+                                     (name, dataset)).fetchall()
+            hits = []
+            seen = set()
+            for subject, predicate in rows:
+                candidates = [(subject, predicate)]
+                if '/term/' in subject:
+                    candidates += self.conn.execute("SELECT concept, predicate FROM term_links WHERE term = ?",
+                                                    (subject,)).fetchall()
+                for s, p in candidates:
+                    if s not in seen:
+                        seen.add(s)
+                        hits.append({'subject': s, 'predicate': p})
+            if hits:
+                found[name] = hits
+        return found
+
+    def search(self, text, dataset=None, limit=20):
+        """FTS5 word search over labels; returns [(label, subject, dataset)]."""
+        if not self.has_fts:
+            raise RuntimeError("SQLite was built without FTS5; use lookup_labels for exact matches")
+        query = "SELECT l.label, l.subject, l.dataset FROM labels_fts f JOIN labels l ON l.rowid = f.rowid " \
+                "WHERE labels_fts MATCH ?"
+        params = ['"' + text.replace('"', '""') + '"']
+        if dataset:
+            query += " AND l.dataset = ?"
+            params.append(dataset)
+        return self.conn.execute(query + " LIMIT ?", params + [limit]).fetchall()
+
+    def triples_for(self, subject):
+        """Returns [(predicate, object, lang)] for one subject IRI (with angle brackets)."""
+        return self.conn.execute("SELECT predicate, object, lang FROM triples WHERE subject = ?",
+                                 (subject,)).fetchall()
+
+    def scope_note(self, subject):
+        """Returns the scope note text for a concept or scope note IRI, or None."""
+        note = subject
+        if '/scopeNote/' not in subject:
+            row = self.conn.execute("SELECT object FROM triples WHERE subject = ? AND predicate = 'scopeNote'",
+                                    (subject,)).fetchone()
+            if row is None:
+                return None
+            note = row[0]
+        row = self.conn.execute("SELECT object FROM triples WHERE subject = ? AND predicate = 'value'",
+                                (note,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the local Getty vocabulary index")
+    parser.add_argument("--build", action="store_true", help="(Re)build the index from the .nt dumps")
+    parser.add_argument("--datasets", nargs="+", default=list(DUMP_FILES), choices=list(DUMP_FILES))
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the dump is unchanged")
+    parser.add_argument("--search", help="Word search over indexed labels")
+    args = parser.parse_args()
+
+    index = GettyIndex()
+    if args.build:
+        for dataset in args.datasets:
+            if args.force or index.is_stale(dataset):
+                index.build(dataset)
+            else:
+                print(f"{dataset} index is up to date.")
+    if args.search:
+        for label, subject, dataset in index.search(args.search):
+            print(f"[{dataset}] {label} -> {subject}")
+    for dataset, size in index.conn.execute("SELECT dataset, COUNT(*) FROM triples GROUP BY dataset"):
+        print(f"{dataset}: {size} triples")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
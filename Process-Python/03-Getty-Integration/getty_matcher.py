@@ -0,0 +1,257 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import ahocorasick  # pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Shared Getty dump scanner.
+# All target literals are compiled into one Aho-Corasick automaton and each
+# .nt dump is read once. Hits are stored per dataset under SCAN_CACHE_DIR, so
+# 01_Query_Local_Getty_ULAN, 04_Query_Getty_B_Full and 06_Query_Audit_List can
+# reuse one scan instead of re-reading multi-GB files for every script.
+
+# --- Configuration ---
+BASE_DIR = r'c:\Users\001\Desktop\Github-Project\PnPDataset'
+ULAN_FILE = os.path.join(BASE_DIR, r'Getty\The Union List of Artist Names (ULAN)\ULANOut_Full.nt')
+# Note the folder swap: TGN lives in the AAT folder and vice versa
+TGN_FILE = os.path.join(BASE_DIR, r'Getty\The Art & Architecture Thesaurus (AAT)\TGNOut_Full.nt')
+AAT_FILE = os.path.join(BASE_DIR, r'Getty\The Getty Thesaurus of Geographic Names (TGN)\AATOut_Full.nt')
+DUMP_FILES = {'ULAN': ULAN_FILE, 'TGN': TGN_FILE, 'AAT': AAT_FILE}
+SCAN_CACHE_DIR = os.path.join(BASE_DIR, r'Getty\scan_cache')
+BLOCK_SIZE = 64 * 1024 * 1024  # Bytes read per block
+SCAN_WORKERS = os.cpu_count() or 1  # Processes used to scan one dump
+CHUNKS_PER_WORKER = 4  # More, smaller byte ranges than workers keep all cores busy to the end
+PARALLEL_MIN_BYTES = 256 * 1024 * 1024  # Smaller dumps are scanned in-process
+
+
+def parse_triple(line):
+    """Splits an N-Triples line into (subject, predicate) IRIs, keeping the angle brackets."""
+    parts = line.split(' ', 2)
+    subject = parts[0] if parts else ''
+    predicate = parts[1] if len(parts) > 1 else ''
+    return subject, predicate
+
+
+class LiteralMatcher:
+    """
+    Finds lines containing any target as a quoted literal ("Name").
+
+    With pyahocorasick installed, the patterns form one automaton and each block is
+    scanned in a single pass. Without it, every line's quoted literal is looked up
+    in a set. That gives the same exact-literal hits without an automaton.
+    """
+
+    def __init__(self, targets):
+        self.targets = set(t for t in targets if t)
+        self.automaton = None
+        if ahocorasick and self.targets:
+            self.automaton = ahocorasick.Automaton()
+            for name in self.targets:
+                self.automaton.add_word(f'"{name}"', name)
+            self.automaton.make_automaton()
+
+    def scan_block(self, block):
+        """Yields (target, line) for every hit in a block of whole lines."""
+        if not self.targets:
+            return
+        if self.automaton is not None:
+            seen = set()
+            for end, name in self.automaton.iter(block):
+                start = block.rfind('\n', 0, end) + 1
+                if (name, start) in seen:
+                    continue  # Same name twice on one line
+                seen.add((name, start))
+                stop = block.find('\n', end)
+                yield name, block[start:stop if stop != -1 else len(block)].strip()
+            return
+        for line in block.splitlines():
+            start = line.find('"')
+            if start == -1:
+                continue
+            end = line.find('"', start + 1)
+            if end != -1 and line[start + 1:end] in self.targets:
+                yield line[start + 1:end], line.strip()
+
+
+def split_ranges(filepath, parts):
+    """Splits a file into up to `parts` (start, end) byte ranges, each starting at a line boundary."""
+    size = os.path.getsize(filepath)
+    bounds = [0]
+    with open(filepath, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(size * i // parts)
+            f.readline()  # Move to the start of the next full line
+            pos = f.tell()
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def iter_range_blocks(filepath, start, end, block_size=BLOCK_SIZE):
+    """Reads bytes [start, end) in large blocks of whole lines, decoded as UTF-8."""
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        carry = b''
+        while remaining > 0:
+            chunk = f.read(min(block_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            chunk = carry + chunk
+            cut = chunk.rfind(b'\n') + 1
+            if cut == 0:
+                carry = chunk
+                continue
+            carry = chunk[cut:]
+            yield chunk[:cut].decode('utf-8', errors='ignore')
+        if carry:
+            yield carry.decode('utf-8', errors='ignore')
+
+
+def iter_blocks(filepath, block_size=BLOCK_SIZE):
+    """Reads a whole text file in large blocks, each cut at a line boundary."""
+    return iter_range_blocks(filepath, 0, os.path.getsize(filepath), block_size)
+
+
+_worker_matcher = None
+
+
+def _init_worker(targets):
+    # The automaton is built once per worker process, not once per byte range
+    global _worker_matcher
+    _worker_matcher = LiteralMatcher(targets)
+
+
+def _scan_range(job):
+    index, filepath, start, end = job
+    hits = []
+    for block in iter_range_blocks(filepath, start, end):
+        hits.extend(_worker_matcher.scan_block(block))
+    return index, os.getpid(), end - start, hits
+
+
+def scan_dump(filepath, targets, dataset_name, workers=SCAN_WORKERS):
+    """
+    Scans one dump once for all targets. Returns {target: [hit, ...]}.
+
+    Large dumps are split into newline-aligned byte ranges that a process pool
+    scans in parallel; results are merged in file order, so the output does not
+    depend on which worker finishes first.
+    """
+    targets = set(t for t in targets if t)
+    size = os.path.getsize(filepath)
+    parallel = workers > 1 and size >= PARALLEL_MIN_BYTES
+    ranges = split_ranges(filepath, workers * CHUNKS_PER_WORKER) if parallel else [(0, size)]
+    jobs = [(i, filepath, start, end) for i, (start, end) in enumerate(ranges)]
+    print(f"Scanning {dataset_name} at {filepath} for {len(targets)} targets "
+          f"({'Aho-Corasick' if ahocorasick else 'literal lookup'}, "
+          f"{len(jobs)} ranges on {workers if parallel else 1} worker(s))...")
+
+    results = {}
+    done_bytes = 0
+
+    def report(index, pid, nbytes, hits):
+        nonlocal done_bytes
+        results[index] = hits
+        done_bytes += nbytes
+        print(f"  {dataset_name}: range {index + 1}/{len(jobs)} done by worker {pid} "
+              f"({nbytes / 1e9:.2f} GB, {len(hits)} hits) - {done_bytes / max(size, 1):.0%} of file")
+
+    if parallel:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(targets,)) as pool:
+            for future in as_completed([pool.submit(_scan_range, job) for job in jobs]):
+                report(*future.result())
+    else:
+        _init_worker(targets)
+        for job in jobs:
+            report(*_scan_range(job))
+
+    hits = {}
+    for index in range(len(jobs)):
+        for name, line in results[index]:
+            subject, predicate = parse_triple(line)
+            hits.setdefault(name, []).append({'subject': subject, 'predicate': predicate, 'line': line})
+    return hits
+
+
+class GettyScanIndex:
+    """
+    Persisted scan results shared between scripts.
+
+    `lookup` answers from the stored scan when the dump is unchanged and already
+    covered the requested targets; otherwise it rescans once with the union of old
+    and new targets, so later scripts benefit from earlier ones.
+    """
+
+    def __init__(self, cache_dir=SCAN_CACHE_DIR, workers=SCAN_WORKERS):
+        self.cache_dir = cache_dir
+        self.workers = workers
+
+    def _paths(self, dataset_name):
+        base = os.path.join(self.cache_dir, dataset_name)
+        return base + '.meta.json', base + '.hits.jsonl'
+
+    @staticmethod
+    def _dump_signature(filepath):
+        stat = os.stat(filepath)
+        return {'dump': os.path.abspath(filepath), 'size': stat.st_size, 'mtime': stat.st_mtime}
+
+    def _load_meta(self, dataset_name):
+        meta_path, _ = self._paths(dataset_name)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _load_hits(self, dataset_name, targets):
+        _, hits_path = self._paths(dataset_name)
+        hits = {}
+        with open(hits_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                record = json.loads(line)
+                if record['target'] in targets:
+                    hits.setdefault(record['target'], []).append(
+                        {'subject': record['subject'], 'predicate': record['predicate'], 'line': record['line']})
+        return hits
+
+    def _save(self, dataset_name, signature, targets, hits):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta_path, hits_path = self._paths(dataset_name)
+        with open(hits_path + '.tmp', 'w', encoding='utf-8') as f:
+            for target, records in hits.items():
+                for r in records:
+                    f.write(json.dumps({'target': target, **r}, ensure_ascii=False) + '\n')
+        os.replace(hits_path + '.tmp', hits_path)
+        meta = dict(signature, targets=sorted(targets),
+                    targets_hash=hashlib.sha1('\n'.join(sorted(targets)).encode('utf-8')).hexdigest())
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def lookup(self, dataset_name, targets, filepath=None):
+        """Returns {target: [{'subject', 'predicate', 'line'}, ...]} for targets found in the dump."""
+        filepath = filepath or DUMP_FILES[dataset_name]
+        targets = set(t for t in targets if t)
+        if not targets:
+            return {}
+        if not os.path.exists(filepath):
+            print(f"  Error: File not found: {filepath}")
+            return {}
+
+        signature = self._dump_signature(filepath)
+        meta = self._load_meta(dataset_name)
+        same_dump = meta is not None and all(meta.get(k) == v for k, v in signature.items())
+        if same_dump and targets <= set(meta['targets']):
+            print(f"Using stored {dataset_name} scan ({len(meta['targets'])} targets).")
+            return self._load_hits(dataset_name, targets)
+
+        scan_targets = targets | set(meta['targets']) if same_dump else targets
+        hits = scan_dump(filepath, scan_targets, dataset_name, self.workers)
+        self._save(dataset_name, signature, scan_targets, hits)
+        return {t: h for t, h in hits.items() if t in targets}
@@ -1,9 +1,11 @@
 import pandas as pd
-import requests
-import time
 import os
+import sys
 import urllib.parse
-from difflib import SequenceMatcher
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_cache import get_cache
+from similarity import similarity_matrix
 
 # Paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset\09-MissingQID-LLM-Fillin"
@@ -16,6 +18,8 @@ API_URL = "https://www.wikidata.org/w/api.php"
 HEADERS = {
     "User-Agent": "PnPDatasetBot/1.0 (https://github.com/PnPDataset/PnPDataset; myemail@example.com) python-requests/2.32.3"
 }
+# Shared HTTP cache (Process-Python/http_cache.py)
+CACHE = get_cache()
 
 def search_wikidata(query, limit=5):
     """Search Wikidata for entities matching the query."""
@@ -32,9 +36,9 @@ def search_wikidata(query, limit=5):
     }
     
     try:
-        response = requests.get(API_URL, params=params, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = CACHE.get_json(API_URL, params, headers=HEADERS, timeout=10, delay=0.2)
+        if data is None:
+            raise ValueError("non-200 response")
         return data.get("search", [])
     except Exception as e:
         print(f"Error searching for '{query}': {e}")
@@ -51,16 +55,12 @@ def get_entity_details(qid):
     }
     
     try:
-        response = requests.get(API_URL, params=params, headers=HEADERS, timeout=10)
-        data = response.json()
+        data = CACHE.get_json(API_URL, params, headers=HEADERS, timeout=10) or {}
         return data.get("entities", {}).get(qid, {})
     except Exception as e:
         print(f"Error getting details for '{qid}': {e}")
         return {}
 
-def similarity(a, b):
-    return SequenceMatcher(None, str(a).lower(), str(b).lower()).ratio()
-
 def match_row(row):
     """
     Attempt to match a row to a Wikidata item.
@@ -137,7 +137,6 @@ def match_row(row):
                 res['query_type'] = q_type
                 all_candidates.append(res)
                 seen_ids.add(res['id'])
-        time.sleep(0.2)
         
     if not all_candidates:
         return None, None, None, 0, "No Match"
@@ -145,15 +144,17 @@ def match_row(row):
     # Evaluate Candidates
     best_score = 0
     best_match = None
+    # Name similarity of every candidate label against both names, in one batch
+    name_sims = similarity_matrix([formal_name, original_name],
+                                  [cand.get("label", "") for cand in all_candidates]).max(axis=0)
     
-    for cand in all_candidates:
+    for cand, name_sim in zip(all_candidates, name_sims):
         score = 0
         cand_label = cand.get("label", "")
         cand_desc = cand.get("description", "")
         cand_id = cand.get("id", "")
         
         # 1. Name Similarity (Base)
-        name_sim = max(similarity(formal_name, cand_label), similarity(original_name, cand_label))
         score += name_sim * 0.5
         
         # 2. Description/Context Matching
@@ -235,14 +236,13 @@ def main():
         else:
             print("  -> No match found.")
             df.at[index, 'Match_Method'] = "Failed (Relaxed)"
-            
-        time.sleep(0.3) # Slightly faster
         
         if (index + 1) % save_interval == 0:
             df.to_csv(output_file, index=False, encoding='utf-8-sig')
             print(f"Saved progress to {output_file}")
 
     df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    print(CACHE.summary())
     print("Done.")
 
 if __name__ == "__main__":
@@ -1,52 +1,38 @@
 import csv
 import os
 import re
+import sys
 
-def normalize(text):
-    return str(text).strip()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fuzzy_index import FuzzyIndex, normalize, surname_key
 
-def match_artist(query, candidates):
+def match_artist(query, candidates, index):
     if not query:
         return None, None
     
-    query_norm = normalize(query).lower()
+    query_norm = normalize(query)
     
     # 1. Exact Match
-    for name, qid in candidates.items():
-        if normalize(name).lower() == query_norm:
-            return name, qid
+    exact = index.exact(query)
+    if exact:
+        return exact[0], candidates[exact[0]]
             
     # 2. Token match (Query is a word in Name)
+    # e.g. "Bernini" in "Gian Lorenzo Bernini"; only names containing the query are checked
     matches = []
-    for name, qid in candidates.items():
-        name_norm = normalize(name).lower()
-        # Check if query is a distinct word in name
-        # e.g. "Bernini" in "Gian Lorenzo Bernini"
-        try:
-            if re.search(r'\b' + re.escape(query_norm) + r'\b', name_norm):
-                matches.append((name, qid))
-        except:
-            # Fallback for special chars
-            if query_norm in name_norm:
-                matches.append((name, qid))
+    for name in index.containing(query):
+        name_norm = normalize(name)
+        if re.search(r'\b' + re.escape(query_norm) + r'\b', name_norm):
+            matches.append((name, candidates[name]))
     
     # 3. Surname Match (Fallback)
     if not matches:
-        # Get last word of query
-        # Remove trailing punctuation
-        clean_query = re.sub(r'[^\w\s]', '', query_norm)
-        words = clean_query.split()
-        if len(words) > 0:
-            last_name = words[-1]
-            # Avoid matching common short words or if query is just one word (already covered by token match)
-            # If query is "Guido Abbatini", last name is "abbatini".
-            if len(last_name) > 3: 
-                for name, qid in candidates.items():
-                    name_norm = normalize(name).lower()
-                    clean_name = re.sub(r'[^\w\s]', '', name_norm)
-                    name_words = clean_name.split()
-                    if name_words and name_words[-1] == last_name:
-                         matches.append((name, qid))
+        # Last word of the query, punctuation removed.
+        # Avoid matching common short words or if query is just one word (already covered by token match)
+        # If query is "Guido Abbatini", last name is "abbatini".
+        if len(surname_key(query)) > 3:
+            for name in index.with_surname(query):
+                matches.append((name, candidates[name]))
 
     if matches:
         # Sort matches to have deterministic output
@@ -92,6 +78,8 @@ def process():
                 candidates[name] = qid
                 
     print(f"Loaded {len(candidates)} candidates from combined dataset.")
+    # Blocking keys are built once for all worklist rows
+    index = FuzzyIndex(candidates.keys())
 
     # Load Worklist
     with open(worklist_path, 'r', encoding='utf-8') as f:
@@ -107,7 +95,7 @@ def process():
         
         for row in rows:
             artist = row.get('Artist')
-            matched_name, matched_qid = match_artist(artist, candidates)
+            matched_name, matched_qid = match_artist(artist, candidates, index)
             
             if matched_name:
                 matched_count += 1
@@ -1,6 +1,67 @@
 import pandas as pd
 import os
 
+from dedup_index import KEY, DedupIndex, Policy, describe, index_path
+
+def normalize_names(df, index_to_manual):
+    """Entity names with matched Index entries replaced by their Manual name."""
+    names = df['Entity_Name']
+    mapped = (df['Source'] == 'Index') & names.isin(list(index_to_manual))
+    return names.map(index_to_manual).where(mapped, names)
+
+def _joined(df, column, sep, keys):
+    # Sorted unique non-empty values of `column` per name, joined with sep
+    values = df[['Normalized_Name', column]].dropna().drop_duplicates()
+    joined = values.sort_values(column, kind='stable').groupby('Normalized_Name')[column].agg(sep.join)
+    return joined.reindex(keys, fill_value='')
+
+def _first_text(df, column, keys):
+    # First value per name that is not empty/'nan' once read as text
+    text = df[column].dropna().astype(str)
+    text = text[(text != '') & (text != 'nan')]
+    first = text.groupby(df.loc[text.index, 'Normalized_Name']).first()
+    return first.reindex(keys, fill_value='')
+
+def aggregate_entities(df):
+    """One row per Normalized_Name, with types, sources, QIDs, pages and files merged."""
+    groups = df.groupby('Normalized_Name')
+    counts = groups.size()
+    keys = counts.index
+    
+    pages = df[['Normalized_Name', 'Page_Numbers']].dropna()
+    pages['Page_Numbers'] = pages['Page_Numbers'].astype(str)
+    pages = pages[(pages['Page_Numbers'] != '') & (pages['Page_Numbers'] != 'nan')]
+    
+    return pd.DataFrame({
+        'Entity_Name': keys, # Use the normalized name
+        # Type: first non-empty
+        'Type': groups['Type'].first().reindex(keys).fillna('').values,
+        # Source: Join unique
+        'Source': _joined(df, 'Source', ' + ', keys).values,
+        # QID: Take first non-empty
+        'QID': _first_text(df, 'QID', keys).values,
+        # Page Numbers: Join unique
+        'Page_Numbers': _joined(pages, 'Page_Numbers', '; ', keys).values,
+        # Original File
+        'Original_Files': _joined(df, 'Original_File', '; ', keys).values,
+        'Original_Count': counts.values
+    })
+
+def merge_entity_groups(df):
+    # aggregate_entities' rows come in Normalized_Name order, like the groupby of the keys
+    merged = aggregate_entities(df)
+    merged.index = df.groupby('Normalized_Name')[KEY].first().values
+    return merged
+
+# One row per Normalized_Name, merged by aggregate_entities
+ENTITY_NAME = Policy(
+    name='entity-name',
+    key=lambda df: df['Normalized_Name'].fillna('').astype(str),
+    merge=merge_entity_groups,
+    columns=lambda cols: ['Entity_Name', 'Type', 'Source', 'QID', 'Page_Numbers', 'Original_Files', 'Original_Count'],
+    sort_by='Entity_Name',
+)
+
 def deduplicate_entities():
     base_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset'
     # Folder name seems to be 08-EntityMerge based on previous rename? 
@@ -41,61 +102,20 @@ def deduplicate_entities():
         
         # Apply mapping
         # Only apply to rows where Source is 'Index'
-        def normalize_name(row):
-            if row['Source'] == 'Index':
-                name = row['Entity_Name']
-                if name in index_to_manual:
-                    return index_to_manual[name]
-            return row['Entity_Name']
-            
-        df['Normalized_Name'] = df.apply(normalize_name, axis=1)
+        df['Normalized_Name'] = normalize_names(df, index_to_manual)
     else:
         print("Mapping file not found. Proceeding with exact string deduplication only.")
         df['Normalized_Name'] = df['Entity_Name']
 
     # 2. Aggregation Logic
-    # We group by 'Normalized_Name'
-    
-    def aggregate_group(group):
-        # Type: Prefer Manual Type (E21 Person etc), else take first non-empty
-        types = group['Type'].dropna().unique()
-        # Heuristic: If 'E21 Person' is in there, take it.
-        final_type = types[0] if len(types) > 0 else ''
-        
-        # Source: Join unique
-        sources = group['Source'].dropna().unique()
-        final_source = ' + '.join(sorted(sources))
-        
-        # QID: Take first non-empty
-        qids = group['QID'].dropna().astype(str)
-        qids = qids[qids != '']
-        qids = qids[qids != 'nan']
-        final_qid = qids.iloc[0] if len(qids) > 0 else ''
-        
-        # Page Numbers: Join unique
-        pages = group['Page_Numbers'].dropna().astype(str)
-        pages = pages[pages != '']
-        pages = pages[pages != 'nan']
-        # Split by comma if multiple pages in one cell?
-        # Simple join for now
-        final_pages = '; '.join(sorted(set(pages)))
-        
-        # Original File
-        files = group['Original_File'].dropna().unique()
-        final_files = '; '.join(sorted(files))
-        
-        return pd.Series({
-            'Entity_Name': group['Normalized_Name'].iloc[0], # Use the normalized name
-            'Type': final_type,
-            'Source': final_source,
-            'QID': final_qid,
-            'Page_Numbers': final_pages,
-            'Original_Files': final_files,
-            'Original_Count': len(group)
-        })
-
+    # We group by 'Normalized_Name'. The index next to the output keeps the previous
+    # run, so only the names touched by rows that changed since then are aggregated again.
     print("Deduplicating...")
-    deduped_df = df.groupby('Normalized_Name').apply(aggregate_group).reset_index(drop=True)
+    index = DedupIndex(index_path(output_csv), ENTITY_NAME)
+    stats = index.sync(df, source=os.path.basename(input_csv))
+    print(f"Dedup index: {describe(stats)}")
+    deduped_df = index.frame()
+    index.close()
     
     print(f"Deduplicated rows: {len(deduped_df)}")
     
@@ -1,7 +1,9 @@
-import pandas as pd
 import os
 import glob
 
+from shard_merge import check_reports, merge_shards
+from table_io import LLM_SHARD_SCHEMA
+
 def merge_recheck_files():
     base_dir = r'c:\Users\001\Desktop\Github-Project\PnPDataset'
     input_dir = os.path.join(base_dir, r'07-MML')
@@ -25,25 +27,13 @@ def merge_recheck_files():
         
     print(f"Found {len(csv_files)} files.")
     
-    all_dfs = []
-    for f in csv_files:
-        try:
-            # Try reading with utf-8-sig first, then gbk if fails
-            try:
-                df = pd.read_csv(f, encoding='utf-8-sig')
-            except UnicodeDecodeError:
-                df = pd.read_csv(f, encoding='gbk')
-                
-            all_dfs.append(df)
-            # print(f"  Loaded {os.path.basename(f)} ({len(df)} rows)")
-        except Exception as e:
-            print(f"  Error reading {os.path.basename(f)}: {e}")
+    # Shards are streamed in ID-range order (1-100, 101-200, ..., 1001-1100) with a fixed
+    # schema, each appended to the output as it is read; encodings are sniffed per file
+    reports = merge_shards(csv_files, output_csv, LLM_SHARD_SCHEMA)
+    check_reports(reports)
             
-    if all_dfs:
-        merged_df = pd.concat(all_dfs, ignore_index=True)
-        print(f"\nMerged total: {len(merged_df)} rows.")
-        
-        merged_df.to_csv(output_csv, index=False, encoding='utf-8-sig')
+    if reports:
+        print(f"\nMerged total: {sum(r.rows for r in reports)} rows from {len(reports)} files.")
         print(f"Saved merged file to: {output_csv}")
     else:
         print("No data merged.")
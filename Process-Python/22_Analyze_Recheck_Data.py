@@ -2,6 +2,8 @@ import pandas as pd
 import os
 import re
 
+from encoding_repair import read_csv_auto
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_file = os.path.join(base_dir, "08-Recheck", "01-Merged_Recheck.csv")
@@ -13,15 +15,12 @@ os.makedirs(os.path.dirname(output_report), exist_ok=True)
 def analyze_recheck_data():
     print(f"Loading data from {input_file}...")
     
-    # Try reading with different encodings
+    # Encoding is sniffed once from a byte sample, a single parse
     try:
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
-    except UnicodeDecodeError:
-        try:
-            df = pd.read_csv(input_file, encoding='gbk')
-        except Exception as e:
-            print(f"Error reading file: {e}")
-            return
+        df = read_csv_auto(input_file)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return
 
     print(f"Total rows loaded: {len(df)}")
     
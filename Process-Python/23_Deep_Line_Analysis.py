@@ -1,8 +1,9 @@
+import numpy as np
 import pandas as pd
 import re
 import os
-from collections import defaultdict
-import difflib
+from similarity import pair_scores
+from table_io import read_table, RECHECK_SCHEMA
 
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
@@ -10,76 +11,67 @@ input_file = os.path.join(base_dir, "08-Recheck", "01-Merged_Recheck.csv")
 output_report = os.path.join(base_dir, "Process-Python", "02-Analysis", "Deep_Line_Analysis_Report.txt")
 output_csv = os.path.join(base_dir, "Process-Python", "02-Analysis", "Deep_Analysis_Details.csv")
 
-# Ensure output directory exists
-os.makedirs(os.path.dirname(output_report), exist_ok=True)
+ROLE_WORDS = ['painter', 'artist', 'sculptor', 'architect']
+PLACE_WORDS = ['city', 'town', 'region', 'church', 'palace']
 
-def get_similarity(s1, s2):
-    return difflib.SequenceMatcher(None, str(s1).lower(), str(s2).lower()).ratio()
+def contains_any(text, words):
+    return text.str.contains("|".join(map(re.escape, words)))
 
-def analyze_line_by_line():
-    print(f"Loading data from {input_file}...")
-    try:
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
-    except:
-        df = pd.read_csv(input_file, encoding='gbk')
-
-    print(f"Processing {len(df)} rows...")
-
-    # Storage for findings
-    inconsistent_categories = defaultdict(set)
-    ocr_suspects = []
-    unstructured_notes = []
-    complex_notes = []
-    
+def analyze_frame(df):
+    """Adds Analysis_Tag, Similarity_Score and Issue_Flag to df; returns the report findings."""
     # New columns for detailed CSV
     df['Analysis_Tag'] = ''
     df['Similarity_Score'] = 0.0
     df['Issue_Flag'] = ''
 
-    for index, row in df.iterrows():
-        orig = str(row['Original_Entry']).strip()
-        refined = str(row['Refined_Formal_Name']).strip()
-        cat = str(row['Refined_Category']).strip()
-        note = str(row['Status/Notes']).strip()
-
-        # 1. Consistency Check
-        inconsistent_categories[refined].add(cat)
-
-        # 2. Similarity / OCR Check
-        sim_score = get_similarity(orig, refined)
-        df.at[index, 'Similarity_Score'] = round(sim_score, 2)
-        
-        # If similarity is low but not extremely low (which might indicate a complete rename/alias), flag it
-        # Low similarity + No "Disambiguation" or "Alias" in note -> Potential OCR mess or wrong match
-        if sim_score < 0.6 and sim_score > 0.1:
-            if "Disambiguation" not in note and "Nick" not in note and "alias" not in note.lower():
-                ocr_suspects.append({
-                    'Row': index + 1,
-                    'Original': orig,
-                    'Refined': refined,
-                    'Score': f"{sim_score:.2f}",
-                    'Note': note
-                })
-                df.at[index, 'Issue_Flag'] += 'Low_Similarity; '
-
-        # 3. Note Analysis
-        if pd.isna(row['Status/Notes']) or row['Status/Notes'] == 'nan':
-            df.at[index, 'Analysis_Tag'] = 'Missing_Note'
-        elif '[' in note and ']' in note:
-            # Extract tag
-            tag_match = re.search(r'\[(.*?)\]', note)
-            if tag_match:
-                df.at[index, 'Analysis_Tag'] = tag_match.group(1)
-        else:
-            # Unstructured
-            df.at[index, 'Analysis_Tag'] = 'Unstructured'
-            unstructured_notes.append(note)
-            
-            # Try to guess content
-            if any(x in note.lower() for x in ['painter', 'artist', 'sculptor', 'architect']):
-                df.at[index, 'Issue_Flag'] += 'Role_Description; '
-            elif any(x in note.lower() for x in ['city', 'town', 'region', 'church', 'palace']):
-                df.at[index, 'Issue_Flag'] += 'Place_Description; '
+    orig = df['Original_Entry'].map(str).str.strip()
+    refined = df['Refined_Formal_Name'].map(str).str.strip()
+    cat = df['Refined_Category'].map(str).str.strip()
+    note = df['Status/Notes'].map(str).str.strip()
+    note_lower = note.str.lower()
+
+    # 1. Consistency Check: categories seen per refined name, in order of appearance
+    inconsistent_categories = cat.groupby(refined, sort=False).unique()
+
+    # 2. Similarity / OCR Check (original vs refined for all rows in one batch)
+    sim_score = pd.Series(pair_scores(orig.tolist(), refined.tolist()), index=df.index)
+    df['Similarity_Score'] = sim_score.round(2)
+
+    # If similarity is low but not extremely low (which might indicate a complete rename/alias), flag it
+    # Low similarity + No "Disambiguation" or "Alias" in note -> Potential OCR mess or wrong match
+    known_alias = (note.str.contains("Disambiguation", regex=False) | note.str.contains("Nick", regex=False)
+                   | note_lower.str.contains("alias", regex=False))
+    low_similarity = (sim_score < 0.6) & (sim_score > 0.1) & ~known_alias
+    ocr_suspects = pd.DataFrame({
+        'Row': df.index + 1,
+        'Original': orig,
+        'Refined': refined,
+        'Score': sim_score.map("{:.2f}".format),
+        'Note': note,
+    })[low_similarity].to_dict('records')
+
+    # 3. Note Analysis
+    missing = df['Status/Notes'].isna() | (df['Status/Notes'] == 'nan')
+    bracketed = ~missing & note.str.contains("[", regex=False) & note.str.contains("]", regex=False)
+    unstructured = ~missing & ~bracketed
+    tag = note.str.extract(r'\[(.*?)\]', expand=False).fillna('')
+    df['Analysis_Tag'] = np.select([missing, bracketed, unstructured], ['Missing_Note', tag, 'Unstructured'], default='')
+    unstructured_notes = note[unstructured].tolist()
+
+    # Try to guess content of unstructured notes
+    role = unstructured & contains_any(note_lower, ROLE_WORDS)
+    place = unstructured & ~role & contains_any(note_lower, PLACE_WORDS)
+    df['Issue_Flag'] = (np.where(low_similarity, 'Low_Similarity; ', '')
+                        + np.where(role, 'Role_Description; ', np.where(place, 'Place_Description; ', '')))
+
+    return inconsistent_categories, ocr_suspects, unstructured_notes
+
+def analyze_line_by_line():
+    print(f"Loading data from {input_file}...")
+    df = read_table(input_file, RECHECK_SCHEMA)
+
+    print(f"Processing {len(df)} rows...")
+    inconsistent_categories, ocr_suspects, unstructured_notes = analyze_frame(df)
 
     # Generate Report
     report_lines = []
@@ -88,7 +80,7 @@ def analyze_line_by_line():
     report_lines.append("-" * 30)
 
     # Report 1: Inconsistent Categories
-    multi_cat_entities = {k: v for k, v in inconsistent_categories.items() if len(v) > 1}
+    multi_cat_entities = inconsistent_categories[inconsistent_categories.str.len() > 1].to_dict()
     report_lines.append(f"\n[1. Inconsistent Categories] (Same name, different categories)")
     report_lines.append(f"Found {len(multi_cat_entities)} entities with multiple categories.")
     for name, cats in list(multi_cat_entities.items())[:20]:
@@ -110,6 +102,7 @@ def analyze_line_by_line():
         report_lines.append(f"  - {n}")
 
     # Save Report
+    os.makedirs(os.path.dirname(output_report), exist_ok=True)
     with open(output_report, 'w', encoding='utf-8') as f:
         f.write('\n'.join(report_lines))
     
@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 
+from entity_clusters import load_clusters
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_file = os.path.join(base_dir, "08-Recheck", "01-Merged_Recheck.csv")
@@ -13,14 +15,17 @@ def list_all_duplicates():
     except:
         df = pd.read_csv(input_file, encoding='gbk')
 
-    # Find duplicates based on Refined_Formal_Name
-    dup_names = df[df.duplicated(subset=['Refined_Formal_Name'], keep=False)]['Refined_Formal_Name'].unique()
-    
+    # Duplicates are the clusters of more than one row (see entity_clusters). The recheck
+    # table has no QID column, so its rows are linked by normalized name: names that
+    # differ only in case, spacing or Unicode form are listed together
+    clusters = load_clusters(input_file, 'Refined_Formal_Name', df=df)
+    df = df.join(clusters[['Cluster_ID', 'Cluster_Size', 'Links']])
+
     # Filter and sort
-    dupes_df = df[df['Refined_Formal_Name'].isin(dup_names)].sort_values(by=['Refined_Formal_Name', 'Original_Entry'])
+    dupes_df = df[df['Cluster_Size'] > 1].sort_values(by=['Cluster_ID', 'Refined_Formal_Name', 'Original_Entry'])
     
     # Select columns for clear display
-    display_cols = ['Refined_Formal_Name', 'Refined_Category', 'Original_Entry', 'Status/Notes']
+    display_cols = ['Cluster_ID', 'Refined_Formal_Name', 'Refined_Category', 'Original_Entry', 'Status/Notes', 'Links']
     final_df = dupes_df[display_cols]
     
     # Save to CSV
@@ -36,13 +41,13 @@ def list_all_duplicates():
     pd.set_option('display.max_colwidth', 100)
     
     # Iterate and print formatted
-    current_group = ""
+    current_group = None
     for index, row in final_df.iterrows():
-        group = row['Refined_Formal_Name']
+        group = row['Cluster_ID']
         if group != current_group:
-            print(f"\n--- {group} ({row['Refined_Category']}) ---")
+            print(f"\n--- {row['Refined_Formal_Name']} ({row['Refined_Category']}) [cluster {group}: {row['Links']}] ---")
             current_group = group
-        print(f"  Original: {row['Original_Entry']:<50} | Note: {row['Status/Notes']}")
+        print(f"  Original: {row['Original_Entry']:<50} | Name: {row['Refined_Formal_Name']} | Note: {row['Status/Notes']}")
 
 if __name__ == "__main__":
     list_all_duplicates()
@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 
+from entity_clusters import cluster_summary, load_clusters
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_file = os.path.join(base_dir, "08-Recheck", "01-Merged_Recheck.csv")
@@ -12,43 +14,38 @@ def check_duplicates_by_name():
     except:
         df = pd.read_csv(input_file, encoding='gbk')
 
-    # 1. Count occurrences of each Refined_Formal_Name
-    name_counts = df['Refined_Formal_Name'].value_counts()
+    # 1. Cluster the rows by normalized Refined_Formal_Name (see entity_clusters; the
+    #    recheck table has no QID column for QID / alias links)
+    clusters = load_clusters(input_file, 'Refined_Formal_Name', df=df)
     
-    # 2. Filter for those appearing more than once
-    duplicate_names = name_counts[name_counts > 1]
+    # 2. Keep the clusters with more than one row, largest first
+    dupes_summary = cluster_summary(clusters).sort_values('Size', ascending=False, kind='stable').reset_index()
     
-    print(f"\n=== Duplicate Check Report (Based ONLY on Refined_Formal_Name) ===")
-    print(f"Total Unique Names: {len(name_counts)}")
-    print(f"Names with Duplicates: {len(duplicate_names)}")
-    print(f"Total Rows involved in Duplicates: {duplicate_names.sum()}")
+    print("\n=== Duplicate Check Report (Clusters over normalized Refined_Formal_Name) ===")
+    print(f"Total Clusters: {clusters['Cluster_ID'].nunique()}")
+    print(f"Clusters with Duplicates: {len(dupes_summary)}")
+    print(f"Total Rows involved in Duplicates: {dupes_summary['Size'].sum()}")
+    print(f"Clusters joining different names: {(dupes_summary['Names'].str.contains(' [|] ')).sum()}")
     print("-" * 60)
     
     # 3. Display the duplicates with their counts
-    print(f"{'Refined_Formal_Name':<50} | {'Count':<5}")
+    print(f"{'Refined_Formal_Name':<50} | {'Count':<5} | Links")
     print("-" * 60)
     
-    # Convert to dataframe for easier printing
-    dupes_summary = duplicate_names.reset_index()
-    dupes_summary.columns = ['Refined_Formal_Name', 'Count']
-    
     # Print top 50 most frequent duplicates
     for index, row in dupes_summary.head(50).iterrows():
-        print(f"{row['Refined_Formal_Name']:<50} | {row['Count']:<5}")
+        print(f"{row['Names']:<50} | {row['Size']:<5} | {row['Links']}")
     
     if len(dupes_summary) > 50:
         print(f"... and {len(dupes_summary) - 50} more.")
 
     # 4. (Optional) Show the detailed rows for the top 5 duplicates to illustrate
-    print("\n=== Detail View (Top 5 Duplicated Names) ===")
-    top_5_names = dupes_summary.head(5)['Refined_Formal_Name'].tolist()
-    details = df[df['Refined_Formal_Name'].isin(top_5_names)].sort_values('Refined_Formal_Name')
-    
-    for name in top_5_names:
-        print(f"\nName: {name}")
-        rows = details[details['Refined_Formal_Name'] == name]
+    print("\n=== Detail View (Top 5 Duplicate Clusters) ===")
+    for cluster_id, names in dupes_summary.head(5)[['Cluster_ID', 'Names']].itertuples(index=False):
+        print(f"\nCluster {cluster_id}: {names}")
+        rows = df[clusters['Cluster_ID'] == cluster_id]
         for idx, row in rows.iterrows():
-            print(f"  - Row {idx+1}: {row['Original_Entry']} (Category: {row['Refined_Category']})")
+            print(f"  - Row {idx+1}: {row['Original_Entry']} -> {row['Refined_Formal_Name']} (Category: {row['Refined_Category']})")
 
 if __name__ == "__main__":
     check_duplicates_by_name()
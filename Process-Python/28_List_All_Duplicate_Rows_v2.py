@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 
+from entity_clusters import load_clusters
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_file = os.path.join(base_dir, "08-Recheck", "01-Merged_Recheck.csv")
@@ -13,9 +15,11 @@ def list_all_duplicate_rows():
     except:
         df = pd.read_csv(input_file, encoding='gbk')
 
-    # Filter for duplicates based on Refined_Formal_Name
-    dup_mask = df.duplicated(subset=['Refined_Formal_Name'], keep=False)
-    dupes = df[dup_mask].sort_values(by=['Refined_Formal_Name', 'Original_Entry'])
+    # Duplicates are the clusters of more than one row, linked by normalized name
+    # (see entity_clusters; the recheck table has no QID column)
+    clusters = load_clusters(input_file, 'Refined_Formal_Name', df=df)
+    df = df.join(clusters[['Cluster_ID', 'Cluster_Size']])
+    dupes = df[df['Cluster_Size'] > 1].sort_values(by=['Cluster_ID', 'Refined_Formal_Name', 'Original_Entry'])
     
     if dupes.empty:
         print("No duplicates found.")
@@ -34,7 +38,7 @@ def list_all_duplicate_rows():
         f.write(separator)
         print(separator.strip())
         
-        current_name = ""
+        current_cluster = None
         for index, row in dupes.iterrows():
             name = str(row['Refined_Formal_Name'])
             original = str(row['Original_Entry'])
@@ -45,11 +49,11 @@ def list_all_duplicate_rows():
             display_original = original[:37] + "..." if len(original) > 37 else original
             display_note = note[:20] + "..." if len(note) > 20 else note
             
-            if row['Refined_Formal_Name'] != current_name:
-                if current_name != "":
+            if row['Cluster_ID'] != current_cluster:
+                if current_cluster is not None:
                     f.write(separator)
                     print(separator.strip())
-                current_name = row['Refined_Formal_Name']
+                current_cluster = row['Cluster_ID']
                 
             line = f"{display_name:<40} | {display_original:<40} | {display_note}\n"
             f.write(line)
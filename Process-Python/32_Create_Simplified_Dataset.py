@@ -1,6 +1,7 @@
-import pandas as pd
 import os
 
+from table_io import read_table, write_table, RECHECK_SCHEMA
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_dir = os.path.join(base_dir, "08-Data-Remerge")
@@ -9,10 +10,7 @@ output_file = os.path.join(input_dir, "03-Merged_Recheck_Simplified.csv")
 
 def create_simplified_dataset():
     print(f"Loading data from {input_file}...")
-    try:
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
-    except:
-        df = pd.read_csv(input_file, encoding='gbk')
+    df = read_table(input_file, RECHECK_SCHEMA)
 
     print(f"Original columns: {df.columns.tolist()}")
 
@@ -25,12 +23,12 @@ def create_simplified_dataset():
         print(f"Error: Missing columns {missing_cols}")
         return
 
-    df_simplified = df[cols_to_keep]
+    df_simplified = df[cols_to_keep].copy()
 
     print(f"Simplified dataset shape: {df_simplified.shape}")
     
     # Save
-    df_simplified.to_csv(output_file, index=False, encoding='utf-8-sig')
+    write_table(df_simplified, output_file, RECHECK_SCHEMA)
     print(f"Saved simplified dataset to {output_file}")
     print("\nFirst 5 rows:")
     print(df_simplified.head())
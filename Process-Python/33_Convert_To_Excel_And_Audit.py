@@ -1,7 +1,8 @@
-import pandas as pd
 import os
 import re
 
+from table_io import read_table, export_table, RECHECK_SCHEMA
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_dir = os.path.join(base_dir, "08-Data-Remerge")
@@ -12,11 +13,7 @@ output_file = os.path.join(input_dir, "03-Merged_Recheck_Simplified.xlsx")
 
 def check_and_convert():
     print(f"Loading data from {input_file}...")
-    try:
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
-    except:
-        print("UTF-8-SIG failed, trying GBK...")
-        df = pd.read_csv(input_file, encoding='gbk')
+    df = read_table(input_file, RECHECK_SCHEMA)
 
     print(f"Rows: {len(df)}")
     
@@ -55,11 +52,10 @@ def check_and_convert():
     else:
         print("\n[PASS] All rows have Refined_Formal_Name.")
 
-    # 3. Save as Excel
+    # 3. Save as Excel (export only; later stages read the columnar intermediate)
     print(f"\nConverting to Excel: {output_file}")
     try:
-        # Using xlsxwriter engine for better compatibility if available, else default
-        df.to_excel(output_file, index=False, engine='openpyxl')
+        export_table(df, output_file)
         print("Success! Excel file created.")
     except Exception as e:
         print(f"Error creating Excel file: {e}")
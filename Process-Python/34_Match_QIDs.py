@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 
+from table_io import read_table, write_table, RECHECK_SCHEMA
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 # Changed to CSV as XLSX seems missing or problematic
@@ -58,10 +60,7 @@ def load_handmade_mapping():
 def match_qids():
     # 1. Load Main Dataset
     print(f"Loading main dataset from {input_file}...")
-    try:
-        df = pd.read_csv(input_file, encoding='utf-8-sig')
-    except:
-        df = pd.read_csv(input_file, encoding='gbk')
+    df = read_table(input_file, RECHECK_SCHEMA)
         
     print(f"Rows: {len(df)}")
     
@@ -101,7 +100,8 @@ def match_qids():
     df = df[final_cols]
     
     print(f"Saving to {output_file}...")
-    df.to_excel(output_file, index=False)
+    # The .xlsx is the deliverable; 35/36 reload the columnar intermediate written beside it
+    write_table(df, output_file, RECHECK_SCHEMA)
     print("Done.")
 
 if __name__ == "__main__":
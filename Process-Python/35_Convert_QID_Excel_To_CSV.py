@@ -1,6 +1,7 @@
-import pandas as pd
 import os
 
+from table_io import read_table, write_table, columnar_path, RECHECK_SCHEMA
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_file = os.path.join(base_dir, "08-Data-Remerge", "04-Merged_Recheck_With_QID.xlsx")
@@ -9,17 +10,18 @@ output_file = os.path.join(base_dir, "08-Data-Remerge", "04-Merged_Recheck_With_
 def convert_excel_to_csv():
     print(f"Loading Excel file from {input_file}...")
     
-    if not os.path.exists(input_file):
+    if not os.path.exists(input_file) and not os.path.exists(columnar_path(input_file)):
         print(f"Error: Input file {input_file} not found.")
         return
 
     try:
-        df = pd.read_excel(input_file)
+        # Served from the columnar intermediate of 34 instead of re-parsing the workbook
+        df = read_table(input_file, RECHECK_SCHEMA)
         print(f"Successfully loaded {len(df)} rows.")
         
         print(f"Saving to CSV file at {output_file}...")
         # Use utf-8-sig for better compatibility with Excel when opening CSVs containing Chinese characters
-        df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        write_table(df, output_file, RECHECK_SCHEMA)
         print("Conversion complete.")
         
     except Exception as e:
@@ -1,6 +1,8 @@
 import pandas as pd
 import os
 
+from table_io import read_table, write_table, columnar_path, RECHECK_SCHEMA
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 # The user mentioned "01-Merged_Recheck_With_QID", but the file generated was 04.
@@ -11,22 +13,19 @@ output_file = os.path.join(base_dir, "08-Data-Remerge", "04-Merged_Recheck_With_
 def filter_qids():
     print(f"Looking for file: {input_file}")
     
-    if not os.path.exists(input_file):
+    if not os.path.exists(input_file) and not os.path.exists(columnar_path(input_file)):
         print(f"Error: File {input_file} not found.")
         # Fallback check
         fallback = os.path.join(base_dir, "08-Data-Remerge", "04-Merged_Recheck_With_QID.xlsx")
         if os.path.exists(fallback):
             print(f"Found .xlsx version instead. Loading {fallback}...")
-            df = pd.read_excel(fallback)
+            df = read_table(fallback, RECHECK_SCHEMA)
         else:
             print("Could not find input file.")
             return
     else:
         print(f"Loading {input_file}...")
-        try:
-            df = pd.read_csv(input_file, encoding='utf-8-sig')
-        except:
-            df = pd.read_csv(input_file, encoding='gbk')
+        df = read_table(input_file, RECHECK_SCHEMA)
 
     print(f"Original rows: {len(df)}")
     
@@ -58,7 +57,7 @@ def filter_qids():
 
     # Save
     print(f"Saving to {output_file}...")
-    df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    write_table(df, output_file, RECHECK_SCHEMA)
     print("Done.")
 
 if __name__ == "__main__":
@@ -1,13 +1,22 @@
+import re
+import numpy as np
 import pandas as pd
 import requests
-import time
-import os
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from http_cache import RateLimiter, get_cache
+from table_io import read_table, write_table, RECHECK_SCHEMA
 
 # Configuration
 INPUT_FILE = r"09-QID-Crosscheck/02-Merged_Recheck_With_QID_Cleaned.csv"
 OUTPUT_FILE = r"09-QID-Crosscheck/03-Merged_Recheck_QID_Verified.csv"
-CACHE_FILE = r"Process-Python/wikidata_cache.json"
+API_URL = "https://www.wikidata.org/w/api.php"
+BATCH_SIZE = 50   # wbgetentities accepts at most 50 IDs per call
+MAX_WORKERS = 2   # Concurrent API requests (chunks and searches share the pool)
+REQUESTS_PER_SECOND = 2.0  # Shared by all workers; the sequential version slept 0.5s per call
+MAXLAG = 5        # Seconds of replication lag at which the API asks bots to back off
+HEADERS = {'User-Agent': 'PnPDatasetBot/1.0'}
 
 # Category Rules (Allowed P31/P279 IDs or Keywords in description)
 # This is a simplified rule set for the script
@@ -20,32 +29,38 @@ CATEGORY_RULES = {
     "Concept": {"keywords": ["concept", "idea", "genre", "style"], "exclude": ["human"]}
 }
 
-# Load Cache
-if os.path.exists(CACHE_FILE):
-    with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-        api_cache = json.load(f)
-else:
-    api_cache = {}
+# Shared HTTP cache (see http_cache.py)
+api_cache = get_cache()
+LIMITER = RateLimiter(REQUESTS_PER_SECOND)
 
-def save_cache():
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(api_cache, f, ensure_ascii=False, indent=2)
+def make_session():
+    """One pooled session with retry/backoff shared by all worker threads."""
+    session = requests.Session()
+    # 429 is left to api_cache.get_json, which pauses every worker through LIMITER
+    retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504],
+                  respect_retry_after_header=True)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+SESSION = make_session()
 
 def get_wikidata_entities_batch(qids):
     """Fetch details for a list of QIDs (max 50)"""
     ids_str = "|".join(qids)
-    url = "https://www.wikidata.org/w/api.php"
+    # Only what verification reads: claims (the bulk of the payload) were never used
     params = {
         "action": "wbgetentities",
         "ids": ids_str,
         "format": "json",
-        "props": "labels|descriptions|claims|aliases",
-        "languages": "en"
+        "props": "labels|descriptions|aliases",
+        "languages": "en",
+        "maxlag": MAXLAG
     }
     
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
+        data = api_cache.get_json(API_URL, params, headers=HEADERS, session=SESSION, limiter=LIMITER) or {}
         return data.get("entities", {})
     except Exception as e:
         print(f"Error fetching batch: {e}")
@@ -53,24 +68,18 @@ def get_wikidata_entities_batch(qids):
 
 def search_wikidata(query):
     """Search for a query string"""
-    if query in api_cache:
-        return api_cache[query]
-        
-    url = "https://www.wikidata.org/w/api.php"
     params = {
         "action": "wbsearchentities",
         "search": query,
         "language": "en",
         "format": "json",
-        "limit": 5
+        "limit": 5,
+        "maxlag": MAXLAG
     }
     
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
-        results = data.get("search", [])
-        api_cache[query] = results
-        return results
+        data = api_cache.get_json(API_URL, params, headers=HEADERS, session=SESSION, limiter=LIMITER) or {}
+        return data.get("search", [])
     except Exception as e:
         print(f"Error searching {query}: {e}")
         return []
@@ -105,93 +114,110 @@ def check_category_match(category, wiki_desc, wiki_claims):
     # For strict verification, we might call it Unknown.
     return "Unknown"
 
-def process_verification(df):
-    print("Starting Verification Task...")
-    
-    # Prepare columns
+def init_verification_columns(df):
     df['Verify_Result'] = ""
     df['Verify_Reason'] = ""
     df['Wiki_Label_Found'] = ""
     df['Wiki_Description_Found'] = ""
+
+def category_status(categories, descriptions):
+    """check_category_match over aligned Series: one keyword regex per category instead of one call per row."""
+    main_cat = categories.astype(object).str.split('/').str[0].str.strip()
+    desc_lower = descriptions.astype(str).str.lower()
+    status = pd.Series("Unknown", index=categories.index, dtype=object)
+    for cat, rules in CATEGORY_RULES.items():
+        rows = main_cat == cat
+        if not rows.any():
+            continue
+        desc = desc_lower[rows]
+        # Exclusions win over keywords
+        conflict = desc.str.contains("|".join(map(re.escape, rules["exclude"])))
+        match = desc.str.contains("|".join(map(re.escape, rules["keywords"])))
+        status[rows] = np.where(conflict, "Conflict", np.where(match, "Match", "Unknown"))
+    return status
+
+def entity_table(entity_data):
+    """English label, description and aliases of fetched entities, one row per QID."""
+    records = []
+    for qid, entity in entity_data.items():
+        if not entity:
+            continue
+        records.append({
+            'QID': qid,
+            'label': entity.get('labels', {}).get('en', {}).get('value', ''),
+            'description': entity.get('descriptions', {}).get('en', {}).get('value', ''),
+            'aliases': [a['value'].lower() for a in entity.get('aliases', {}).get('en', [])]
+        })
+    return pd.DataFrame(records, columns=['QID', 'label', 'description', 'aliases']).set_index('QID')
+
+def process_verification(df, entity_data, indices=None):
+    """Verify the rows at `indices` (default: all) against already-fetched entity data."""
+    rows = df if indices is None else df.loc[indices]
     
-    # Get all QIDs to verify
-    qids_to_check = df[df['QID'].notna()]['QID'].unique().tolist()
-    qids_to_check = [q for q in qids_to_check if str(q).startswith('Q')]
+    qids = rows['QID']
+    has_qid = qids.notna() & qids.astype(str).str.startswith('Q')
+    df.loc[rows.index[~has_qid], 'Verify_Result'] = "Skipped"
+    rows = rows[has_qid]
     
-    print(f"Verifying {len(qids_to_check)} unique QIDs...")
+    entities = entity_table(entity_data)
+    found = rows['QID'].isin(entities.index)
+    missing = rows.index[~found]
+    df.loc[missing, 'Verify_Result'] = "Invalid"
+    df.loc[missing, 'Verify_Reason'] = "QID not found in Wikidata"
+    rows = rows[found]
+    if rows.empty:
+        return
     
-    # Batch process
-    batch_size = 50
-    entity_data = {}
+    # Extract Wiki Info
+    wiki_label = rows['QID'].map(entities['label'])
+    wiki_desc = rows['QID'].map(entities['description'])
+    df.loc[rows.index, 'Wiki_Label_Found'] = wiki_label
+    df.loc[rows.index, 'Wiki_Description_Found'] = wiki_desc
     
-    for i in range(0, len(qids_to_check), batch_size):
-        batch = qids_to_check[i:i+batch_size]
-        print(f"Fetching batch {i}/{len(qids_to_check)}...", end='\r')
-        results = get_wikidata_entities_batch(batch)
-        entity_data.update(results)
-        time.sleep(0.5) # Polite delay
-        
-    print("\nBatch fetch complete. Processing rows...")
+    # 1. Name Check (aliases are joined as (QID, alias) pairs)
+    local_name = rows['Refined_Formal_Name'].map(str).str.strip().str.lower()
+    wiki_label_lower = wiki_label.str.lower()
+    alias_pairs = entities['aliases'].explode().dropna()
+    alias_keys = pd.MultiIndex.from_arrays([alias_pairs.index, alias_pairs.values])
+    is_alias = pd.MultiIndex.from_arrays([rows['QID'], local_name]).isin(alias_keys)
+    is_match = (local_name == wiki_label_lower) | is_alias
+    is_partial = np.array([a in b or b in a for a, b in zip(local_name, wiki_label_lower)], dtype=bool)
+    name_status = pd.Series(np.where(is_match, "Match", np.where(is_partial, "Partial", "Mismatch")),
+                            index=rows.index)
     
-    for idx, row in df.iterrows():
-        qid = row['QID']
-        if pd.isna(qid) or not str(qid).startswith('Q'):
-            df.at[idx, 'Verify_Result'] = "Skipped"
-            continue
-            
-        entity = entity_data.get(qid)
-        if not entity:
-            df.at[idx, 'Verify_Result'] = "Invalid"
-            df.at[idx, 'Verify_Reason'] = "QID not found in Wikidata"
-            continue
-            
-        # Extract Wiki Info
-        labels = entity.get('labels', {})
-        wiki_label = labels.get('en', {}).get('value', '')
-        descriptions = entity.get('descriptions', {})
-        wiki_desc = descriptions.get('en', {}).get('value', '')
-        aliases = [a['value'] for a in entity.get('aliases', {}).get('en', [])]
-        
-        df.at[idx, 'Wiki_Label_Found'] = wiki_label
-        df.at[idx, 'Wiki_Description_Found'] = wiki_desc
-        
-        # 1. Name Check
-        local_name = str(row['Refined_Formal_Name']).strip().lower()
-        wiki_label_lower = wiki_label.lower()
-        aliases_lower = [a.lower() for a in aliases]
-        
-        name_status = "Mismatch"
-        if local_name == wiki_label_lower or local_name in aliases_lower:
-            name_status = "Match"
-        elif local_name in wiki_label_lower or wiki_label_lower in local_name:
-            name_status = "Partial"
-            
-        # 2. Category Check
-        cat_status = check_category_match(row['Refined_Category'], wiki_desc, [])
-        
-        # 3. Final Verdict
-        if name_status == "Match" and cat_status == "Match":
-            df.at[idx, 'Verify_Result'] = "Valid"
-            df.at[idx, 'Verify_Reason'] = f"Exact name match + Category match ({wiki_desc})"
-        elif name_status == "Match" and cat_status == "Conflict":
-            df.at[idx, 'Verify_Result'] = "Invalid"
-            df.at[idx, 'Verify_Reason'] = f"Name match but Category conflict (Expected {row['Refined_Category']}, got {wiki_desc})"
-        elif name_status == "Match":
-            df.at[idx, 'Verify_Result'] = "Review"
-            df.at[idx, 'Verify_Reason'] = f"Name match but Category unknown/neutral ({wiki_desc})"
-        elif name_status == "Partial" and cat_status == "Match":
-            df.at[idx, 'Verify_Result'] = "Review"
-            df.at[idx, 'Verify_Reason'] = f"Partial name match + Category match"
-        elif name_status == "Mismatch":
-            df.at[idx, 'Verify_Result'] = "Invalid"
-            df.at[idx, 'Verify_Reason'] = f"Name mismatch (Wiki: {wiki_label})"
-        else:
-            df.at[idx, 'Verify_Result'] = "Review"
-            df.at[idx, 'Verify_Reason'] = f"Complex case: Name {name_status}, Cat {cat_status}"
-
-def process_enrichment(df):
-    print("Starting Enrichment Task...")
+    # 2. Category Check
+    cat_status = category_status(rows['Refined_Category'], wiki_desc)
     
+    # 3. Final Verdict
+    name_match = name_status == "Match"
+    cases = [
+        name_match & (cat_status == "Match"),
+        name_match & (cat_status == "Conflict"),
+        name_match,
+        (name_status == "Partial") & (cat_status == "Match"),
+        name_status == "Mismatch",
+    ]
+    results = ["Valid", "Invalid", "Review", "Review", "Invalid"]
+    reasons = [
+        "Exact name match + Category match (" + wiki_desc + ")",
+        "Name match but Category conflict (Expected " + rows['Refined_Category'].astype(str) + ", got " + wiki_desc + ")",
+        "Name match but Category unknown/neutral (" + wiki_desc + ")",
+        "Partial name match + Category match",
+        "Name mismatch (Wiki: " + wiki_label + ")",
+    ]
+    df.loc[rows.index, 'Verify_Result'] = np.select(cases, results, default="Review")
+    df.loc[rows.index, 'Verify_Reason'] = np.select(
+        cases, reasons, default="Complex case: Name " + name_status + ", Cat " + cat_status)
+
+def enrichment_name(df, idx):
+    """Search key for a row, or None if the row has no usable name."""
+    name = str(df.at[idx, 'Refined_Formal_Name']).strip()
+    if not name or name == "nan":
+        return None
+    return name
+
+def process_enrichment(df, search_results):
+    """Pick suggested QIDs for rows needing enrichment from pre-fetched search results (name -> results)."""
     df['Suggested_QID'] = ""
     df['Enrich_Reason'] = ""
     
@@ -201,20 +227,14 @@ def process_enrichment(df):
     
     print(f"Enriching {len(indices)} rows...")
     
-    count = 0
     for idx in indices:
-        count += 1
-        if count % 10 == 0:
-            print(f"Processed {count}/{len(indices)}...", end='\r')
-            save_cache() # Save periodically
-            
-        name = str(df.at[idx, 'Refined_Formal_Name']).strip()
+        name = enrichment_name(df, idx)
         category = df.at[idx, 'Refined_Category']
         
-        if not name or name == "nan":
+        if name is None:
             continue
             
-        results = search_wikidata(name)
+        results = search_results.get(name, [])
         if not results:
             df.at[idx, 'Enrich_Reason'] = "No search results"
             continue
@@ -248,21 +268,61 @@ def process_enrichment(df):
             # If we didn't find a perfect match, list top candidates
             df.at[idx, 'Enrich_Reason'] = "Candidates: " + "; ".join(candidates[:3])
 
-    print("\nEnrichment complete.")
+    print("Enrichment complete.")
+
+def run_pipeline(df):
+    """
+    Verify and enrich in one pass over a shared worker pool.
+    Searches for rows without a QID start immediately, alongside the wbgetentities
+    chunks; rows that a finished chunk marks Invalid queue their search right away.
+    """
+    init_verification_columns(df)
+    
+    # Get all QIDs to verify
+    qids_to_check = df[df['QID'].notna()]['QID'].unique().tolist()
+    qids_to_check = [q for q in qids_to_check if str(q).startswith('Q')]
+    chunks = [qids_to_check[i:i+BATCH_SIZE] for i in range(0, len(qids_to_check), BATCH_SIZE)]
+    
+    print(f"Verifying {len(qids_to_check)} unique QIDs in {len(chunks)} chunks...")
+    
+    search_futures = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        def queue_searches(indices):
+            for idx in indices:
+                name = enrichment_name(df, idx)
+                if name is not None and name not in search_futures:
+                    search_futures[name] = pool.submit(search_wikidata, name)
+        
+        chunk_futures = {pool.submit(get_wikidata_entities_batch, chunk): chunk for chunk in chunks}
+        queue_searches(df.index[df['QID'].isna()])
+        
+        # Rows whose QID is missing or not a Q-id never reach a chunk
+        unchecked = df['QID'].isna() | ~df['QID'].astype(str).str.startswith('Q')
+        process_verification(df, {}, df.index[unchecked])
+        
+        done = 0
+        for future in as_completed(chunk_futures):
+            chunk_qids = chunk_futures[future]
+            indices = df.index[df['QID'].isin(chunk_qids)]
+            process_verification(df, future.result(), indices)
+            queue_searches(indices[df.loc[indices, 'Verify_Result'] == "Invalid"])
+            done += 1
+            print(f"Verified chunk {done}/{len(chunks)} | Searches queued: {len(search_futures)}...", end='\r')
+        
+        print(f"\nVerification complete. Waiting for {len(search_futures)} searches...")
+        search_results = {name: future.result() for name, future in search_futures.items()}
+    
+    process_enrichment(df, search_results)
 
 def main():
     print(f"Loading {INPUT_FILE}...")
-    try:
-        df = pd.read_csv(INPUT_FILE)
-    except:
-        df = pd.read_csv(INPUT_FILE, encoding='gbk') # Fallback
+    df = read_table(INPUT_FILE, RECHECK_SCHEMA)
         
-    process_verification(df)
-    process_enrichment(df)
+    run_pipeline(df)
     
     print(f"Saving to {OUTPUT_FILE}...")
-    df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
-    save_cache()
+    write_table(df, OUTPUT_FILE, RECHECK_SCHEMA)
+    print(api_cache.summary())
     print("Done.")
 
 if __name__ == "__main__":
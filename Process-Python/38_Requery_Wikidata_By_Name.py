@@ -1,14 +1,10 @@
 import pandas as pd
-import requests
-import json
-import os
-import time
+from http_cache import get_cache
 from difflib import SequenceMatcher
 
 # Configuration
 INPUT_FILE = r"09-QID-Crosscheck/02-Merged_Recheck_With_QID_Cleaned.csv"
 OUTPUT_FILE = r"09-QID-Crosscheck/03-Requery_Results.csv"
-CACHE_FILE = r"Process-Python/wikidata_search_cache.json"
 
 # Category Rules for filtering/ranking
 CATEGORY_RULES = {
@@ -20,26 +16,11 @@ CATEGORY_RULES = {
     "Concept": {"keywords": ["concept", "idea", "genre", "style"], "exclude": ["human"]}
 }
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_cache(cache):
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
 def search_wikidata(query, cache):
     if not query or pd.isna(query):
         return []
     
     query = str(query).strip()
-    if query in cache:
-        return cache[query]
         
     url = "https://www.wikidata.org/w/api.php"
     params = {
@@ -53,13 +34,10 @@ def search_wikidata(query, cache):
     try:
         # User-Agent is good practice
         headers = {'User-Agent': 'PnPDatasetBot/1.0'}
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get("search", [])
-            cache[query] = results
-            time.sleep(0.5) # Rate limiting
-            return results
+        # Rate limiting sleep only applies to network fetches, not cache hits
+        data = cache.get_json(url, params, headers=headers, timeout=10, delay=0.5)
+        if data is not None:
+            return data.get("search", [])
     except Exception as e:
         print(f"Error searching '{query}': {e}")
     
@@ -157,8 +135,7 @@ def main():
     except:
         df = pd.read_csv(INPUT_FILE, encoding='gbk')
         
-    cache = load_cache()
-    print(f"Loaded cache with {len(cache)} entries.")
+    cache = get_cache()
     
     print("Starting Wikidata Query...")
     
@@ -172,8 +149,6 @@ def main():
     for idx, row in df.iterrows():
         if idx % 10 == 0:
             print(f"Processing {idx}/{total}...", end='\r')
-            if idx % 50 == 0:
-                save_cache(cache)
                 
         name = row['Refined_Formal_Name']
         category = row['Refined_Category']
@@ -190,8 +165,8 @@ def main():
         df.at[idx, 'Query_Description'] = desc
         df.at[idx, 'Query_Logic'] = logic
         
-    save_cache(cache)
-    print(f"\nSaving results to {OUTPUT_FILE}...")
+    print(f"\n{cache.summary()}")
+    print(f"Saving results to {OUTPUT_FILE}...")
     df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
     print("Done.")
 
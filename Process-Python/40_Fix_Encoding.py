@@ -1,21 +1,19 @@
-import pandas as pd
 import os
 
+from encoding_repair import repair_file
+
 input_file = r"09-QID-Crosscheck/03-Requery_Results.csv"
 
 def fix_encoding():
-    print(f"Reading {input_file} with GBK encoding...")
-    try:
-        df = pd.read_csv(input_file, encoding='gbk')
-    except Exception as e:
-        print(f"Failed to read with GBK: {e}")
+    # Encoding is sniffed once (cached by the hash of the sampled bytes) instead of assuming GBK; mojibake
+    # cells are repaired in a streaming pass and the file is saved as UTF-8-SIG
+    print(f"Repairing {input_file}...")
+    if not os.path.exists(input_file):
+        print(f"File not found: {input_file}")
         return
 
-    print("Headers found:")
-    print(df.columns.tolist())
-    
-    print("Saving with UTF-8-SIG encoding...")
-    df.to_csv(input_file, index=False, encoding='utf-8-sig')
+    encoding, changed = repair_file(input_file)
+    print(f"Read as {encoding}, repaired {changed} cells.")
     print("Done.")
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
-import pandas as pd
 import os
 
+from encoding_repair import read_csv_auto
+
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 input_file_02 = os.path.join(base_dir, "09-QID-Crosscheck", "02-Merged_Recheck_With_QID_Cleaned.csv")
@@ -12,18 +13,12 @@ def fix_encoding_issues():
     
     # 1. Load the clean source (02) which we know has correct characters like 'č'
     print(f"Loading source file: {input_file_02}")
-    try:
-        df_source = pd.read_csv(input_file_02, encoding='utf-8-sig')
-    except:
-        print("Warning: Could not read source with utf-8-sig, trying utf-8")
-        df_source = pd.read_csv(input_file_02, encoding='utf-8')
+    df_source = read_csv_auto(input_file_02)
         
-    # 2. Load the results file (03) which has the query results but might have garbled names
+    # 2. Load the results file (03) which has the query results but might have garbled names;
+    # recoverable mojibake ("Orl谷ans") is repaired cell by cell while loading
     print(f"Loading results file: {input_file_03}")
-    try:
-        df_results = pd.read_csv(input_file_03, encoding='utf-8-sig')
-    except:
-        df_results = pd.read_csv(input_file_03, encoding='gbk') # It might have been saved as GBK/UTF-8 mixed
+    df_results = read_csv_auto(input_file_03, repair=True)
 
     print(f"Source rows: {len(df_source)}")
     print(f"Result rows: {len(df_results)}")
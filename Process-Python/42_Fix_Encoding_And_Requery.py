@@ -1,15 +1,13 @@
 import pandas as pd
-import requests
-import json
+from http_cache import get_cache
+from encoding_repair import read_csv_auto
 import os
-import time
 from difflib import SequenceMatcher
 
 # Configuration
 BASE_DIR = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 SOURCE_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "02-Merged_Recheck_With_QID_Cleaned.csv")
 TARGET_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "03-Requery_Results.csv")
-CACHE_FILE = r"Process-Python/wikidata_search_cache.json"
 
 # Category Rules (Same as before)
 CATEGORY_RULES = {
@@ -21,26 +19,11 @@ CATEGORY_RULES = {
     "Concept": {"keywords": ["concept", "idea", "genre", "style"], "exclude": ["human"]}
 }
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_cache(cache):
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
 def search_wikidata(query, cache):
     if not query or pd.isna(query):
         return []
     
     query = str(query).strip()
-    if query in cache:
-        return cache[query]
         
     url = "https://www.wikidata.org/w/api.php"
     params = {
@@ -53,13 +36,9 @@ def search_wikidata(query, cache):
     
     try:
         headers = {'User-Agent': 'PnPDatasetBot/1.0'}
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get("search", [])
-            cache[query] = results
-            time.sleep(0.5)
-            return results
+        data = cache.get_json(url, params, headers=headers, timeout=10, delay=0.5)
+        if data is not None:
+            return data.get("search", [])
     except Exception as e:
         print(f"Error searching '{query}': {e}")
     
@@ -118,19 +97,12 @@ def analyze_results(name, category, results):
 
 def fix_and_requery():
     print("Step 1: Loading clean source data...")
-    try:
-        df_source = pd.read_csv(SOURCE_FILE, encoding='utf-8-sig')
-    except:
-        df_source = pd.read_csv(SOURCE_FILE, encoding='utf-8')
+    df_source = read_csv_auto(SOURCE_FILE)
 
     print("Step 2: Loading existing results (potentially corrupted)...")
-    try:
-        df_target = pd.read_csv(TARGET_FILE, encoding='utf-8-sig')
-    except:
-        try:
-            df_target = pd.read_csv(TARGET_FILE, encoding='gbk')
-        except:
-            df_target = pd.read_csv(TARGET_FILE, encoding='utf-8')
+    # Recoverable mojibake is repaired on load, so only names that lost characters
+    # (e.g. "Pore?") still differ from the source and get re-queried
+    df_target = read_csv_auto(TARGET_FILE, repair=True)
 
     # Ensure row counts match
     if len(df_source) != len(df_target):
@@ -155,7 +127,7 @@ def fix_and_requery():
     # Criteria: Logic is "No results found" AND Name contains non-ASCII characters (likely encoding issues)
     # Or simply: Logic is "No results found" and the name in Target differed from Source (meaning it was corrupted)
     
-    cache = load_cache()
+    cache = get_cache()
     requery_count = 0
     
     print("Step 4: Checking for rows to re-query...")
@@ -185,7 +157,7 @@ def fix_and_requery():
                     print(f"Re-queried {requery_count} rows...", end='\r')
 
     print(f"\nTotal rows re-queried: {requery_count}")
-    save_cache(cache)
+    print(cache.summary())
 
     # Step 5: Save back to the original target file location
     print(f"Step 5: Saving fixed dataset to {TARGET_FILE}...")
@@ -1,16 +1,13 @@
 import pandas as pd
-import requests
-import json
+from http_cache import get_cache
 import os
-import time
 import re
-from difflib import SequenceMatcher
+from similarity import similarity_matrix
 
 # Configuration
 BASE_DIR = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 INPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "03-Requery_Results.csv")
 OUTPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "03-Requery_Results_Advanced.csv")
-CACHE_FILE = r"Process-Python/wikidata_advanced_cache.json"
 
 # Category Rules (Same as before)
 CATEGORY_RULES = {
@@ -22,19 +19,6 @@ CATEGORY_RULES = {
     "Concept": {"keywords": ["concept", "idea", "genre", "style"], "exclude": ["human"]}
 }
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_cache(cache):
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
 def analyze_name_structure(name):
     """
     Analyzes the name structure and returns a list of search candidates.
@@ -87,9 +71,6 @@ def analyze_name_structure(name):
     return unique_candidates
 
 def search_wikidata(query, cache):
-    if query in cache:
-        return cache[query]
-        
     url = "https://www.wikidata.org/w/api.php"
     params = {
         "action": "wbsearchentities",
@@ -101,13 +82,9 @@ def search_wikidata(query, cache):
     
     try:
         headers = {'User-Agent': 'PnPDatasetBot/1.0'}
-        response = requests.get(url, params=params, headers=headers, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get("search", [])
-            cache[query] = results
-            time.sleep(0.2)
-            return results
+        data = cache.get_json(url, params, headers=headers, timeout=5, delay=0.2)
+        if data is not None:
+            return data.get("search", [])
     except Exception as e:
         print(f"Error searching Wikidata '{query}': {e}")
     
@@ -117,10 +94,6 @@ def search_wikipedia(query, cache):
     """
     Search Wikipedia for a page and get its Wikibase Item (QID).
     """
-    cache_key = f"WIKI:{query}"
-    if cache_key in cache:
-        return cache[cache_key]
-        
     # 1. Search for the page title
     search_url = "https://en.wikipedia.org/w/api.php"
     search_params = {
@@ -133,12 +106,8 @@ def search_wikipedia(query, cache):
     
     try:
         headers = {'User-Agent': 'PnPDatasetBot/1.0'}
-        resp = requests.get(search_url, params=search_params, headers=headers, timeout=5)
-        if resp.status_code != 200: return []
-        
-        data = resp.json()
+        data = cache.get_json(search_url, search_params, headers=headers, timeout=5, delay=0.2)
         if not data or len(data) < 2 or not data[1]:
-            cache[cache_key] = []
             return []
             
         page_title = data[1][0]
@@ -152,8 +121,7 @@ def search_wikipedia(query, cache):
             "format": "json"
         }
         
-        resp_prop = requests.get(search_url, params=prop_params, headers=headers, timeout=5)
-        prop_data = resp_prop.json()
+        prop_data = cache.get_json(search_url, prop_params, headers=headers, timeout=5, delay=0.2) or {}
         
         pages = prop_data.get("query", {}).get("pages", {})
         results = []
@@ -169,8 +137,6 @@ def search_wikipedia(query, cache):
                     "source": "Wikipedia"
                 })
                 
-        cache[cache_key] = results
-        time.sleep(0.2)
         return results
         
     except Exception as e:
@@ -189,11 +155,10 @@ def check_category_match(category, wiki_desc):
         if kw in desc_lower: return "Match"
     return "Neutral"
 
-def evaluate_match(name, category, result):
-    res_label = result.get('label', '')
+def evaluate_match(name, category, result, sim):
+    """Scores one search result; `sim` is the name/label similarity from similarity_matrix."""
     res_desc = result.get('description', '')
     
-    sim = SequenceMatcher(None, name.lower(), res_label.lower()).ratio()
     cat_status = check_category_match(category, res_desc)
     
     score = sim * 100
@@ -213,7 +178,7 @@ def process_advanced_search():
     except:
         df = pd.read_csv(INPUT_FILE, encoding='gbk')
         
-    cache = load_cache()
+    cache = get_cache()
     
     # Filter rows where Second-Query_QID is empty
     # Note: It might be NaN or empty string
@@ -249,9 +214,10 @@ def process_advanced_search():
             if not all_results:
                 continue
                 
-            # Evaluate results for this candidate
-            for res in all_results:
-                score, cat_status = evaluate_match(cand, category, res)
+            # Evaluate results for this candidate (all label similarities in one batch)
+            sims = similarity_matrix([cand], [res.get('label', '') for res in all_results])[0]
+            for res, sim in zip(all_results, sims):
+                score, cat_status = evaluate_match(cand, category, res, sim)
                 
                 # If we are matching a simplified name (e.g. "Poussin" from "Title (Poussin)"), 
                 # we must be careful. The category must match strictly.
@@ -278,11 +244,9 @@ def process_advanced_search():
         processed_count += 1
         if processed_count % 10 == 0:
             print(f"Processed {processed_count}/{len(target_indices)} | Found: {found_count}...", end='\r')
-            if processed_count % 50 == 0:
-                save_cache(cache)
                 
     print(f"\nProcessing complete. Found {found_count} new matches.")
-    save_cache(cache)
+    print(cache.summary())
     
     print(f"Saving to {OUTPUT_FILE}...")
     df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
@@ -1,8 +1,6 @@
 import pandas as pd
-import requests
-import json
+from http_cache import get_cache
 import os
-import time
 import re
 from difflib import SequenceMatcher
 
@@ -10,7 +8,6 @@ from difflib import SequenceMatcher
 BASE_DIR = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 INPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "05-Missing_QID_Report.csv")
 OUTPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "05-Missing_QID_Report_Filled.csv")
-CACHE_FILE = r"Process-Python/wikipedia_smart_cache.json"
 
 # Context Mapping (Chinese -> English Suffix)
 CONTEXT_MAP = {
@@ -43,19 +40,6 @@ CONTEXT_MAP = {
     "神话": "mythology"
 }
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_cache(cache):
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
 def get_context_from_notes(notes):
     if pd.isna(notes):
         return []
@@ -73,9 +57,6 @@ def search_wikipedia_smart(query, cache):
     """
     Search Wikipedia using the query. Returns list of {id, label, description}.
     """
-    if query in cache:
-        return cache[query]
-        
     url = "https://en.wikipedia.org/w/api.php"
     
     # 1. Try Opensearch first (good for exact titles)
@@ -88,16 +69,15 @@ def search_wikipedia_smart(query, cache):
     }
     
     results = []
+    headers = {'User-Agent': 'PnPDatasetBot/1.0'}
     try:
-        headers = {'User-Agent': 'PnPDatasetBot/1.0'}
-        resp = requests.get(url, params=params, headers=headers, timeout=5)
-        if resp.status_code == 200:
-            data = resp.json()
-            if data and len(data) > 1:
+        data = cache.get_json(url, params, headers=headers, timeout=5, delay=0.5)
+        if data:
+            if len(data) > 1:
                 titles = data[1]
                 for title in titles:
                     # Get QID for this title
-                    qid = get_qid_from_title(title, headers)
+                    qid = get_qid_from_title(title, headers, cache)
                     if qid:
                         results.append({
                             "id": qid,
@@ -118,13 +98,12 @@ def search_wikipedia_smart(query, cache):
             "format": "json"
         }
         try:
-            resp = requests.get(url, params=params_sr, headers=headers, timeout=5)
-            if resp.status_code == 200:
-                data = resp.json()
+            data = cache.get_json(url, params_sr, headers=headers, timeout=5, delay=0.5)
+            if data is not None:
                 search_items = data.get("query", {}).get("search", [])
                 for item in search_items:
                     title = item["title"]
-                    qid = get_qid_from_title(title, headers)
+                    qid = get_qid_from_title(title, headers, cache)
                     if qid:
                         results.append({
                             "id": qid,
@@ -135,11 +114,9 @@ def search_wikipedia_smart(query, cache):
         except Exception as e:
             print(f"Error in srsearch '{query}': {e}")
 
-    cache[query] = results
-    time.sleep(0.5)
     return results
 
-def get_qid_from_title(title, headers):
+def get_qid_from_title(title, headers, cache):
     url = "https://en.wikipedia.org/w/api.php"
     params = {
         "action": "query",
@@ -149,8 +126,7 @@ def get_qid_from_title(title, headers):
         "format": "json"
     }
     try:
-        resp = requests.get(url, params=params, headers=headers, timeout=5)
-        data = resp.json()
+        data = cache.get_json(url, params, headers=headers, timeout=5) or {}
         pages = data.get("query", {}).get("pages", {})
         for _, page in pages.items():
             if "pageprops" in page and "wikibase_item" in page["pageprops"]:
@@ -166,7 +142,7 @@ def process_smart_search():
     except:
         df = pd.read_csv(INPUT_FILE, encoding='gbk')
         
-    cache = load_cache()
+    cache = get_cache()
     
     print(f"Processing {len(df)} rows...")
     
@@ -241,11 +217,8 @@ def process_smart_search():
             found_count += 1
             print(f"Found: {name} -> {best_res['label']} ({best_res['id']})")
             
-        if idx % 10 == 0:
-            save_cache(cache)
-            
     print(f"\nSmart search complete. Found {found_count} new matches.")
-    save_cache(cache)
+    print(cache.summary())
     
     print(f"Saving to {OUTPUT_FILE}...")
     df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
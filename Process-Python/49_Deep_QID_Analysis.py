@@ -1,6 +1,5 @@
 import pandas as pd
-import requests
-import json
+from http_cache import get_cache
 import os
 import time
 import re
@@ -10,7 +9,6 @@ from difflib import SequenceMatcher
 BASE_DIR = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 INPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "05-Missing_QID_Report_Filled.csv")
 OUTPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "06-Deep_Analysis_Results.csv")
-CACHE_FILE = r"Process-Python/wikidata_deep_cache.json"
 
 # Headers for requests
 HEADERS = {
@@ -18,29 +16,12 @@ HEADERS = {
     'Accept-Encoding': 'gzip, deflate'
 }
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_cache(cache):
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
-CACHE = load_cache()
+CACHE = get_cache()
 
 def search_wikidata(query, language='en'):
     """
     Search Wikidata for a query string.
     """
-    cache_key = f"wd_{query}_{language}"
-    if cache_key in CACHE:
-        return CACHE[cache_key]
-
     url = "https://www.wikidata.org/w/api.php"
     params = {
         "action": "wbsearchentities",
@@ -51,12 +32,9 @@ def search_wikidata(query, language='en'):
     }
     
     try:
-        resp = requests.get(url, params=params, headers=HEADERS, timeout=5)
-        if resp.status_code == 200:
-            data = resp.json()
-            results = data.get("search", [])
-            CACHE[cache_key] = results
-            return results
+        data = CACHE.get_json(url, params, headers=HEADERS, timeout=5)
+        if data is not None:
+            return data.get("search", [])
     except Exception as e:
         print(f"Error searching Wikidata for {query}: {e}")
         time.sleep(1)
@@ -238,10 +216,8 @@ def main():
                 print(f"    FOUND: {qid} - {label}")
         
         processed += 1
-        if processed % 10 == 0:
-            save_cache(CACHE)
             
-    save_cache(CACHE)
+    print(CACHE.summary())
     
     # Save results
     df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
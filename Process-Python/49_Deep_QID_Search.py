@@ -1,8 +1,6 @@
 import pandas as pd
-import requests
-import json
+from http_cache import get_cache
 import os
-import time
 import re
 from difflib import SequenceMatcher
 
@@ -10,7 +8,6 @@ from difflib import SequenceMatcher
 BASE_DIR = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
 INPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "05-Missing_QID_Report_Filled.csv")
 OUTPUT_FILE = os.path.join(BASE_DIR, "09-QID-Crosscheck", "06-Deep_Query_Results.csv")
-CACHE_FILE = r"Process-Python/wikidata_deep_cache.json"
 
 # Context Mapping (Chinese -> English Keywords)
 NOTE_KEYWORDS = {
@@ -38,19 +35,6 @@ NOTE_KEYWORDS = {
     "即": ["is", "same as"]
 }
 
-def load_cache():
-    if os.path.exists(CACHE_FILE):
-        try:
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    return {}
-
-def save_cache(cache):
-    with open(CACHE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
-
 def clean_name(name):
     # Remove text in parentheses
     name = re.sub(r'\s*\(.*?\)', '', name)
@@ -141,9 +125,6 @@ def generate_deep_queries(row):
     return unique_queries
 
 def search_wikidata(query, cache):
-    if query in cache:
-        return cache[query]
-        
     url = "https://www.wikidata.org/w/api.php"
     params = {
         "action": "wbsearchentities",
@@ -155,13 +136,9 @@ def search_wikidata(query, cache):
     
     try:
         headers = {'User-Agent': 'PnPDatasetBot/1.0'}
-        response = requests.get(url, params=params, headers=headers, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get("search", [])
-            cache[query] = results
-            time.sleep(0.2)
-            return results
+        data = cache.get_json(url, params, headers=headers, timeout=5, delay=0.2)
+        if data is not None:
+            return data.get("search", [])
     except Exception as e:
         print(f"Error searching '{query}': {e}")
     
@@ -198,7 +175,7 @@ def process_deep_search():
     except:
         df = pd.read_csv(INPUT_FILE, encoding='gbk')
         
-    cache = load_cache()
+    cache = get_cache()
     
     # Initialize new columns
     df['Third-Query_QID'] = ""
@@ -248,11 +225,9 @@ def process_deep_search():
         processed_count += 1
         if processed_count % 10 == 0:
             print(f"Processed {processed_count}/{len(target_indices)} | Found: {found_count}...", end='\r')
-            if processed_count % 50 == 0:
-                save_cache(cache)
                 
     print(f"\nDeep search complete. Found {found_count} new matches.")
-    save_cache(cache)
+    print(cache.summary())
     
     print(f"Saving to {OUTPUT_FILE}...")
     df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
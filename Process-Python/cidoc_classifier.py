@@ -0,0 +1,209 @@
+import re
+from collections import defaultdict
+
+try:
+    import ahocorasick  # pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Shared CIDOC-CRM type classification for the 01-Process scripts.
+# Every keyword list is compiled into one multi-pattern matcher, so an entry is
+# scanned once and all category hits come back together; the priority order
+# (Concept > Event > Group > Architecture > Place) is applied afterwards.
+
+# CIDOC-CRM Constants
+TYPE_PERSON = "E21 Person"
+TYPE_GROUP = "E74 Group"
+TYPE_EVENT = "E5 Event"
+TYPE_MAN_MADE = "E22 Man-Made Object"
+TYPE_CONCEPT = "E28 Conceptual Object"
+TYPE_PLACE = "E53 Place"
+TYPE_UNKNOWN = "Unknown"
+
+# --- 1. E28 Conceptual Object (Concepts, Theories) ---
+CONCEPT_KEYWORDS = [
+    "artistic temperament", "artist's position", "status of",
+    "satire", "theory", "criticism", "development of", "concept of",
+    "allegory", "iconography"
+]
+
+# --- 2. E5 Event (Events, Treaties, Exhibitions) ---
+EVENT_KEYWORDS = [
+    "peace of", "treaty of", "council of", "battle of", "sack of",
+    "synod of", "concordat of", "armistice of", "exhibitions",
+    "entry of", "ceremony", "festival", "carnival"
+]
+
+# --- 3. E74 Group (Institutions, Families, Organizations) ---
+GROUP_KEYWORDS = [
+    "family", "accademia", "academy", "society", "college",
+    "university", "school", "scuola", "dealers", "painters",
+    "sculptors", "architects", "bamboccianti", "dominicans",
+    "jesuits", "franciscans", "order of", "guild"
+]
+
+# --- 4. E22 Man-Made Object (Architecture) ---
+ARCHITECTURE_KEYWORDS = [
+    "palazzo", "palace", "villa", "cathedral", "basilica",
+    "chapel", "temple", "alticchiero", "church", "monument",
+    "fountain", "arch", "bridge", "castle"
+]
+
+# --- 5. E53 Place (Geographic Locations) ---
+PLACE_KEYWORDS = [
+    "piazza", "square", "street", "garden", "park", "rome",
+    "venice", "florence", "naples", "bologna", "milan", "paris",
+    "london", "vatican", "holland", "flanders", "spain", "france"
+]
+
+# Literature / Specific Works (exact Main Entry)
+LITERATURE_TITLES = {"orlando furioso", "divine comedy", "the prince", "lives of the artists", "daphnis and chloe"}
+
+# Known single names or Popes (exact Main Entry)
+PERSON_NAMES = {
+    "alexander vii", "alexander viii", "ariosto", "arrighini", "baciccio", "canaletto", "dante",
+    "giorgione", "guercino", "michelangelo", "raphael", "titian", "tintoretto", "veronese"
+}
+
+
+def _trie_pattern(words):
+    """Regex for a set of words, factored on common prefixes ("arch(?:itects)?"); longest match first."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Finds every keyword rule a text hits in a single pass over the text.
+
+    `rules` are (label, keywords) pairs in priority order. A keyword is a substring;
+    a tuple of substrings only counts when all of them occur. With pyahocorasick
+    installed the keywords form one automaton. Without it, one prefix-trie regex with a
+    lookahead at every position reports the longest keyword starting there, and the
+    shorter keywords that are prefixes of it are added from a precomputed table.
+    """
+
+    def __init__(self, rules, ignore_case=True):
+        self.ignore_case = ignore_case
+        self.labels = []
+        self.single = defaultdict(set)  # keyword -> labels
+        self.combined = []  # (label, all required keywords)
+        for label, keywords in rules:
+            self.labels.append(label)
+            for keyword in keywords:
+                if isinstance(keyword, tuple):
+                    self.combined.append((label, frozenset(self._fold(k) for k in keyword)))
+                else:
+                    self.single[self._fold(keyword)].add(label)
+        words = set(self.single).union(*(parts for _, parts in self.combined))
+
+        self.automaton = None
+        self.pattern = None
+        if ahocorasick and words:
+            self.automaton = ahocorasick.Automaton()
+            for word in words:
+                self.automaton.add_word(word, word)
+            self.automaton.make_automaton()
+        elif words:
+            self.pattern = re.compile(r'(?=(' + _trie_pattern(words) + r'))')
+            self.prefixes = {w: {p for p in words if w.startswith(p)} for w in words}
+
+    def _fold(self, text):
+        return text.lower() if self.ignore_case else text
+
+    def found(self, text):
+        """The set of keywords occurring in text."""
+        text = self._fold(text)
+        if self.automaton is not None:
+            return {word for _, word in self.automaton.iter(text)}
+        found = set()
+        if self.pattern is not None:
+            for m in self.pattern.finditer(text):
+                found |= self.prefixes[m.group(1)]
+        return found
+
+    def hits(self, text):
+        """Every label whose rule matches text."""
+        found = self.found(text)
+        labels = set()
+        for word in found:
+            labels |= self.single.get(word, set())
+        for label, parts in self.combined:
+            if parts <= found:
+                labels.add(label)
+        return labels
+
+    def first(self, text):
+        """The highest-priority label that matches text, or None."""
+        hits = self.hits(text)
+        return next((label for label in self.labels if label in hits), None)
+
+
+CIDOC_KEYWORDS = KeywordMatcher([
+    (TYPE_CONCEPT, CONCEPT_KEYWORDS),
+    (TYPE_EVENT, EVENT_KEYWORDS),
+    (TYPE_GROUP, GROUP_KEYWORDS),
+    (TYPE_MAN_MADE, ARCHITECTURE_KEYWORDS),
+    (TYPE_PLACE, PLACE_KEYWORDS),
+])
+
+
+def classify_entry(main_entry):
+    """CIDOC-CRM type for an Index Main Entry (already stripped)."""
+    entry_lower = main_entry.lower()
+    hits = CIDOC_KEYWORDS.hits(entry_lower)
+
+    # Concepts, Events, Groups and Architecture, in that order
+    for cidoc_type in (TYPE_CONCEPT, TYPE_EVENT, TYPE_GROUP, TYPE_MAN_MADE):
+        if cidoc_type in hits:
+            return cidoc_type
+
+    # Specific check for "S. " or "San " which usually means a church if not a person
+    # If it has a comma, it's likely a person (e.g. "San Giovanni, Giovanni da")
+    if entry_lower.startswith(('s. ', 'san ', 'santa ')) and ',' not in main_entry:
+        return TYPE_MAN_MADE
+
+    # Literature refers to the text/story -> E28, to keep it apart from Buildings
+    if entry_lower in LITERATURE_TITLES:
+        return TYPE_CONCEPT
+
+    if TYPE_PLACE in hits:
+        return TYPE_PLACE
+
+    # Default heuristic: Comma implies "Surname, Firstname"
+    # Must be checked AFTER Events/Concepts which might contain commas (e.g. "Aix-la-Chapelle, Peace of")
+    if ',' in main_entry:
+        return TYPE_PERSON
+
+    if entry_lower in PERSON_NAMES:
+        return TYPE_PERSON
+
+    return TYPE_UNKNOWN
+
+
+def apply_type_overrides(df, classify, column='Main Entry', type_column='Type'):
+    """
+    Sets df[type_column] to classify(term) wherever it returns a different type.
+    classify runs once per distinct term and returns None to keep the current type.
+    Returns the number of rows changed.
+    """
+    terms = df[column]
+    proposed = terms.map({term: classify(term) for term in terms.dropna().unique()})
+    changed = proposed.notna() & (proposed != df[type_column].astype(str).str.strip())
+    if changed.any():
+        df[type_column] = df[type_column].astype(object)
+        df.loc[changed, type_column] = proposed[changed]
+    return int(changed.sum())
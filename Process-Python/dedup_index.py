@@ -0,0 +1,461 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import unicodedata
+from typing import Callable, NamedTuple
+
+import pandas as pd
+
+# Persistent, incremental deduplication for the recheck / QID datasets.
+# Every source row is stored once with a content digest and its group key (a
+# normalized name or QID), and every group with its merged output row and the IDs of
+# the rows merged into it. Ingesting a new snapshot of the input, or a handful of
+# corrected rows, only re-merges the groups those rows leave or join, so a re-run
+# after a small human correction costs O(changes) instead of a full groupby. The
+# index lives next to the output it produces (<output>.dedup.sqlite) and keeps a
+# trail of every row-level change for provenance.
+
+KEY = '_dedup_key'          # Group key column handed to a policy's merge
+SINGLE_PREFIX = '#row:'     # Key of a row that is never merged (no name / no QID)
+SQL_CHUNK = 500             # Parameters per IN (...) query
+ROW_ID_CHARS = 16           # Digest characters in a content row ID ("<digest>:<occurrence>")
+
+
+class Policy(NamedTuple):
+    name: str
+    key: Callable       # DataFrame -> Series of group keys ('' or NaN: the row stays on its own)
+    merge: Callable     # DataFrame with a KEY column -> DataFrame with one merged row per key, indexed by key
+    columns: Callable   # Input columns -> output column order
+    sort_by: str        # Output is sorted by this column (missing values last)
+
+
+def normalize_name(value):
+    """Group key of a name: NFC, whitespace collapsed; case and punctuation are kept."""
+    if not isinstance(value, str):
+        return ''
+    return ' '.join(unicodedata.normalize('NFC', value).split())
+
+
+def normalize_qid(value):
+    """Group key of a QID cell: 'q123 ' -> 'Q123'; empty for a missing QID."""
+    if not isinstance(value, str):
+        return ''
+    return value.strip().upper()
+
+
+# --- Recheck policy (29_Deduplicate_Recheck): one row per Refined_Formal_Name ---
+
+def join_unique(series):
+    # Sorted unique non-empty values, ' | '-joined
+    values = [str(x).strip() for x in series if pd.notna(x) and str(x).strip() != '']
+    return ' | '.join(sorted(set(values)))
+
+
+def first_mode(series):
+    # The most frequent value (the smallest on a tie), or the first one
+    mode = series.mode()
+    if not mode.empty:
+        return mode[0]
+    return series.iloc[0] if not series.empty else None
+
+
+def _merge_recheck(df):
+    return df.groupby(KEY, sort=False).agg({
+        'Refined_Formal_Name': 'first',
+        'Original_Entry': join_unique,
+        'Refined_Category': first_mode,
+        'Status/Notes': join_unique,
+    })
+
+
+RECHECK_NAME = Policy(
+    name='recheck-name',
+    key=lambda df: df['Refined_Formal_Name'].map(normalize_name),
+    merge=_merge_recheck,
+    columns=lambda cols: ['Refined_Formal_Name', 'Original_Entry', 'Refined_Category', 'Status/Notes'] + [
+        c for c in cols if c not in ('Refined_Formal_Name', 'Original_Entry', 'Refined_Category', 'Status/Notes')],
+    sort_by='Refined_Formal_Name',
+)
+
+
+# --- QID policy (deduplicate_by_qid_priority, apply_corrections_and_dedup): one row per Original-QID ---
+
+def _merge_qid_priority(df):
+    # Best row first: has a Second-Query_Label, then a name without "(人物)", then input order
+    label = df['Second-Query_Label']
+    ranked = df.assign(
+        _has_label=label.notna() & (label.astype(str).str.strip() != ''),
+        _clean_name=~df['Refined_Formal_Name'].astype(str).str.contains(r'\(人物\)', regex=True),
+    ).sort_values([KEY, '_has_label', '_clean_name'], ascending=[True, False, False], kind='stable')
+    best = ranked.drop_duplicates(subset=[KEY], keep='first')
+    return best.drop(columns=['_has_label', '_clean_name']).set_index(KEY)
+
+
+QID_PRIORITY = Policy(
+    name='qid-priority',
+    key=lambda df: df['Original-QID'].map(normalize_qid),
+    merge=_merge_qid_priority,
+    columns=list,
+    sort_by='Refined_Formal_Name',
+)
+
+
+def index_path(output):
+    """The index file kept next to a deduplicated output."""
+    return os.path.splitext(output)[0] + '.dedup.sqlite'
+
+
+def _plain(value):
+    # JSON-safe cell: NaN/NA -> None, NumPy scalars -> Python
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+def _chunks(items, size=SQL_CHUNK):
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class DedupIndex:
+    """
+    SQLite-backed dedup index for one policy.
+
+    Source rows are identified by `id_column` (a column whose value is unique per row,
+    e.g. Refined_Formal_Name in the human-merge tables) or, without one, by their
+    content: the row digest plus its occurrence number among identical rows, so a row
+    inserted or deleted anywhere leaves every other row's ID as it was. sync() ingests
+    a full snapshot and applies only the rows whose content changed; upsert() /
+    update() / delete() apply an explicit delta.
+    """
+
+    def __init__(self, path, policy=None, id_column=None):
+        self.path = path
+        self.policy = policy
+        self.id_column = id_column
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS rows (
+                row_id TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                digest TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_rows_key ON rows(key);
+            CREATE TABLE IF NOT EXISTS groups (
+                key TEXT PRIMARY KEY,
+                position INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                members TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS trail (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                time REAL NOT NULL,
+                source TEXT NOT NULL,
+                row_id TEXT NOT NULL,
+                action TEXT NOT NULL,
+                old_key TEXT,
+                new_key TEXT
+            );
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+        """)
+        if policy is not None:
+            stored = self._meta('policy')
+            if stored and stored != policy.name:
+                raise ValueError(f"{path} is a '{stored}' index, not '{policy.name}'")
+            self._set_meta('policy', policy.name)
+
+    # --- meta ---
+
+    def _meta(self, name, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, name, value):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    @property
+    def input_columns(self):
+        return json.loads(self._meta('columns', '[]'))
+
+    def _remember_columns(self, columns):
+        known = self.input_columns
+        merged = known + [c for c in columns if c not in known]
+        if merged != known:
+            self._set_meta('columns', json.dumps(merged, ensure_ascii=False))
+
+    # --- rows in, rows out ---
+
+    def _records(self, df, start=1):
+        """{row_id: (position, data dict)} for the rows of df; duplicate id_column values are an error."""
+        columns = [c for c in df.columns if c != KEY]
+        records = {}
+        occurrences = {}
+        duplicates = []
+        for position, values in enumerate(df[columns].itertuples(index=False, name=None), start):
+            data = dict(zip(columns, map(_plain, values)))
+            if self.id_column:
+                row_id = str(data[self.id_column])
+                if row_id in records:
+                    duplicates.append(row_id)
+                    continue
+            else:
+                digest = self._digest(data)[:ROW_ID_CHARS]
+                occurrences[digest] = occurrences.get(digest, 0) + 1
+                row_id = f"{digest}:{occurrences[digest]}"
+            records[row_id] = (position, data)
+        if duplicates:
+            shown = ', '.join(repr(r) for r in list(dict.fromkeys(duplicates))[:5])
+            raise ValueError(f"{len(duplicates)} rows repeat a {self.id_column} value already in the input "
+                             f"({shown}); rows must be unique by their id_column")
+        return records
+
+    @staticmethod
+    def _digest(data):
+        return hashlib.sha1(json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _select(self, sql, values):
+        """Rows of `sql` (with one IN (?) placeholder list) for every value, queried in chunks."""
+        for chunk in _chunks(values):
+            yield from self.conn.execute(sql.format(','.join('?' * len(chunk))), chunk)
+
+    def rows(self, row_ids=None):
+        """Stored source rows (all, or the given IDs) as a DataFrame indexed by row ID, in input order."""
+        if row_ids is None:
+            found = self.conn.execute("SELECT row_id, position, data FROM rows").fetchall()
+        else:
+            found = list(self._select("SELECT row_id, position, data FROM rows WHERE row_id IN ({})",
+                                      [str(r) for r in row_ids]))
+        found.sort(key=lambda r: r[1])
+        return pd.DataFrame([json.loads(r[2]) for r in found], index=[r[0] for r in found],
+                            columns=self.input_columns)
+
+    # --- ingestion ---
+
+    def sync(self, df, source='snapshot'):
+        """
+        Makes the index match a full snapshot of the input: new and changed rows are
+        upserted, rows no longer present are deleted, everything else is untouched.
+        A snapshot identical to the last one synced from `source` is skipped outright
+        as long as no delta (upsert / update / delete) was applied since; after one,
+        the rows are compared again and every row reverts to the input, so the output
+        depends only on the input and the deltas a script applies after its sync.
+        """
+        self._remember_columns(list(df.columns))
+        records = self._records(df)
+        digests = {row_id: self._digest(data) for row_id, (_, data) in records.items()}
+        snapshot = hashlib.sha1(json.dumps(sorted(digests.items())).encode('utf-8')).hexdigest()
+        if self._meta(f'snapshot:{source}') == snapshot:
+            return self._stats()
+
+        stored = {row_id: (position, digest) for row_id, position, digest
+                  in self.conn.execute("SELECT row_id, position, digest FROM rows")}
+        changed = {row_id: records[row_id] for row_id, digest in digests.items()
+                   if row_id not in stored or stored[row_id][1] != digest}
+        deleted = [row_id for row_id in stored if row_id not in records]
+        stats = self._apply(changed, deleted, source)
+
+        # Rows that only moved keep their group; their new position orders ties and output
+        moved = [(records[row_id][0], row_id) for row_id, (position, _) in stored.items()
+                 if row_id in records and row_id not in changed and records[row_id][0] != position]
+        if moved:
+            with self.conn:
+                self.conn.executemany("UPDATE rows SET position = ? WHERE row_id = ?", moved)
+                self.conn.execute("UPDATE groups SET position = "
+                                  "(SELECT MIN(position) FROM rows WHERE rows.key = groups.key)")
+        self._set_meta(f'snapshot:{source}', snapshot)
+        return stats
+
+    def _forget_snapshots(self):
+        # A delta makes the index differ from every synced snapshot
+        with self.conn:
+            self.conn.execute("DELETE FROM meta WHERE name LIKE 'snapshot:%'")
+
+    def upsert(self, df, source='upsert'):
+        """Adds or replaces the rows of df (id_column required); returns the change stats."""
+        if not self.id_column:
+            raise ValueError("upsert needs an id_column to identify rows")
+        self._remember_columns(list(df.columns))
+        records = self._records(df, start=self._next_position())
+        stored = self._positions(records)
+        records = {row_id: (stored.get(row_id, position), data) for row_id, (position, data) in records.items()}
+        self._forget_snapshots()
+        return self._apply(records, [], source)
+
+    def update(self, changes, source='update'):
+        """
+        Field-level corrections {row_id: {column: value}} to stored rows. An unknown
+        ID raises KeyError (new rows go through upsert). Returns the change stats.
+        """
+        current = self.rows(changes.keys())
+        missing = [str(r) for r in changes if str(r) not in current.index]
+        if missing:
+            raise KeyError(f"Not in {os.path.basename(self.path)}: {', '.join(missing[:5])}")
+        stored = self._positions({str(r): None for r in changes})
+        records = {}
+        for row_id, fields in changes.items():
+            row_id = str(row_id)
+            data = {c: _plain(v) for c, v in current.loc[row_id].items()}
+            data.update({c: _plain(v) for c, v in fields.items()})
+            records[row_id] = (stored[row_id], data)
+        self._remember_columns([c for fields in changes.values() for c in fields])
+        self._forget_snapshots()
+        return self._apply(records, [], source)
+
+    def delete(self, row_ids, source='delete'):
+        self._forget_snapshots()
+        return self._apply({}, [str(r) for r in row_ids], source)
+
+    def _next_position(self):
+        return (self.conn.execute("SELECT COALESCE(MAX(position), 0) FROM rows").fetchone()[0]) + 1
+
+    def _positions(self, records):
+        return dict(self._select("SELECT row_id, position FROM rows WHERE row_id IN ({})", list(records)))
+
+    def _apply(self, records, deleted, source):
+        """
+        Writes upserted {row_id: (position, data)} and deleted rows, then re-merges
+        only the groups any of them left or joined. Upserts identical to the stored
+        row are dropped first.
+        """
+        stored = {row_id: digest for row_id, digest in
+                  self._select("SELECT row_id, digest FROM rows WHERE row_id IN ({})", list(records))}
+        records = {row_id: record for row_id, record in records.items()
+                   if stored.get(row_id) != self._digest(record[1])}
+        if not records and not deleted:
+            return self._stats()
+        old_keys = dict(self._select("SELECT row_id, key FROM rows WHERE row_id IN ({})",
+                                     list(records) + list(deleted)))
+        new_keys = {}
+        if records:
+            frame = pd.DataFrame([data for _, data in records.values()], index=list(records))
+            keys = self.policy.key(frame).fillna('').astype(str)
+            new_keys = {row_id: key or SINGLE_PREFIX + row_id for row_id, key in keys.items()}
+
+        now = time.time()
+        trail = []
+        for row_id in records:
+            if old_keys.get(row_id) is None:
+                trail.append((now, source, row_id, 'insert', None, new_keys[row_id]))
+            else:
+                trail.append((now, source, row_id, 'update', old_keys[row_id], new_keys[row_id]))
+        for row_id in deleted:
+            if row_id in old_keys:
+                trail.append((now, source, row_id, 'delete', old_keys[row_id], None))
+
+        with self.conn:
+            self.conn.executemany("DELETE FROM rows WHERE row_id = ?", [(r,) for r in deleted])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO rows (row_id, position, digest, key, data) VALUES (?, ?, ?, ?, ?)",
+                [(row_id, position, self._digest(data), new_keys[row_id], json.dumps(data, ensure_ascii=False))
+                 for row_id, (position, data) in records.items()])
+            self.conn.executemany(
+                "INSERT INTO trail (time, source, row_id, action, old_key, new_key) VALUES (?, ?, ?, ?, ?, ?)",
+                trail)
+            affected = set(old_keys.values()) | set(new_keys.values())
+            self._remerge(affected)
+
+        stats = self._stats()
+        stats.update(inserted=sum(t[3] == 'insert' for t in trail), updated=sum(t[3] == 'update' for t in trail),
+                     deleted=sum(t[3] == 'delete' for t in trail), regrouped=len(affected))
+        return stats
+
+    def _remerge(self, keys):
+        """Recomputes the merged row and members of each group in keys (inside the caller's transaction)."""
+        keys = list(keys)
+        self.conn.executemany("DELETE FROM groups WHERE key = ?", [(k,) for k in keys])
+        members = list(self._select("SELECT row_id, position, key, data FROM rows WHERE key IN ({})", keys))
+        if not members:
+            return
+        members.sort(key=lambda r: r[1])
+        frame = pd.DataFrame([json.loads(r[3]) for r in members], columns=self.input_columns)
+        frame[KEY] = [r[2] for r in members]
+        by_key = {}
+        for row_id, position, key, _ in members:
+            by_key.setdefault(key, []).append((row_id, position))
+
+        single = frame[KEY].str.startswith(SINGLE_PREFIX)
+        merged = {key: row.drop(KEY).to_dict() for key, row in frame[single].set_index(KEY, drop=False).iterrows()}
+        if (~single).any():
+            for key, row in self.policy.merge(frame[~single]).iterrows():
+                merged[key] = row.to_dict()
+
+        self.conn.executemany(
+            "INSERT INTO groups (key, position, data, members) VALUES (?, ?, ?, ?)",
+            [(key, by_key[key][0][1], json.dumps({c: _plain(v) for c, v in data.items()}, ensure_ascii=False),
+              json.dumps([row_id for row_id, _ in by_key[key]], ensure_ascii=False))
+             for key, data in merged.items()])
+
+    # --- output ---
+
+    def frame(self, provenance=False):
+        """
+        The deduplicated table: one row per group, in the policy's column order,
+        sorted by its sort column. With provenance, a Merged_Row_IDs column lists the
+        source rows merged into each output row.
+        """
+        groups = self.conn.execute("SELECT key, position, data, members FROM groups ORDER BY position").fetchall()
+        df = pd.DataFrame([json.loads(g[2]) for g in groups]).reindex(columns=self.policy.columns(self.input_columns))
+        if provenance:
+            df['Merged_Row_IDs'] = ['; '.join(json.loads(g[3])) for g in groups]
+        return df.sort_values(self.policy.sort_by, na_position='last', kind='stable').reset_index(drop=True)
+
+    def members(self, key):
+        row = self.conn.execute("SELECT members FROM groups WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def history(self, row_id=None, limit=50):
+        """The latest trail entries (of one row), newest first."""
+        sql = "SELECT time, source, row_id, action, old_key, new_key FROM trail"
+        params = ()
+        if row_id is not None:
+            sql += " WHERE row_id = ?"
+            params = (str(row_id),)
+        rows = self.conn.execute(sql + " ORDER BY id DESC LIMIT ?", params + (limit,)).fetchall()
+        trail = pd.DataFrame(rows, columns=['time', 'source', 'row_id', 'action', 'old_key', 'new_key'])
+        trail['time'] = pd.to_datetime(trail['time'], unit='s').dt.strftime('%Y-%m-%d %H:%M:%S')
+        return trail
+
+    def _stats(self):
+        rows, groups = (self.conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in ('rows', 'groups'))
+        return {'rows': rows, 'groups': groups, 'inserted': 0, 'updated': 0, 'deleted': 0, 'regrouped': 0}
+
+    def close(self):
+        self.conn.close()
+
+
+def describe(stats):
+    """One-line summary of a sync / delta."""
+    return (f"{stats['rows']} rows -> {stats['groups']} groups | +{stats['inserted']} ~{stats['updated']} "
+            f"-{stats['deleted']} rows, {stats['regrouped']} groups re-merged")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a dedup index: group members and the change trail.")
+    parser.add_argument('index', help="A .dedup.sqlite file")
+    parser.add_argument('--key', help="Show the rows merged into this group (normalized name or QID)")
+    parser.add_argument('--row', help="Show the change trail of one source row ID")
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    index = DedupIndex(args.index)
+    stats = index._stats()
+    print(f"{args.index}: {stats['rows']} source rows -> {stats['groups']} groups")
+    if args.key:
+        members = index.members(args.key)
+        print(f"{args.key}: {len(members)} source rows")
+        print(index.rows(members).to_string())
+    else:
+        print(index.history(args.row, args.limit).to_string(index=False))
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+
+import pandas as pd
+
+# Shared encoding detection and mojibake repair.
+# A file's encoding is sniffed once from a byte sample and the verdict is cached by
+# the sample's hash (encoding_cache.json), so readers parse each file exactly once with
+# the right codec instead of retrying read_csv per encoding. Mojibake is repaired per
+# cell: GBK text that was decoded as Big5 ("Orl谷ans"), UTF-8 decoded as GBK ("Orl茅ans")
+# or UTF-8 decoded as cp1252 ("OrlÃ©ans") is re-encoded and decoded back, and only cells
+# that actually change are rewritten.
+
+# --- Configuration ---
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "encoding_cache.json")
+SAMPLE_BYTES = 64 * 1024       # Bytes read to sniff the encoding
+CANDIDATE_ENCODINGS = ['utf-8', 'gbk', 'cp1252']  # Tried in order on the sample; latin1 is the last resort
+
+# Accented letters read with the wrong CJK codec come out as CJK characters glued to
+# Latin letters: GBK "é" (A8A6, pinyin row) read as Big5 is "谷", UTF-8 "é" read as GBK is "茅"
+CJK_MOJIBAKE = re.compile(r'(?<=[A-Za-z])[\u4e00-\u9fff]+|[\u4e00-\u9fff]+(?=[A-Za-z])')
+# ... and read as cp1252 as "Ã©", "Ã¨", "Ä\x8d": a lead byte C2-DF, then a continuation byte 80-BF
+CP1252_CONTINUATION = '\u0080-\u00bf' + '€‚ƒ„…†‡ˆ‰Š‹ŒŽ‘’“”•–—˜™š›œžŸ'
+CP1252_MOJIBAKE = re.compile(r'(?:[\u00c2-\u00df][' + CP1252_CONTINUATION + r'])+')
+# A repaired run must come out as accented letters or dashes / quotes ("Wallraf–Richartz")
+REPAIRED_CHARS = re.compile(r'^[\u00c0-\u024f\u1e00-\u1eff\u2010-\u2027]+$')
+CJK_REPAIRS = [('big5', 'gbk'), ('gbk', 'utf-8')]  # (codec it was wrongly read with, codec it was written in)
+MOJIBAKE_HINT = re.compile(CJK_MOJIBAKE.pattern + '|' + CP1252_MOJIBAKE.pattern)
+CJK_RUN = re.compile(r'[\u4e00-\u9fff]+')
+
+_verdicts = None
+_lock = threading.Lock()
+
+
+def plausible(text):
+    """
+    False for text that reads as accented Latin decoded with a CJK codec: most of its
+    CJK runs sit inside Latin words ("Orl閍ns", "F閘ibien"). Chinese notes stand apart
+    from the Latin names, so real GBK text passes.
+    """
+    runs = len(CJK_RUN.findall(text))
+    return runs == 0 or 2 * len(CJK_MOJIBAKE.findall(text)) < runs
+
+
+def sniff_bytes(sample):
+    """
+    Encoding of a byte sample: 'utf-8-sig' for a BOM, 'utf-8' when it decodes, else the
+    first other candidate that decodes it to plausible text.
+    """
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    # A sample may end inside a multi-byte character; cut it at the last line break
+    if b'\n' in sample:
+        sample = sample[:sample.rindex(b'\n') + 1]
+    for enc in CANDIDATE_ENCODINGS:
+        try:
+            text = sample.decode(enc)
+        except UnicodeDecodeError:
+            continue
+        # Valid UTF-8 is UTF-8 (mojibake inside it is repaired per cell); the legacy
+        # codecs decode almost any bytes, so they must also produce plausible text
+        if enc == 'utf-8' or plausible(text):
+            return enc
+    return 'latin1'
+
+
+def _load_verdicts():
+    global _verdicts
+    if _verdicts is None:
+        try:
+            with open(CACHE_FILE, encoding='utf-8') as f:
+                _verdicts = json.load(f)
+        except (OSError, ValueError):
+            _verdicts = {}
+    return _verdicts
+
+
+def sniff_encoding(path):
+    """
+    Encoding of a file, sniffed from its first SAMPLE_BYTES. The verdict depends only
+    on that sample, so it is cached by the sample's hash: one small read per call.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(SAMPLE_BYTES)
+    key = 'sample:' + hashlib.sha1(sample).hexdigest()
+    with _lock:
+        verdicts = _load_verdicts()
+        if key in verdicts:
+            return verdicts[key]
+    verdict = sniff_bytes(sample)
+    with _lock:
+        verdicts[key] = verdict
+        # Written aside and swapped in, so concurrent workers (01 sniffs per letter in
+        # several processes) never read a half-written cache
+        tmp_path = f"{CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(verdicts, f, indent=0)
+        os.replace(tmp_path, CACHE_FILE)
+    return verdict
+
+
+def _cp1252_bytes(run):
+    # Bytes 81, 8D, 8F, 90, 9D have no cp1252 character and were decoded as latin1 controls
+    return b''.join(ch.encode('cp1252') if ch > '\u009f' or ch < '\u0080' else ch.encode('latin1') for ch in run)
+
+
+def _undo(run, wrong_encoding, encoding='utf-8'):
+    """The text a mojibake run came from, or None when it does not round-trip to accented letters / punctuation."""
+    try:
+        raw = _cp1252_bytes(run) if wrong_encoding == 'cp1252' else run.encode(wrong_encoding)
+        fixed = raw.decode(encoding)
+    except UnicodeError:
+        return None
+    return fixed if REPAIRED_CHARS.match(fixed) else None
+
+
+def _undo_cjk(match):
+    run = match.group(0)
+    for wrong_encoding, encoding in CJK_REPAIRS:
+        fixed = _undo(run, wrong_encoding, encoding)
+        if fixed:
+            return fixed
+    return run
+
+
+def fix_mojibake(text):
+    """Text with its mojibake runs repaired ("Orl谷ans" -> "Orléans"); other text is unchanged."""
+    if not isinstance(text, str) or not MOJIBAKE_HINT.search(text):
+        return text
+    text = CJK_MOJIBAKE.sub(_undo_cjk, text)
+    return CP1252_MOJIBAKE.sub(lambda m: _undo(m.group(0), 'cp1252') or m.group(0), text)
+
+
+def repair_frame(df):
+    """Repairs mojibake in the text columns of df in place; returns the number of cells changed."""
+    changed = 0
+    for col in df.columns:
+        values = df[col]
+        if not pd.api.types.is_string_dtype(values.dtype) and values.dtype != object:
+            continue
+        # Only cells that look affected go through the repair
+        suspect = values.map(lambda v: isinstance(v, str) and MOJIBAKE_HINT.search(v) is not None)
+        if not suspect.any():
+            continue
+        fixed = values[suspect].map(fix_mojibake)
+        diff = fixed != values[suspect]
+        if diff.any():
+            df.loc[fixed.index[diff], col] = fixed[diff]
+            changed += int(diff.sum())
+    return changed
+
+
+def decode_lines(path, encoding=None):
+    """
+    Streams the text lines of a file decoded with its sniffed encoding. A line that
+    does not decode (a file mixing encodings) falls back to the other candidates.
+    """
+    encoding = encoding or sniff_encoding(path)
+    codec = 'utf-8' if encoding == 'utf-8-sig' else encoding
+    fallbacks = [e for e in CANDIDATE_ENCODINGS if e != codec]
+    with open(path, 'rb') as f:
+        for line_no, raw in enumerate(f):
+            if line_no == 0 and raw.startswith(b'\xef\xbb\xbf'):
+                raw = raw[3:]
+            try:
+                yield raw.decode(codec)
+                continue
+            except UnicodeDecodeError:
+                pass
+            for enc in fallbacks:
+                try:
+                    yield raw.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                yield raw.decode('latin1')
+
+
+def read_csv_auto(path, repair=False, **kwargs):
+    """
+    pd.read_csv with the sniffed encoding: one parse per file. A file that mixes
+    encodings is decoded line by line instead. With repair, mojibake cells are fixed.
+    """
+    encoding = sniff_encoding(path)
+    try:
+        df = pd.read_csv(path, encoding=encoding, **kwargs)
+    except UnicodeDecodeError:
+        df = pd.read_csv(io.StringIO(''.join(decode_lines(path, encoding))), **kwargs)
+    if repair:
+        repair_frame(df)
+    return df
+
+
+def repair_file(path, output=None):
+    """
+    Streams a CSV through cell-level mojibake repair and writes it as UTF-8-SIG
+    (in place unless output is given). Returns (encoding, cells repaired); a UTF-8-SIG
+    file with nothing to repair is left untouched.
+    """
+    encoding = sniff_encoding(path)
+    output = output or path
+    tmp_path = output + '.tmp'
+    changed = 0
+    with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f_out:
+        writer = csv.writer(f_out, lineterminator='\n')
+        for row in csv.reader(decode_lines(path, encoding)):
+            fixed = [fix_mojibake(cell) for cell in row]
+            changed += sum(a != b for a, b in zip(row, fixed))
+            writer.writerow(fixed)
+    if changed == 0 and encoding == 'utf-8-sig' and output == path:
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, output)
+    return encoding, changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect file encodings and repair mojibake cells in CSV files.")
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--check', action='store_true', help="Only report the detected encoding")
+    args = parser.parse_args()
+
+    for path in args.files:
+        if args.check:
+            print(f"{path}: {sniff_encoding(path)}")
+        else:
+            encoding, changed = repair_file(path)
+            print(f"{path}: read as {encoding}, {changed} cells repaired")
+
+
+if __name__ == "__main__":
+    main()
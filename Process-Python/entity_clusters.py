@@ -0,0 +1,255 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+
+import pandas as pd
+
+from dedup_index import normalize_name
+from encoding_repair import read_csv_auto
+from http_cache import CACHE_DB
+from table_io import columnar_path, read_columnar, write_table
+
+# Entity clustering over name, QID and Wikidata alias links.
+# Rows are joined in a disjoint set (union-find with path halving and union by size,
+# near-linear in the number of rows): rows with the same normalized name, rows with
+# the same QID, and a row whose name is the label / an alias of another row's QID.
+# Clusters are transitive, so "same QID under different names" and "same name under
+# different QIDs" land in one cluster. The result is one cluster table per input
+# (<input>_Clusters.csv) that the duplicate reports read instead of grouping by a
+# single column each. Aliases come from the wbgetentities responses already in the
+# shared HTTP cache; nothing is fetched. A cached table is reused only when it was
+# built from the same columns and aliases (see cluster_signature).
+
+QID_PATTERN = re.compile(r'^[Qq]\d+$')
+CLUSTER_COLUMNS = ['Row', 'Cluster_ID', 'Cluster_Size', 'Name', 'Name_Key', 'QID', 'Links',
+                   'Cluster_Names', 'Cluster_QIDs']
+
+
+class DisjointSet:
+    """Union-find over 0..n-1; each root also remembers which link kinds joined its set."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.links = [set() for _ in range(n)]
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+
+    def union(self, a, b, kind):
+        """Joins the sets of a and b; returns False when they already were one set."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.links[a] |= self.links[b] | {kind}
+        self.links[b] = set()
+        return True
+
+
+def name_key(name):
+    """Name link key: NFC, whitespace collapsed, case-folded."""
+    return normalize_name(name).casefold()
+
+
+def qid_key(value):
+    """QID link key: 'q123 ' -> 'Q123'; '' for missing values and placeholders ('/', '-', 'N/A')."""
+    if not isinstance(value, str):
+        return ''
+    value = value.strip()
+    return value.upper() if QID_PATTERN.match(value) else ''
+
+
+def cached_aliases(qids, cache_db=CACHE_DB):
+    """
+    {QID: {name keys}} of the English labels and aliases of the given QIDs, read from
+    the wbgetentities responses in the shared HTTP cache (read-only; {} without a cache).
+    """
+    qids = set(qids)
+    aliases = {}
+    if not qids or not os.path.exists(cache_db):
+        return aliases
+    conn = sqlite3.connect(f"file:{cache_db}?mode=ro", uri=True)
+    try:
+        bodies = conn.execute("SELECT body FROM responses WHERE params LIKE '%\"wbgetentities\"%'")
+        for (body,) in bodies:
+            for qid, entity in json.loads(body).get('entities', {}).items():
+                if qid not in qids or not isinstance(entity, dict):
+                    continue
+                names = [entity.get('labels', {}).get('en', {}).get('value', '')]
+                names += [a.get('value', '') for a in entity.get('aliases', {}).get('en', [])]
+                aliases.setdefault(qid, set()).update(k for k in map(name_key, names) if k)
+    except sqlite3.Error as e:
+        print(f"Alias lookup skipped ({cache_db}: {e})")
+    finally:
+        conn.close()
+    return aliases
+
+
+def check_columns(df, name_column, qid_columns=(), label_columns=()):
+    """Raises KeyError naming every requested column df does not have."""
+    missing = [col for col in [name_column, *qid_columns, *label_columns] if col not in df.columns]
+    if missing:
+        raise KeyError(f"Columns not in the table: {missing} (has: {list(df.columns)})")
+
+
+def qid_lists(df, qid_columns):
+    """The QID keys of each row, over all qid_columns."""
+    qids = [[qid_key(v) for v in df[col]] for col in qid_columns]
+    return [[q for q in row if q] for row in zip(*qids)] if qids else [[] for _ in range(len(df))]
+
+
+def build_clusters(df, name_column, qid_columns=(), label_columns=(), aliases=None):
+    """
+    Cluster table for the rows of df (same index, same order). Links: equal name keys
+    ('name'), equal QIDs in any of qid_columns ('qid'), and a row's name equal to a
+    label column value or a cached alias of another row's QID ('alias').
+    aliases: {QID: {name keys}}, None to read them from the HTTP cache, {} for none.
+    """
+    check_columns(df, name_column, qid_columns, label_columns)
+    n = len(df)
+    names = df[name_column].tolist()
+    keys = [name_key(v) for v in names]
+    row_qids = qid_lists(df, qid_columns)
+    if aliases is None:
+        aliases = cached_aliases({q for row in row_qids for q in row})
+
+    sets = DisjointSet(n)
+    first_with_name = {}
+    for i, key in enumerate(keys):
+        if key:
+            sets.union(first_with_name.setdefault(key, i), i, 'name')
+    first_with_qid = {}
+    for i, row in enumerate(row_qids):
+        for qid in row:
+            sets.union(first_with_qid.setdefault(qid, i), i, 'qid')
+
+    # A QID's label / aliases name another row: link that row to the QID's rows
+    alias_names = {qid: set(names) for qid, names in aliases.items() if qid in first_with_qid}
+    for col in label_columns:
+        for row, label in zip(row_qids, df[col]):
+            key = name_key(label)
+            for qid in row:
+                if key:
+                    alias_names.setdefault(qid, set()).add(key)
+    for qid, alias_keys in alias_names.items():
+        for key in alias_keys:
+            if key in first_with_name:
+                sets.union(first_with_qid[qid], first_with_name[key], 'alias')
+
+    roots = [sets.find(i) for i in range(n)]
+    table = pd.DataFrame({
+        'Row': range(1, n + 1),
+        'Root': roots,
+        'Name': names,
+        'Name_Key': keys,
+        'QID': [' | '.join(dict.fromkeys(row)) for row in row_qids],
+    }, index=df.index)
+    # Cluster IDs numbered by first appearance, so re-runs on the same input agree
+    table['Cluster_ID'] = pd.factorize(table['Root'])[0] + 1
+    cluster_names, cluster_qids = {}, {}
+    for root, key, row in zip(roots, keys, row_qids):
+        names_of = cluster_names.setdefault(root, set())
+        if key:
+            names_of.add(key)
+        cluster_qids.setdefault(root, set()).update(row)
+    # Per-cluster values once per root, not once per row (a large cluster would go quadratic)
+    links = {root: '+'.join(sorted(sets.links[root])) for root in cluster_names}
+    name_counts = {root: len(v) for root, v in cluster_names.items()}
+    qid_counts = {root: len(v) for root, v in cluster_qids.items()}
+    table['Cluster_Size'] = [sets.size[root] for root in roots]
+    table['Links'] = [links[root] for root in roots]
+    table['Cluster_Names'] = [name_counts[root] for root in roots]
+    table['Cluster_QIDs'] = [qid_counts[root] for root in roots]
+    return table[CLUSTER_COLUMNS]
+
+
+def clusters_path(path):
+    """The cluster table written for an input table."""
+    return os.path.splitext(path)[0] + '_Clusters.csv'
+
+
+def cluster_signature(name_column, qid_columns, label_columns, aliases):
+    """Fingerprint of everything a cluster table depends on besides the input rows."""
+    payload = {
+        'name_column': name_column,
+        'qid_columns': list(qid_columns),
+        'label_columns': list(label_columns),
+        'aliases': sorted((qid, sorted(keys)) for qid, keys in aliases.items()),
+    }
+    return hashlib.sha1(json.dumps(payload, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def load_clusters(path, name_column, qid_columns=(), label_columns=(), aliases=None, df=None):
+    """
+    The cluster table of an input file (index aligned with its rows; df when already
+    loaded). Served from <input>_Clusters (columnar) while it is newer than the input
+    and its sidecar <input>_Clusters.json records the same row count and signature
+    (columns and aliases); otherwise the rows are clustered and both are rewritten.
+    Requested columns the input does not have raise KeyError.
+    """
+    if df is None:
+        df = read_csv_auto(path)
+    check_columns(df, name_column, qid_columns, label_columns)
+    if aliases is None:
+        aliases = cached_aliases({q for row in qid_lists(df, qid_columns) for q in row})
+    signature = cluster_signature(name_column, qid_columns, label_columns, aliases)
+
+    output = clusters_path(path)
+    cache = columnar_path(output)
+    meta_path = os.path.splitext(output)[0] + '.json'
+    if os.path.exists(cache) and os.path.exists(meta_path) and os.path.getmtime(cache) >= os.path.getmtime(path):
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('signature') == signature and meta.get('rows') == len(df):
+            return read_columnar(cache).set_index(df.index)
+    table = build_clusters(df, name_column, qid_columns, label_columns, aliases)
+    write_table(table, output)
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump({'signature': signature, 'rows': len(df), 'name_column': name_column,
+                   'qid_columns': list(qid_columns), 'label_columns': list(label_columns),
+                   'aliases': len(aliases)}, f, ensure_ascii=False, indent=1)
+    return table
+
+
+def cluster_summary(table):
+    """One line per cluster of more than one row: size, names, QIDs and link kinds."""
+    multi = table[table['Cluster_Size'] > 1]
+    return multi.groupby('Cluster_ID').agg(
+        Size=('Row', 'size'),
+        Names=('Name', lambda s: ' | '.join(dict.fromkeys(map(str, s.dropna())))),
+        QIDs=('QID', lambda s: ' | '.join(dict.fromkeys(q for v in s.dropna() for q in str(v).split(' | ') if q))),
+        Links=('Links', 'first'),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cluster the rows of a table by name, QID and Wikidata alias links.")
+    parser.add_argument('input')
+    parser.add_argument('--name-column', default='Refined_Formal_Name')
+    parser.add_argument('--qid-column', action='append', default=[], help="Repeatable")
+    parser.add_argument('--label-column', action='append', default=[], help="Wikidata label column (repeatable)")
+    parser.add_argument('--no-aliases', action='store_true', help="Do not read aliases from the HTTP cache")
+    args = parser.parse_args()
+
+    table = load_clusters(args.input, args.name_column, args.qid_column, args.label_column,
+                          aliases={} if args.no_aliases else None)
+    multi = table[table['Cluster_Size'] > 1]
+    print(f"{len(table)} rows -> {table['Cluster_ID'].nunique()} clusters, "
+          f"{multi['Cluster_ID'].nunique()} with duplicates ({len(multi)} rows); "
+          f"{(table.groupby('Cluster_ID')['Cluster_QIDs'].first() > 1).sum()} clusters span several QIDs")
+    print(f"Saved to {clusters_path(args.input)}")
+
+
+if __name__ == "__main__":
+    main()
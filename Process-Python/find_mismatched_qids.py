@@ -1,6 +1,7 @@
 import pandas as pd
 import os
-from difflib import SequenceMatcher
+from fuzzy_index import is_similar
+from entity_clusters import load_clusters
 
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset\09-MissingQID-LLM-Fillin\07-Human-Merge"
@@ -10,27 +11,27 @@ output_file = os.path.join(base_dir, "05-Potential_QID_Mismatches.csv")
 # Read the CSV
 df = pd.read_csv(input_file)
 
-# Filter for rows with QID
-mask_has_qid = df['Original-QID'].notna() & (df['Original-QID'].str.strip() != '')
-df_qid = df[mask_has_qid].copy()
-
-# Group by QID
-grouped = df_qid.groupby('Original-QID')
+# Cluster the rows: same normalized name, same QID, or a name that is the Wikidata
+# label / an alias of another row's QID (see entity_clusters). A cluster holding
+# several QIDs is the same entity under different QIDs; a cluster whose names are far
+# apart is one QID shared by different entities.
+clusters = load_clusters(input_file, 'Refined_Formal_Name', qid_columns=['Original-QID'],
+                         label_columns=['Second-Query_Label'], df=df)
+df = df.join(clusters[['Cluster_ID', 'Cluster_QIDs']])
+# Rows with a QID, in clusters of more than one row
+df_qid = df[(clusters['QID'] != '') & (clusters['Cluster_Size'] > 1)]
 
 suspicious_groups = []
 
-def is_similar(a, b):
-    # Simple check: one contains the other
-    if a in b or b in a:
-        return True
-    # Check similarity ratio
-    return SequenceMatcher(None, a, b).ratio() > 0.6
+grouped = df_qid.groupby('Cluster_ID')
+print(f"Scanning {len(grouped)} entity clusters for mismatches...")
 
-print(f"Scanning {len(grouped)} QID groups for mismatches...")
+for cluster_id, group in grouped:
+    unique_names = group['Refined_Formal_Name'].dropna().unique()
+    reasons = []
+    if group['Cluster_QIDs'].iloc[0] > 1:
+        reasons.append('several QIDs')
 
-for qid, group in grouped:
-    unique_names = group['Refined_Formal_Name'].unique()
-    
     if len(unique_names) > 1:
         # Check if names are significantly different
         # We compare the first name with others. If any pair is very different, we flag the group.
@@ -54,17 +55,19 @@ for qid, group in grouped:
                     break
             if is_suspicious:
                 break
-        
         if is_suspicious:
-            # Add all rows for this QID to the report
-            for _, row in group.iterrows():
-                suspicious_groups.append(row)
+            reasons.append('dissimilar names')
+
+    if reasons:
+        # Add all rows for this cluster to the report
+        for _, row in group.iterrows():
+            suspicious_groups.append(row.drop('Cluster_QIDs').to_dict() | {'Mismatch_Reason': ', '.join(reasons)})
 
 # Create DataFrame from suspicious rows
 if suspicious_groups:
     result_df = pd.DataFrame(suspicious_groups)
-    # Sort by QID for easy reading
-    result_df.sort_values(by=['Original-QID', 'Refined_Formal_Name'], inplace=True)
+    # Sort by cluster, then QID, for easy reading
+    result_df.sort_values(by=['Cluster_ID', 'Original-QID', 'Refined_Formal_Name'], inplace=True)
     
     # Save
     result_df.to_csv(output_file, index=False)
@@ -75,12 +78,12 @@ if suspicious_groups:
     # Print a preview
     print("-" * 50)
     print("Preview of Potential Mismatches:")
-    current_qid = None
+    current_cluster = None
     for _, row in result_df.head(20).iterrows():
-        if row['Original-QID'] != current_qid:
+        if row['Cluster_ID'] != current_cluster:
             print("-" * 30)
-            print(f"QID: {row['Original-QID']}")
-            current_qid = row['Original-QID']
-        print(f"  - {row['Refined_Formal_Name']} (Label: {row.get('Second-Query_Label', 'N/A')})")
+            print(f"Cluster {row['Cluster_ID']} ({row['Mismatch_Reason']})")
+            current_cluster = row['Cluster_ID']
+        print(f"  - {row['Refined_Formal_Name']} [{row['Original-QID']}] (Label: {row.get('Second-Query_Label', 'N/A')})")
 else:
     print("No obvious mismatches found based on similarity threshold.")
@@ -0,0 +1,151 @@
+import re
+import difflib
+from collections import defaultdict
+
+# Shared blocking index for fuzzy name matching.
+# Blocking keys (word tokens, surname, character n-grams, Soundex codes) are
+# built once for the known names, so each query is scored only against the
+# few names that share a key with it instead of every known name.
+
+
+def normalize(text):
+    return str(text).strip().lower()
+
+
+def tokens(text):
+    return re.findall(r'\w+', normalize(text))
+
+
+def surname_key(text):
+    """Last word after removing punctuation ("Gian Lorenzo Bernini" -> "bernini")."""
+    words = re.sub(r'[^\w\s]', '', normalize(text)).split()
+    return words[-1] if words else ''
+
+
+def ngrams(text, n=3):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+_SOUNDEX_CODES = {c: str(d) for d, letters in enumerate(
+    ['aeiouyhw', 'bfpv', 'cgjkqsxz', 'dt', 'l', 'mn', 'r']) for c in letters}
+
+
+def soundex(word):
+    """American Soundex of an ASCII-ish word ("Robert" -> "R163"); '' if no letters."""
+    letters = [c for c in word.lower() if c in _SOUNDEX_CODES]
+    if not letters:
+        return ''
+    code = letters[0].upper()
+    last = _SOUNDEX_CODES[letters[0]]
+    for c in letters[1:]:
+        digit = _SOUNDEX_CODES[c]
+        if digit != '0' and digit != last:
+            code += digit
+        if c not in 'hw':
+            last = digit
+    return (code + '000')[:4]
+
+
+def is_similar(a, b, threshold=0.6):
+    """
+    True if one string contains the other or their SequenceMatcher ratio is above threshold.
+    The cheap upper bounds (real_quick_ratio / quick_ratio) reject most
+    dissimilar pairs before the full ratio is computed.
+    """
+    if a in b or b in a:
+        return True
+    matcher = difflib.SequenceMatcher(None, a, b)
+    return (matcher.real_quick_ratio() > threshold and matcher.quick_ratio() > threshold
+            and matcher.ratio() > threshold)
+
+
+class FuzzyIndex:
+    """
+    Candidate generator over a fixed list of names.
+
+    Lookups return names in the order they were added, so callers that pick
+    "the first" or "the shortest" match behave exactly as with a linear scan.
+    """
+
+    def __init__(self, names, ngram_size=3):
+        self.names = []
+        self.ngram_size = ngram_size
+        self.by_lower = defaultdict(list)
+        self.by_token = defaultdict(set)
+        self.by_surname = defaultdict(set)
+        self.by_ngram = defaultdict(set)
+        self.by_phonetic = defaultdict(set)
+        seen = set()
+        for name in names:
+            if name is None or name in seen:
+                continue
+            seen.add(name)
+            self._add(name)
+
+    def _add(self, name):
+        i = len(self.names)
+        self.names.append(name)
+        lower = normalize(name)
+        self.by_lower[lower].append(i)
+        for tok in tokens(name):
+            self.by_token[tok].add(i)
+            code = soundex(tok)
+            if code:
+                self.by_phonetic[code].add(i)
+        surname = surname_key(name)
+        if surname:
+            self.by_surname[surname].add(i)
+        for gram in ngrams(lower, self.ngram_size):
+            self.by_ngram[gram].add(i)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _ordered(self, ids):
+        return [self.names[i] for i in sorted(ids)]
+
+    def exact(self, query):
+        """Names equal to the query, ignoring case and surrounding spaces."""
+        return [self.names[i] for i in self.by_lower.get(normalize(query), [])]
+
+    def containing(self, query):
+        """Names whose lower-case form contains the lower-case query as a substring."""
+        q = normalize(query)
+        if len(q) < self.ngram_size:
+            # Too short for n-gram blocking: fall back to a scan
+            return [n for n in self.names if q in normalize(n)]
+        postings = sorted((self.by_ngram.get(g, set()) for g in ngrams(q, self.ngram_size)), key=len)
+        ids = set(postings[0])
+        for posting in postings[1:]:
+            ids &= posting
+            if not ids:
+                return []
+        return [n for n in self._ordered(ids) if q in normalize(n)]
+
+    def with_surname(self, query):
+        """Names whose surname_key equals the query's surname_key."""
+        return self._ordered(self.by_surname.get(surname_key(query), set()))
+
+    def candidates(self, query, limit=50):
+        """
+        Names sharing at least one blocking key with the query, best-first by the
+        number of shared keys (n-grams, tokens, surname, Soundex), at most `limit`.
+        """
+        q = normalize(query)
+        votes = defaultdict(int)
+        for gram in ngrams(q, self.ngram_size):
+            for i in self.by_ngram.get(gram, ()):
+                votes[i] += 1
+        for tok in tokens(q):
+            for i in self.by_token.get(tok, ()):
+                votes[i] += 2
+            for i in self.by_phonetic.get(soundex(tok), ()):
+                votes[i] += 1
+        for i in self.by_surname.get(surname_key(q), ()):
+            votes[i] += 2
+        ranked = sorted(votes, key=lambda i: (-votes[i], i))
+        return [self.names[i] for i in ranked[:limit]]
+
+    def close_matches(self, query, n=1, cutoff=0.8, limit=50):
+        """difflib.get_close_matches restricted to the blocked candidates."""
+        return difflib.get_close_matches(str(query), self.candidates(query, limit), n=n, cutoff=cutoff)
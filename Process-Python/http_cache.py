@@ -0,0 +1,326 @@
+import argparse
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+# Shared on-disk cache for every Wikidata / Wikipedia lookup script.
+# One SQLite file replaces the per-script JSON caches, so a query fetched by
+# one script (e.g. wbsearchentities "Poussin") is reused by all the others.
+
+# --- Configuration ---
+CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "http_cache.sqlite")
+DEFAULT_TTL = 30 * 24 * 3600     # Entries older than 30 days are re-fetched
+MAX_CACHE_BYTES = 256 * 1024 * 1024  # Evict least-recently-used rows above this size
+EVICT_CHECK_EVERY = 500          # Check size every N inserts
+FLUSH_EVERY = 50                 # Buffered new entries written per transaction
+DEFAULT_HEADERS = {'User-Agent': 'PnPDatasetBot/1.0'}
+THROTTLE_RETRIES = 3             # Re-sends after a 429 or a maxlag refusal
+DEFAULT_RETRY_AFTER = 5.0        # Seconds to wait when the server gives no Retry-After
+MAX_RETRY_AFTER = 120.0
+# Request parameters that do not change the answer, so they are left out of the cache key
+UNKEYED_PARAMS = {'maxlag'}
+
+# Legacy per-script JSON caches: {query: wbsearchentities "search" list}
+WBSEARCH_URL = "https://www.wikidata.org/w/api.php"
+LEGACY_SEARCH_CACHES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "wikidata_advanced_cache.json"),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "wikidata_deep_cache.json"),
+]
+
+
+def normalize_request(url, params):
+    """Returns a canonical (url, params) pair so equivalent requests share one key."""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    norm_url = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+    norm_params = {}
+    for k, v in (params or {}).items():
+        if v is None or k in UNKEYED_PARAMS:
+            continue
+        norm_params[str(k)] = " ".join(str(v).split())
+    return norm_url, json.dumps(norm_params, sort_keys=True, ensure_ascii=False)
+
+
+def make_key(url, params):
+    norm_url, norm_params = normalize_request(url, params)
+    return hashlib.sha1(f"{norm_url}?{norm_params}".encode('utf-8')).hexdigest()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by the worker threads of a script: tokens refill
+    at `rate` per second up to `burst`, and `pause` holds every worker (Retry-After).
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+def retry_after(response, default=DEFAULT_RETRY_AFTER):
+    """Seconds from a Retry-After header (delta-seconds form), capped at MAX_RETRY_AFTER."""
+    try:
+        seconds = float(response.headers.get('Retry-After', default))
+    except (TypeError, ValueError):
+        seconds = default
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+def is_throttled(response, data=None):
+    """A 429, or a MediaWiki API refusal because replication lag exceeds the request's maxlag."""
+    if response.status_code == 429:
+        return True
+    return isinstance(data, dict) and (data.get('error') or {}).get('code') == 'maxlag'
+
+
+class HttpCache:
+    """
+    SQLite-backed JSON response cache with TTL, LRU size bound and hit/miss counters.
+
+    The database is opened lazily on first lookup, and new entries are buffered and
+    written in one transaction per `flush()`, so a save only writes what is new.
+    """
+
+    def __init__(self, path=CACHE_DB, ttl=DEFAULT_TTL, max_bytes=MAX_CACHE_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+        self._conn = None
+        self.pending = {}  # key -> row tuple not yet written
+        self.touched = {}  # key -> last access time not yet written
+        self.unchecked = 0  # Inserts since the last eviction check
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            # WAL keeps appends cheap and lets readers proceed during a flush
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed)")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url, params):
+        """Returns the cached JSON body, or None on a miss or an expired entry."""
+        key = make_key(url, params)
+        now = time.time()
+        with self.lock:
+            if key in self.pending:
+                self.hits += 1
+                return json.loads(self.pending[key][3])
+            row = self.conn.execute("SELECT body, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or (self.ttl and now - row[1] > self.ttl):
+                self.misses += 1
+                return None
+            self.touched[key] = now
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url, params, data):
+        key = make_key(url, params)
+        norm_url, norm_params = normalize_request(url, params)
+        body = json.dumps(data, ensure_ascii=False)
+        now = time.time()
+        with self.lock:
+            self.pending[key] = (key, norm_url, norm_params, body, len(body), now, now)
+            self.stores += 1
+            if len(self.pending) >= FLUSH_EVERY:
+                self.flush()
+
+    def flush(self):
+        """Writes only the buffered new entries and access times."""
+        with self.lock:
+            if not self.pending and not self.touched:
+                return
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO responses (key, url, params, body, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    list(self.pending.values())
+                )
+                self.conn.executemany(
+                    "UPDATE responses SET accessed = ? WHERE key = ?",
+                    [(t, k) for k, t in self.touched.items()]
+                )
+            self.unchecked += len(self.pending)
+            self.pending.clear()
+            self.touched.clear()
+            if self.unchecked >= EVICT_CHECK_EVERY:
+                self.unchecked = 0
+                self._evict()
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop the least recently used rows until we are back under 90% of the limit
+        excess = total - int(self.max_bytes * 0.9)
+        freed = 0
+        victims = []
+        for key, size in self.conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.conn.commit()
+        self.evictions += len(victims)
+
+    def get_json(self, url, params, headers=None, timeout=10, session=None, delay=0, limiter=None):
+        """
+        Cached GET returning the decoded JSON body.
+        On a miss the request is sent (after a `limiter` token, when given; then `delay`
+        seconds of politeness sleep). A 429 or maxlag refusal is never cached: it pauses
+        the limiter (or sleeps) for Retry-After and is re-sent up to THROTTLE_RETRIES times.
+        Returns None if the server does not answer 200. Network errors propagate.
+        """
+        data = self.get(url, params)
+        if data is not None:
+            return data
+        http = session or requests
+        for attempt in range(THROTTLE_RETRIES + 1):
+            if limiter:
+                limiter.acquire()
+            response = http.get(url, params=params, headers=headers or DEFAULT_HEADERS, timeout=timeout)
+            data = response.json() if response.status_code == 200 else None
+            if not is_throttled(response, data):
+                break
+            if attempt == THROTTLE_RETRIES:
+                return None
+            wait = retry_after(response)
+            if limiter:
+                limiter.pause(wait)
+            else:
+                time.sleep(wait)
+        if data is None:
+            return None
+        self.put(url, params, data)
+        if delay:
+            time.sleep(delay)
+        return data
+
+    def summary(self):
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return (f"HTTP cache: {self.hits} hits / {self.misses} misses ({rate:.1f}% hit rate), "
+                f"{self.stores} stored, {self.evictions} evicted")
+
+    def close(self):
+        with self.lock:
+            self.flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def import_legacy_search_cache(self, path):
+        """
+        One-time import of an old {query: search results} JSON cache as
+        wbsearchentities responses. Recorded in `meta`, so later runs never parse it again.
+        Composite entries (e.g. "WIKI:" Wikipedia lookups) have no single HTTP
+        equivalent and are skipped; they are re-derived from cached calls on first use.
+        """
+        if not os.path.exists(path):
+            return 0
+        marker = f"imported:{os.path.basename(path)}"
+        if self.conn.execute("SELECT 1 FROM meta WHERE name = ?", (marker,)).fetchone():
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            legacy = json.load(f)
+        count = 0
+        for key, results in legacy.items():
+            if key.startswith("WIKI:") or not isinstance(results, list):
+                continue
+            language = "en"
+            query = key
+            if key.startswith("wd_") and key.count("_") >= 2:
+                # 49_Deep_QID_Analysis keys: wd_{query}_{language}
+                query, language = key[3:].rsplit("_", 1)
+            params = {"action": "wbsearchentities", "search": query, "language": language,
+                      "format": "json", "limit": 5}
+            self.put(WBSEARCH_URL, params, {"search": results})
+            count += 1
+        self.flush()
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (marker, str(count)))
+        return count
+
+
+_shared_cache = None
+
+
+def get_cache():
+    """Returns the process-wide HttpCache instance."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = HttpCache()
+        # Buffered entries are written on normal interpreter exit as well
+        atexit.register(_shared_cache.flush)
+    return _shared_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain the shared Wikidata/Wikipedia HTTP cache")
+    parser.add_argument("--import-legacy", action="store_true", help="Import the old per-script JSON caches once")
+    args = parser.parse_args()
+
+    cache = get_cache()
+    if args.import_legacy:
+        for path in LEGACY_SEARCH_CACHES:
+            count = cache.import_legacy_search_cache(path)
+            print(f"Imported {count} entries from {os.path.basename(path)}")
+    rows, size = cache.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+    print(f"{cache.path}: {rows} entries, {size / 1024 / 1024:.1f} MB")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+import argparse
+import glob
+import os
+import re
+import time
+from typing import List, NamedTuple
+
+import pandas as pd
+
+from table_io import COLUMNAR_EXT, read_columnar, write_columnar
+
+# Streaming parser for the Index Markdown tables (03-Index/03-1-Index-MD/*.md).
+# Each letter file is read line by line into typed records: the five text columns,
+# plus the page references parsed into integer lists. All 19 letters are written to
+# one columnar cache that downstream stages load instead of re-parsing CSV text;
+# the per-letter CSVs in 03-2-Index-CSV are an export of the same records.
+
+# --- Configuration ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MD_DIR = os.path.join(REPO_ROOT, "03-Index", "03-1-Index-MD")
+CSV_DIR = os.path.join(REPO_ROOT, "03-Index", "03-2-Index-CSV")
+CACHE_FILE = os.path.join(REPO_ROOT, "03-Index", "index_tables" + COLUMNAR_EXT)
+
+COLUMNS = ['Main Entry', 'Location', 'Sub-entry', 'Detail', 'Page Numbers']
+
+UNESCAPED_PIPE = re.compile(r'(?<!\\)\|')
+ALIGN_CELL = re.compile(r'^:?-+:?$')
+PAGE_RANGE = re.compile(r'^(\d+)\s*[-–]\s*(\d+)$')
+PAGE_NUMBER = re.compile(r'^(\d+)(n?)$')
+ROMAN_PAGE = re.compile(r'^[ivxlc]+$', re.IGNORECASE)
+
+
+class IndexRecord(NamedTuple):
+    letter: str
+    main_entry: str
+    location: str
+    sub_entry: str
+    detail: str
+    page_numbers: str   # As printed: "45, 46n, 247-267"
+    pages: List[int]    # Every page referred to, ranges expanded: [45, 46, 247, ..., 267]
+    note_pages: List[int]  # Pages referred to by a note ("46n"): [46]
+    roman_pages: List[str]  # Front-matter pages: ["xvii"]
+
+
+# DataFrame column for each IndexRecord field
+FIELD_COLUMNS = dict(zip(IndexRecord._fields, ['Letter'] + COLUMNS + ['Pages', 'Note_Pages', 'Roman_Pages']))
+
+
+def split_cells(line):
+    """Cells of one pipe-table row; '\\|' inside a cell is a literal pipe."""
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|') and not line.endswith('\\|'):
+        line = line[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in UNESCAPED_PIPE.split(line)]
+
+
+def parse_pages(text):
+    """(pages, note_pages, roman_pages) for a Page Numbers cell like "xvii, 33, 46n, 63-93"."""
+    pages, notes, roman = [], [], []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        m = PAGE_NUMBER.match(part)
+        if m:
+            pages.append(int(m.group(1)))
+            if m.group(2):
+                notes.append(int(m.group(1)))
+            continue
+        m = PAGE_RANGE.match(part)
+        if m and int(m.group(1)) <= int(m.group(2)):
+            pages.extend(range(int(m.group(1)), int(m.group(2)) + 1))
+        elif ROMAN_PAGE.match(part):
+            roman.append(part)
+        else:
+            print(f"Unparsed page reference: {part!r}")
+    return pages, notes, roman
+
+
+def _closed(row):
+    """True when a buffered row ends with its closing (unescaped) pipe."""
+    return row.endswith('|') and not row.endswith('\\|')
+
+
+def iter_rows(lines):
+    """
+    Yields the cell lists of every table row in a stream of Markdown lines, header
+    and alignment rows excluded. A row that lacks its closing pipe, or has fewer
+    cells than the header, continues on the following line(s) (wrapped cell);
+    a blank line or the start of a new row ends it.
+    """
+    header = None
+
+    def emit(row):
+        nonlocal header
+        cells = split_cells(row)
+        if header is None:
+            header = cells
+        elif not all(ALIGN_CELL.match(c) for c in cells):
+            yield cells
+
+    pending = None
+    for line in lines:
+        text = line.strip()
+        if pending is not None:
+            if text and not (text.startswith('|') and _closed(pending)):
+                pending = pending + ' ' + text  # Wrapped cell
+            else:
+                yield from emit(pending)
+                pending = None
+        if pending is None:
+            if not text.startswith('|'):
+                continue
+            pending = text
+        if _closed(pending) and (header is None or len(split_cells(pending)) >= len(header)):
+            yield from emit(pending)
+            pending = None
+
+    if pending is not None:
+        yield from emit(pending)
+
+
+def iter_records(path):
+    """Typed IndexRecords of one letter file, streamed line by line."""
+    letter = os.path.splitext(os.path.basename(path))[0]
+    with open(path, encoding='utf-8-sig') as f:
+        for cells in iter_rows(f):
+            cells = (cells + [''] * len(COLUMNS))[:len(COLUMNS)]
+            pages, notes, roman = parse_pages(cells[4])
+            yield IndexRecord(letter, *cells, pages, notes, roman)
+
+
+def records_frame(records):
+    """DataFrame of IndexRecords, with the Index column names."""
+    return pd.DataFrame(list(records), columns=list(IndexRecord._fields)).rename(columns=FIELD_COLUMNS)
+
+
+def export_csv(df, csv_dir=CSV_DIR):
+    """Writes the five Index columns of every letter to csv_dir/<letter>.csv."""
+    os.makedirs(csv_dir, exist_ok=True)
+    for letter, rows in df.groupby('Letter', sort=False):
+        rows[COLUMNS].to_csv(os.path.join(csv_dir, f"{letter}.csv"), index=False)
+
+
+def build_index(md_dir=MD_DIR, cache=CACHE_FILE, csv_dir=None):
+    """Parses every letter table in md_dir into one frame; writes the cache (and CSVs when csv_dir is given)."""
+    md_files = sorted(glob.glob(os.path.join(md_dir, "*.md")), key=lambda p: os.path.basename(p).upper())
+    df = records_frame(record for path in md_files for record in iter_records(path))
+    write_columnar(df, cache)
+    if csv_dir:
+        export_csv(df, csv_dir)
+    return df
+
+
+def load_index(md_dir=MD_DIR, cache=CACHE_FILE):
+    """
+    All Index records as one frame (columns: Letter, the five Index columns, Pages,
+    Note_Pages, Roman_Pages). Served from the columnar cache unless a Markdown
+    file is newer, in which case the tables are re-parsed and the cache rewritten.
+    """
+    md_files = glob.glob(os.path.join(md_dir, "*.md"))
+    if os.path.exists(cache) and all(os.path.getmtime(p) <= os.path.getmtime(cache) for p in md_files):
+        return read_columnar(cache)
+    return build_index(md_dir, cache)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse the Index Markdown tables into the columnar cache and CSVs.")
+    parser.add_argument('--md-dir', default=MD_DIR)
+    parser.add_argument('--csv-dir', default=CSV_DIR, help="Where the per-letter CSVs are exported")
+    parser.add_argument('--no-csv', action='store_true', help="Only write the columnar cache")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    df = build_index(args.md_dir, csv_dir=None if args.no_csv else args.csv_dir)
+    print(f"Parsed {len(df)} rows from {df['Letter'].nunique()} letter tables "
+          f"in {time.perf_counter() - start:.2f}s -> {CACHE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import contextlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared per-file executor for the letter-split Index files (A_refined.csv ... UVWXYZ_refined.csv).
+# The letter files are independent, so a stage fans them out to a process pool and
+# a full re-run costs the slowest letter instead of the sum of all of them.
+# Each file's console output is captured in its worker and printed back in
+# alphabetical order together with the result, so logs read the same as a serial run.
+
+def letter_sort_key(path):
+    """Alphabetical order of the letter files by file name ("A_refined.csv" < "J，K_refined.csv")."""
+    return os.path.basename(path).upper()
+
+
+def _run_one(func, path):
+    """Worker side: (result, error, captured stdout, seconds) for one file."""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    result, error = None, None
+    with contextlib.redirect_stdout(buffer):
+        try:
+            result = func(path)
+        except Exception as e:
+            error = e
+    return result, error, buffer.getvalue(), time.perf_counter() - start
+
+
+def run_per_file(func, paths, workers=None, report=True):
+    """
+    Calls func(path) for every file, in a process pool of `workers` processes
+    (default: one per CPU, at most one per file; workers=1 runs in this process).
+    func must be a module-level function so it can be sent to the workers.
+    Returns [(path, result)] in alphabetical file order; a file whose call raised
+    is reported and gets None as result.
+    """
+    paths = sorted(paths, key=letter_sort_key)
+    if not paths:
+        return []
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths)))
+
+    start = time.perf_counter()
+    if workers == 1:
+        outcomes = (_run_one(func, path) for path in paths)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        futures = [pool.submit(_run_one, func, path) for path in paths]
+        outcomes = (future.result() for future in futures)
+
+    results, timings = [], []
+    try:
+        # Results are taken in file order, so output is replayed alphabetically as it arrives
+        for path, (result, error, output, seconds) in zip(paths, outcomes):
+            if output:
+                print(output, end='')
+            if error is not None:
+                print(f"Error processing {os.path.basename(path)}: {error}")
+            results.append((path, result))
+            timings.append((path, seconds))
+    finally:
+        if workers > 1:
+            pool.shutdown()
+
+    if report:
+        print_timings(timings, time.perf_counter() - start, workers)
+    return results
+
+
+def print_timings(timings, wall, workers):
+    """Per-file seconds, then wall clock against the serial sum and the slowest file."""
+    print(f"\n--- Per-file timings ({workers} worker{'s' if workers > 1 else ''}) ---")
+    for path, seconds in timings:
+        print(f"  {os.path.basename(path):<24} {seconds:7.2f}s")
+    slowest_path, slowest = max(timings, key=lambda t: t[1])
+    total = sum(seconds for _, seconds in timings)
+    print(f"  Wall: {wall:.2f}s | Sum of files: {total:.2f}s | "
+          f"Slowest: {os.path.basename(slowest_path)} ({slowest:.2f}s)")
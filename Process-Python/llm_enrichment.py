@@ -0,0 +1,357 @@
+import argparse
+import csv
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+try:
+    import google.generativeai as genai  # pip install google-generativeai
+except ImportError:
+    genai = None
+
+from encoding_repair import fix_mojibake, read_csv_auto
+from http_cache import HttpCache
+from name_normalization import flip_name
+
+# Re-runnable LLM enrichment of the merged entity list (05-EntityMerge -> 06-LLM-Enhancement).
+# The input is cut into token-budgeted batches of consecutive rows, several batches are
+# in flight at once against a pluggable backend, and every response is validated against
+# the Original_Entry,Refined_Formal_Name,Refined_Category,Status/Notes schema. Only the
+# rows that failed validation are re-batched and retried; the results are written back
+# as per-range shards ("1-100.csv") and one merged file, in ID order.
+# Rows are deduplicated by normalized entry before dispatch and answers are cached
+# (llm_cache.sqlite) under model + prompt version + normalized entry, so a re-run only
+# pays for entities the model has not answered yet; each answer is fanned back out to
+# every row that shares the entry.
+
+# --- Configuration ---
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUT_FILE = os.path.join(REPO_ROOT, "05-EntityMerge", "03-Simplified_Entities.csv")
+OUTPUT_DIR = os.path.join(REPO_ROOT, "06-LLM-Enhancement")
+MERGED_FILE = os.path.join(REPO_ROOT, "07-Data-Remerge", "01-Merged_LLM_Enhancement.csv")
+CACHE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_cache.sqlite")
+
+INPUT_COLUMNS = ['ID', 'Original Entity Name', 'Type', 'Original_Files']
+OUTPUT_COLUMNS = ['Original_Entry', 'Refined_Formal_Name', 'Refined_Category', 'Status/Notes']
+# Base categories; combinations ("Place/Organization") and qualifiers ("Person (Myth)") are allowed
+CATEGORIES = {'Person', 'Place', 'Work', 'Organization', 'Group', 'Concept', 'Event'}
+
+MAX_BATCH_ROWS = 100      # The hand-run batches were 100 rows
+MAX_BATCH_TOKENS = 4000   # Estimated input tokens per batch (the row CSV, without the instructions)
+MAX_RETRIES = 3           # Extra attempts for the rows that failed validation
+WORKERS = 4               # Batches in flight
+DEFAULT_MODEL = "gemini-1.5-pro"
+PROMPT_VERSION = "1"      # Bump whenever PROMPT_TEMPLATE changes meaning
+
+PROMPT_TEMPLATE = """你是一位精通 17-18 世纪欧洲艺术史的数据档案专家，熟悉 Francis Haskell《Patrons and Painters》的索引。
+Clean and standardize every entity in the CSV below.
+
+Rules:
+1. Repair OCR / encoding damage (谷 -> é, 角 -> à, 辰 -> ò, 迄 -> ù, 豕 -> è, 芍 -> á, 邦 -> ü, "Helm Breaker" -> "Helmbreker").
+2. Refined_Formal_Name is the standard scholarly name ("Last, First" becomes "First Last"; resolve nicknames and dialect names).
+3. Refined_Category is one of: Person, Place, Work, Organization, Group, Concept, Event (combine with "/" only when truly ambiguous).
+4. Status/Notes starts with a tag such as [Validation], [OCR Fix], [Category Fix], [Disambiguation] followed by a short note in Chinese.
+5. Do not invent information. Keep one output row per input row, in input order, unless an entry names several entities.
+
+Answer with CSV only, header exactly:
+Original_Entry,Refined_Formal_Name,Refined_Category,Status/Notes
+Original_Entry must repeat the "Original Entity Name" of the input row unchanged.
+
+INPUT:
+{rows}"""
+
+CODE_FENCE = re.compile(r'^```[a-zA-Z]*\s*|\s*```\s*$')
+
+
+def estimate_tokens(text):
+    """Rough token count: ~4 ASCII characters per token, one per CJK / accented character."""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii) // 4 + non_ascii + 1
+
+
+def entry_key(text):
+    """Match key between an input name and the Original_Entry the model echoes."""
+    if not isinstance(text, str):
+        return ''
+    return ' '.join(text.strip().strip('"\'').replace("'", '').split()).lower()
+
+
+def normalized_entry(name, cidoc_type):
+    """Dedup / cache key of an input row: its repaired, case-folded name and its CIDOC type."""
+    return entry_key(fix_mojibake(name)), str(cidoc_type)
+
+
+def cache_request(backend, key):
+    """The (url, params) an answer is stored under in the HttpCache: model, prompt version, normalized entry."""
+    name, cidoc_type = key
+    return f"llm://{backend.model}", {'prompt_version': PROMPT_VERSION, 'entry': name, 'type': cidoc_type}
+
+
+def rows_csv(batch):
+    buffer = io.StringIO()
+    batch[INPUT_COLUMNS].to_csv(buffer, index=False, lineterminator='\n')
+    return buffer.getvalue()
+
+
+def build_prompt(batch):
+    return PROMPT_TEMPLATE.format(rows=rows_csv(batch))
+
+
+def make_batches(df, max_tokens=MAX_BATCH_TOKENS, max_rows=MAX_BATCH_ROWS):
+    """Consecutive row slices of df, each within max_rows rows and about max_tokens input tokens."""
+    costs = [estimate_tokens(','.join(map(str, row))) for row in df[INPUT_COLUMNS].itertuples(index=False)]
+    batches, start, used = [], 0, 0
+    for i, cost in enumerate(costs):
+        if i > start and (i - start >= max_rows or used + cost > max_tokens):
+            batches.append(df.iloc[start:i])
+            start, used = i, 0
+        used += cost
+    if start < len(df):
+        batches.append(df.iloc[start:])
+    return batches
+
+
+def valid_category(category):
+    parts = [p.split('(')[0].strip() for p in str(category).split('/')]
+    return all(p in CATEGORIES for p in parts)
+
+
+def parse_response(text, batch):
+    """
+    Validates a model answer for a batch.
+    Returns ({ID: [output rows]}, {ID: failure reason}); every ID of the batch is in one of them.
+    Output rows are matched to input rows by Original_Entry, so split entities may add rows.
+    """
+    ids = list(batch['ID'])
+    keys = {}
+    for row_id, name in zip(ids, batch['Original Entity Name']):
+        keys.setdefault(entry_key(name), []).append(row_id)
+
+    text = CODE_FENCE.sub('', (text or '').strip())
+    reader = csv.reader(io.StringIO(text))
+    header = next(reader, None)
+    if header is None or [h.strip() for h in header] != OUTPUT_COLUMNS:
+        return {}, {row_id: f"bad header: {header}" for row_id in ids}
+
+    rows, failed = {}, {}
+    for record in reader:
+        if not any(cell.strip() for cell in record):
+            continue
+        if len(record) != len(OUTPUT_COLUMNS):
+            continue
+        entry, name, category, notes = (cell.strip() for cell in record)
+        candidates = keys.get(entry_key(entry))
+        if not candidates:
+            continue  # Not an entry of this batch
+        # Duplicate names in a batch are assigned in order; extra rows extend the last one (a split)
+        row_id = next((c for c in candidates if c not in rows and c not in failed), candidates[-1])
+        if not name:
+            failed[row_id] = "empty Refined_Formal_Name"
+        elif not valid_category(category):
+            failed[row_id] = f"invalid category: {category}"
+        elif row_id not in failed:
+            rows.setdefault(row_id, []).append(dict(zip(OUTPUT_COLUMNS, (entry, name, category, notes))))
+
+    for row_id in ids:
+        if row_id in failed:
+            rows.pop(row_id, None)
+        elif row_id not in rows:
+            failed[row_id] = "missing from response"
+    return rows, failed
+
+
+# --- Backends: complete(prompt) -> answer text ---
+
+class GeminiBackend:
+    def __init__(self, model=DEFAULT_MODEL, api_key=None, temperature=0.1):
+        if genai is None:
+            raise RuntimeError("google-generativeai is not installed (pip install google-generativeai)")
+        genai.configure(api_key=api_key or os.environ.get("GEMINI_API_KEY"))
+        self.model = model
+        self._client = genai.GenerativeModel(model)
+        self._config = {'temperature': temperature}
+
+    def complete(self, prompt):
+        return self._client.generate_content(prompt, generation_config=self._config).text
+
+
+class MockBackend:
+    """
+    Deterministic local stand-in for tests and dry runs. Answers from the input rows
+    alone (encoding repair, "Last, First" flip, category from the CIDOC type). With
+    fail_rate, that share of rows gets an invalid category on their first attempt,
+    chosen by a hash of the entry, to exercise the retry path.
+    """
+
+    TYPE_CATEGORIES = {
+        'E21 Person': 'Person', 'E53 Place': 'Place', 'E22 Man-Made Object': 'Work',
+        'E74 Group': 'Group', 'E28 Conceptual Object': 'Concept', 'E5 Event': 'Event',
+    }
+
+    def __init__(self, model="mock", fail_rate=0.0, latency=0.0):
+        self.model = model
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.calls = 0
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def _fails(self, name):
+        digest = hashlib.sha1(f"{self.model}|{name}".encode('utf-8')).digest()
+        with self._lock:
+            first = name not in self._seen
+            self._seen.add(name)
+        return first and digest[0] < self.fail_rate * 256
+
+    def complete(self, prompt):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        batch = pd.read_csv(io.StringIO(prompt.split("INPUT:\n", 1)[1]), dtype=str, keep_default_na=False)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(OUTPUT_COLUMNS)
+        for name, cidoc_type in zip(batch['Original Entity Name'], batch['Type']):
+            category = self.TYPE_CATEGORIES.get(cidoc_type, 'Concept')
+            refined = fix_mojibake(name.strip().strip("'"))
+            if category == 'Person':
+                refined = flip_name(refined)
+            if self._fails(name):
+                category = '???'
+            writer.writerow([name, refined, category, "[Validation] 本地模拟结果。"])
+        return buffer.getvalue()
+
+
+BACKENDS = {'gemini': GeminiBackend, 'mock': MockBackend}
+
+
+def failed_row(name, reason):
+    return {'Original_Entry': name, 'Refined_Formal_Name': '', 'Refined_Category': '',
+            'Status/Notes': f"[LLM Failed] {reason}"}
+
+
+def run_batch(backend, batch):
+    try:
+        return parse_response(backend.complete(build_prompt(batch)), batch)
+    except Exception as e:
+        return {}, {row_id: f"backend error: {e}" for row_id in batch['ID']}
+
+
+def enrich(df, backend, workers=WORKERS, max_tokens=MAX_BATCH_TOKENS, max_rows=MAX_BATCH_ROWS,
+           retries=MAX_RETRIES, cache=None):
+    """
+    Runs every row of df (INPUT_COLUMNS) through the backend.
+    Only the first row of each normalized entry is sent, and only when the cache
+    (an HttpCache, optional) has no answer for it; answers are copied to the
+    duplicate rows with their own Original_Entry.
+    Returns (shards, results): the first-pass batches of df, and {ID: [output rows]}
+    with rows that still fail after the retries kept as "[LLM Failed]" placeholders.
+    """
+    shards = make_batches(df, max_tokens, max_rows)
+    keys = dict(zip(df['ID'], map(normalized_entry, df['Original Entity Name'], df['Type'])))
+    unique = df[~df['ID'].map(keys).duplicated()]
+
+    answers = {}  # normalized entry -> output rows
+    for row_id in unique['ID']:
+        cached = cache.get(*cache_request(backend, keys[row_id])) if cache else None
+        if cached is not None:
+            answers[keys[row_id]] = cached
+    todo = unique[~unique['ID'].map(keys).isin(answers)]
+    tokens = estimate_tokens(rows_csv(todo)) if len(todo) else 0
+    print(f"{len(df)} rows, {len(unique)} unique entries: {len(unique) - len(todo)} cached, "
+          f"{len(todo)} to send (~{tokens} input tokens)")
+
+    failed = {}
+    pending = make_batches(todo, max_tokens, max_rows) if len(todo) else []
+    for attempt in range(retries + 1):
+        if not pending:
+            break
+        failed = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_batch, backend, batch) for batch in pending]
+            for done, future in enumerate(as_completed(futures), 1):
+                rows, batch_failed = future.result()
+                for row_id, output in rows.items():
+                    answers[keys[row_id]] = output
+                    if cache:
+                        cache.put(*cache_request(backend, keys[row_id]), output)
+                failed.update(batch_failed)
+                print(f"Attempt {attempt + 1}: batch {done}/{len(pending)} | failed rows: {len(failed)}", end='\r')
+        print()
+        # Only the failed rows go back to the model, re-batched
+        pending = make_batches(todo[todo['ID'].isin(failed)], max_tokens, max_rows) if failed else []
+    if cache:
+        cache.flush()
+
+    names = dict(zip(df['ID'], df['Original Entity Name']))
+    for row_id, reason in failed.items():
+        print(f"  Giving up on ID {row_id} ({names[row_id]}): {reason}")
+        answers[keys[row_id]] = [failed_row(names[row_id], reason)]  # Not cached
+    results = {row_id: [dict(row, Original_Entry=names[row_id]) for row in answers[keys[row_id]]]
+               for row_id in df['ID']}
+    return shards, results
+
+
+def shard_frame(batch, results):
+    return pd.DataFrame([row for row_id in batch['ID'] for row in results[row_id]], columns=OUTPUT_COLUMNS)
+
+
+def write_outputs(shards, results, output_dir=OUTPUT_DIR, merged_file=MERGED_FILE):
+    """One CSV per first-pass batch, named by its ID range, and the merged file in ID order."""
+    os.makedirs(output_dir, exist_ok=True)
+    frames = []
+    for batch in shards:
+        frame = shard_frame(batch, results)
+        frame.to_csv(os.path.join(output_dir, f"{batch['ID'].iloc[0]}-{batch['ID'].iloc[-1]}.csv"),
+                     index=False, encoding='utf-8-sig')
+        frames.append(frame)
+    merged = pd.concat(frames, ignore_index=True)
+    if merged_file:
+        os.makedirs(os.path.dirname(merged_file), exist_ok=True)
+        merged.to_csv(merged_file, index=False, encoding='utf-8-sig')
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched, concurrent LLM enrichment of the merged entity list.")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='gemini')
+    parser.add_argument('--model', default=None, help=f"Model name (default: {DEFAULT_MODEL})")
+    parser.add_argument('--input', default=INPUT_FILE)
+    parser.add_argument('--output-dir', default=OUTPUT_DIR)
+    parser.add_argument('--merged', default=MERGED_FILE)
+    parser.add_argument('--workers', type=int, default=WORKERS)
+    parser.add_argument('--max-tokens', type=int, default=MAX_BATCH_TOKENS)
+    parser.add_argument('--max-rows', type=int, default=MAX_BATCH_ROWS)
+    parser.add_argument('--retries', type=int, default=MAX_RETRIES)
+    parser.add_argument('--limit', type=int, default=None, help="Only the first N rows (trial run)")
+    parser.add_argument('--cache', default=CACHE_DB, help="SQLite answer cache")
+    parser.add_argument('--no-cache', action='store_true', help="Send every unique entry, ignore and skip the cache")
+    args = parser.parse_args()
+
+    df = read_csv_auto(args.input, dtype={'ID': int})
+    if args.limit:
+        df = df.head(args.limit)
+    backend_cls = BACKENDS[args.backend]
+    backend = backend_cls(model=args.model) if args.model else backend_cls()
+
+    cache = None if args.no_cache else HttpCache(args.cache, ttl=0)
+
+    start = time.perf_counter()
+    shards, results = enrich(df, backend, args.workers, args.max_tokens, args.max_rows, args.retries, cache)
+    merged = write_outputs(shards, results, args.output_dir, args.merged)
+    failed = merged['Status/Notes'].str.startswith('[LLM Failed]', na=False).sum()
+    print(f"{len(df)} entities -> {len(merged)} rows in {len(shards)} shards ({failed} failed) "
+          f"in {time.perf_counter() - start:.1f}s")
+    if cache:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
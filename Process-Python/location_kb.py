@@ -0,0 +1,116 @@
+import os
+
+import pandas as pd
+
+from fuzzy_index import FuzzyIndex
+
+# Shared location knowledge base for the 01-Process enrichment scripts.
+# The "Term" -> (Location, Chinese Reason) table lives in location_kb.csv and is
+# loaded once into pandas indexes: raw terms, plus normalized keys (quotes,
+# whitespace and case folded). Whole columns of Index entries are matched with
+# joins; only the few terms that still miss go through the prefix / fuzzy fallback.
+
+KB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "location_kb.csv")
+FUZZY_CUTOFF = 0.92  # difflib ratio needed for a fuzzy match on the normalized key
+MIN_PREFIX_WORDS = 2  # A prefix match must cover at least "Surname, First"
+PREFIX_CUTS = " ,(;"  # Where an entry may be cut for a prefix match
+
+
+def normalize_term(term):
+    """Match key: quotes stripped, whitespace collapsed, lower-cased."""
+    return " ".join(str(term).strip().strip('"').strip("'").split()).lower()
+
+
+def normalize_terms(terms):
+    """normalize_term over a Series."""
+    return terms.astype(str).str.strip().str.strip('"').str.strip("'").str.split().str.join(" ").str.lower()
+
+
+class LocationKB:
+    def __init__(self, path=KB_FILE):
+        table = pd.read_csv(path, encoding='utf-8', dtype=str, keep_default_na=False)
+        # Later rows win for a repeated term, as in the old dict literal
+        self.by_term = table.drop_duplicates('Term', keep='last').set_index('Term')
+        keys = normalize_terms(self.by_term.index.to_series())
+        self.key_to_term = pd.Series(self.by_term.index, index=keys.values)
+        self.key_to_term = self.key_to_term[~self.key_to_term.index.duplicated()]
+        self._fuzzy = None
+
+    def __len__(self):
+        return len(self.by_term)
+
+    def as_dict(self):
+        """{term: (location, reason_cn)}"""
+        return dict(zip(self.by_term.index, zip(self.by_term['Location'], self.by_term['Reason_CN'])))
+
+    def _fallback(self, term):
+        """(KB term, match type) for a term with no exact or normalized hit, or (None, None)."""
+        # Handle "Family": "Barberini family, the" -> "Barberini family"
+        if "family" in term.lower():
+            base_name = term.split()[0] + " family" if term.split() else ""
+            if base_name in self.by_term.index:
+                return base_name, "family"
+
+        key = normalize_term(term)
+        # Longest known term the entry starts with, cut at a word or punctuation boundary
+        # ("Albani, Cardinal Annibale (1692-1779)" -> "albani, cardinal annibale")
+        for cut in reversed([i for i, ch in enumerate(key) if ch in PREFIX_CUTS]):
+            prefix = key[:cut].rstrip(PREFIX_CUTS)
+            if len(prefix.split()) < MIN_PREFIX_WORDS:
+                break
+            if prefix in self.key_to_term.index:
+                return self.key_to_term[prefix], "prefix"
+
+        if self._fuzzy is None:
+            self._fuzzy = FuzzyIndex(list(self.key_to_term.index))
+        close = self._fuzzy.close_matches(key, n=1, cutoff=FUZZY_CUTOFF)
+        # Spelling variants keep the initial ("Feti" / "Fetti"); "Viola" is not "Piola"
+        if close and close[0][:1] == key[:1]:
+            return self.key_to_term[close[0]], "fuzzy"
+        return None, None
+
+    def match(self, terms, fallback=True):
+        """
+        KB entries for a Series of Index terms, as a frame aligned with it:
+        Term (the KB term that matched), Location, Reason_CN and Match
+        ('exact', 'clean', 'normalized', then with fallback 'family', 'prefix', 'fuzzy').
+        Rows without a match are NaN.
+        """
+        index = terms.index
+        terms = terms.reset_index(drop=True)
+        term = terms.astype(str).str.strip()
+        clean = term.str.strip("'")
+        known = self.by_term.index
+
+        # Try exact match, then without quotes, then on the normalized key
+        resolved = term.where(term.isin(known))
+        how = pd.Series(pd.NA, index=terms.index, dtype=object).mask(resolved.notna(), "exact")
+        for candidate, label in [(clean.where(clean.isin(known)), "clean"),
+                                 (normalize_terms(term).map(self.key_to_term), "normalized")]:
+            fill = resolved.isna() & candidate.notna()
+            resolved = resolved.mask(fill, candidate)
+            how = how.mask(fill, label)
+
+        if fallback:
+            missing = resolved.isna() & terms.notna()
+            found = {t: self._fallback(t) for t in term[missing].unique()}
+            resolved = resolved.mask(missing, term[missing].map(lambda t: found[t][0]))
+            how = how.mask(missing, term[missing].map(lambda t: found[t][1]))
+
+        return pd.DataFrame({
+            'Term': resolved,
+            'Location': resolved.map(self.by_term['Location']),
+            'Reason_CN': resolved.map(self.by_term['Reason_CN']),
+            'Match': how.where(resolved.notna()),
+        }).set_index(index)
+
+
+_shared_kb = None
+
+
+def get_kb():
+    """Returns the process-wide LocationKB, loading location_kb.csv on first use."""
+    global _shared_kb
+    if _shared_kb is None:
+        _shared_kb = LocationKB()
+    return _shared_kb
@@ -1,5 +1,6 @@
 import pandas as pd
 import os
+from fuzzy_index import FuzzyIndex
 
 # Define paths
 base_dir = r"c:\Users\001\Desktop\Github-Project\PnPDataset"
@@ -7,8 +8,6 @@ corrected_file = os.path.join(base_dir, r"09-MissingQID-LLM-Fillin\07-Human-Merg
 worklist_file = os.path.join(base_dir, r"10-Worklist-index\Worklist_Plates.csv")
 output_file = os.path.join(base_dir, r"10-Worklist-index\Worklist_Plates_Matched.csv")
 
-import difflib
-
 print(f"Loading QID source: {corrected_file}")
 df_qid = pd.read_csv(corrected_file)
 
@@ -22,9 +21,8 @@ df_qid_clean = df_qid.dropna(subset=['Original-QID'])
 name_to_qid = dict(zip(df_qid_clean['Refined_Formal_Name'].str.strip(), df_qid_clean['Original-QID'].astype(str).str.strip()))
 # Also create a lower-case map for case-insensitive lookup
 name_to_qid_lower = {k.lower(): v for k, v in name_to_qid.items()}
-# List of known names for fuzzy matching
-known_names = list(name_to_qid.keys())
-known_names_lower = [n.lower() for n in known_names]
+# Blocking index over known names for substring / fuzzy matching
+known_index = FuzzyIndex(name_to_qid.keys())
 
 print(f"Loaded {len(name_to_qid)} QID mappings.")
 
@@ -71,10 +69,7 @@ def get_qid(name):
     # 3. Substring / Token Match (The "Fuzzy" part)
     # We look for the target being a substring of a known name
     # e.g. "Bernini" in "Gian Lorenzo Bernini"
-    candidates = []
-    for idx, known in enumerate(known_names_lower):
-        if target_lower in known:
-            candidates.append(known_names[idx])
+    candidates = known_index.containing(target)
             
     if candidates:
         # Heuristic: Pick the shortest match that contains the target
@@ -88,8 +83,8 @@ def get_qid(name):
         return name_to_qid[best_match]
         
     # 4. Difflib Close Match (for typos)
-    # cutoff=0.8 means 80% similarity
-    matches = difflib.get_close_matches(target, known_names, n=1, cutoff=0.8)
+    # cutoff=0.8 means 80% similarity, scored only against blocked candidates
+    matches = known_index.close_matches(target, n=1, cutoff=0.8)
     if matches:
         best_match = matches[0]
         fuzzy_matches_log.append(f"'{target}' -> '{best_match}' (Similarity)")
@@ -0,0 +1,230 @@
+import re
+from functools import lru_cache
+
+# Shared name normalization for the analysis and crosscheck scripts.
+# Titles, abbreviations and stopwords are each compiled once into a single
+# alternation regex (instead of one re.sub per entry), and every public
+# normalizer is memoized, since the same names recur across index files.
+
+# --- Configuration & Dictionaries ---
+
+# Titles to strip for Person matching
+TITLES = [
+    'Sir', 'Lord', 'Lady', 'Duke', 'Duchess', 'Count', 'Countess', 'Earl', 'Baron',
+    'Prince', 'Princess', 'King', 'Queen', 'Cardinal', 'Pope', 'Bishop', 'Abbot',
+    'Fra', 'Don', 'Donna', 'Marchese', 'Marchesa', 'Cavaliere', 'Abate', 'Monsignor'
+]
+
+# Extra titles seen in the audit list (formal full names)
+AUDIT_TITLES = TITLES + [
+    'President', 'Président', 'Mme', 'Mlle', 'Mr', 'Mrs', 'Dr', 'Prof', 'Archbishop-Elector'
+]
+
+# Abbreviations to expand for Place/Group matching (lower-case key -> expansion)
+ABBREVIATIONS = {
+    's': 'San',        # S. -> San (Italian context default)
+    'st': 'Saint',     # St. -> Saint
+    'sta': 'Santa',    # Sta. -> Santa
+    'ss': 'Santi',     # SS. -> Santi
+    'pza': 'Piazza',   # Pza. -> Piazza
+    'pal': 'Palazzo',  # Pal. -> Palazzo
+    'ch': 'Church',    # Ch. -> Church
+    'acad': 'Academy'  # Acad. -> Academy
+}
+
+# Stopwords that might cause noise in "Contains" matching
+STOPWORDS = {'the', 'of', 'de', 'di', 'da', 'del', 'della', 'and', '&', 'a', 'in'}
+
+# Nickname Mapping (Based on research)
+NICKNAMES = {
+    'baciccio': 'Giovanni Battista Gaulli',
+    'baciccia': 'Giovanni Battista Gaulli',
+    'monsù desiderio': 'François de Nomé',
+    'il guercino': 'Giovanni Francesco Barbieri',
+    'guercino': 'Giovanni Francesco Barbieri',
+    'canaletto': 'Giovanni Antonio Canal',
+    'tintoretto': 'Jacopo Robusti',
+    'domenichino': 'Domenico Zampieri',
+    'parmigianino': 'Girolamo Francesco Maria Mazzola',
+    'pontormo': 'Jacopo Carucci',
+    'bronzino': 'Agnolo di Cosimo',
+    'veronese': 'Paolo Caliari',
+    'bernini': 'Gian Lorenzo Bernini',  # Often just listed as Bernini
+    'borromini': 'Francesco Borromini'
+}
+
+# Work titles written as "Subject, prefix" ("Magi, Adoration of the")
+INVERTED_WORK_PREFIXES = ('status of', 'development of', 'adoration of', 'portrait of', 'view of')
+
+
+def _alternation(words):
+    # Longest first, so "Countess" is tried before "Count"
+    return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+TITLE_RE = re.compile(r'\b(?:' + _alternation(TITLES) + r')\b\.?', re.IGNORECASE)
+AUDIT_TITLE_RE = re.compile(r'\b(?:' + _alternation(AUDIT_TITLES) + r')\b\.?', re.IGNORECASE)
+# Searched on lower-cased text to detect People misfiled as Works
+AUDIT_TITLE_WORD_RE = re.compile(r'\b(' + _alternation(t.lower() for t in AUDIT_TITLES) + r')\b')
+ABBREVIATION_RE = re.compile(r'\b(' + _alternation(ABBREVIATIONS) + r')\.\s', re.IGNORECASE)
+STOPWORD_RE = re.compile(r'(?<!\S)(?:' + _alternation(STOPWORDS) + r')(?!\S)', re.IGNORECASE)
+PARENTHESES_RE = re.compile(r'\(.*?\)')
+
+# CIDOC types normalized as Places/Groups; everything else that is not a Person is a Work
+PLACE_GROUP_TYPES = {'E53 Place', 'E74 Group'}
+
+
+# --- Normalization Functions ---
+
+def clean_text(text):
+    if not isinstance(text, str):
+        return ""
+    # Remove quotes and extra spaces
+    text = text.strip().strip('"').strip("'")
+    text = " ".join(text.split())
+    return text
+
+
+def strip_titles(name, pattern=TITLE_RE):
+    """Removes known titles from the name."""
+    return " ".join(pattern.sub('', name).split())
+
+
+def expand_abbreviations(name):
+    """Expands common abbreviations ("S. Luca" -> "San Luca")."""
+    return ABBREVIATION_RE.sub(lambda m: ABBREVIATIONS[m.group(1).lower()] + ' ', name)
+
+
+def strip_stopwords(name):
+    """Drops stopwords ("the", "of", "di", ...) for loose "contains" matching."""
+    return " ".join(STOPWORD_RE.sub('', name).split())
+
+
+def remove_parentheses(name):
+    # Remove content in parentheses e.g. (Pope Clement XI)
+    return PARENTHESES_RE.sub('', name).strip()
+
+
+def flip_name(name):
+    """Flips 'Last, First' to 'First Last'."""
+    if "," in name:
+        parts = name.split(",", 1)
+        if len(parts) == 2:
+            return f"{parts[1].strip()} {parts[0].strip()}"
+    return name
+
+
+# --- Match keys (lower-case, used to join Index entries with the Handmade tables) ---
+
+@lru_cache(maxsize=None)
+def normalize_person(name):
+    """Pipeline for Person names."""
+    # 1. Flip if comma exists (Index format: Last, First)
+    if "," in name:
+        name = flip_name(name)
+
+    # 2. Strip Titles (e.g., "Cardinal Annibale Albani" -> "Annibale Albani")
+    name = strip_titles(name)
+
+    return name.lower().strip()
+
+
+@lru_cache(maxsize=None)
+def normalize_place_group(name):
+    """Pipeline for Places and Groups."""
+    # 1. Expand Abbreviations (e.g., "S. Luca" -> "San Luca")
+    name = expand_abbreviations(name)
+
+    # 2. Remove "The" at start
+    if name.lower().startswith("the "):
+        name = name[4:]
+
+    return name.lower().strip()
+
+
+@lru_cache(maxsize=None)
+def normalize_work(name):
+    """Pipeline for Works/Concepts."""
+    if name.lower().startswith("the "):
+        name = name[4:]
+    return name.lower().strip()
+
+
+@lru_cache(maxsize=None)
+def normalize_for_type(name, cidoc_type):
+    """Match key for an Index entry, chosen by its CIDOC type."""
+    if cidoc_type == 'E21 Person':
+        return normalize_person(name)
+    if cidoc_type in PLACE_GROUP_TYPES:
+        return normalize_place_group(name)
+    return normalize_work(name)
+
+
+# --- Formal full names (audit list) ---
+
+@lru_cache(maxsize=None)
+def normalize_person_full(name):
+    # 1. Check Nickname Dictionary first (Exact match on raw or simple clean)
+    simple_name = name.lower().strip().strip("'").strip('"')
+    if simple_name in NICKNAMES:
+        return NICKNAMES[simple_name]
+
+    # 2. Remove Parentheses (Roles, Aliases)
+    # e.g. "Albani, Gianfrancesco (Pope Clement XI)" -> "Albani, Gianfrancesco"
+    name = remove_parentheses(name)
+
+    # 3. Flip Name (Last, First -> First Last)
+    name = flip_name(name)
+
+    # 4. Strip Titles and extra spaces
+    # e.g. "Cardinal Annibale Albani" -> "Annibale Albani"
+    return strip_titles(name, AUDIT_TITLE_RE)
+
+
+@lru_cache(maxsize=None)
+def normalize_place_full(name):
+    lower_name = name.lower()
+
+    # Special Case: "Alticchiero (Querini villa)" -> "Villa Alticchiero"
+    if 'alticchiero' in lower_name and 'villa' in lower_name:
+        return "Villa Alticchiero"
+
+    name = remove_parentheses(name)
+
+    # Standardize Building Types (English -> Italian)
+    # "X Palace" -> "Palazzo X"
+    if lower_name.endswith(' palace'):
+        core = name[:-7].strip()  # remove " palace"
+        return f"Palazzo {core}"
+
+    # "X Villa" -> "Villa X"
+    if lower_name.endswith(' villa'):
+        core = name[:-6].strip()
+        return f"Villa {core}"
+
+    # Expand Abbreviations
+    name = name.replace("S.", "San").replace("St.", "Saint")
+
+    return name.strip()
+
+
+@lru_cache(maxsize=None)
+def normalize_work_full(name):
+    # 1. Remove quotes
+    name = clean_text(name)
+
+    # 2. Expand Abbreviations common in titles
+    name = name.replace("St.", "Saint").replace("S.", "San")
+
+    # 3. Handle Inversions "Artists, status of" -> "Status of artists"
+    if "," in name:
+        p1, p2 = (p.strip() for p in name.split(",", 1))
+        if p2.lower().startswith(INVERTED_WORK_PREFIXES):
+            return f"{p2} {p1}"
+
+    return name
+
+
+def has_title(name):
+    """True if the name contains a person title as a whole word (e.g. "King", not "Seeking")."""
+    return bool(AUDIT_TITLE_WORD_RE.search(name.lower()))
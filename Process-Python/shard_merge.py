@@ -0,0 +1,147 @@
+import argparse
+import os
+import re
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from encoding_repair import read_csv_auto
+from letter_executor import letter_sort_key
+from table_io import LLM_SHARD_SCHEMA, SCHEMA_DTYPES, TRIPLE_SHARD_SCHEMA, apply_schema
+
+# Streaming merger for shard folders (06-LLM-Enhancement/1-100.csv ..., the per-letter
+# *_Triples.csv files). Shards are ordered by the ID range in their name (1-100, 101-200,
+# ..., 1001-1100) instead of lexically, read one at a time with the fixed schema's dtypes
+# (label columns as categoricals), and appended to the output as they are read, so
+# memory holds one shard, not the whole merge. Row counts are checked against the
+# range names, and gaps / overlaps between consecutive ranges are reported.
+
+SCHEMAS = {'llm': LLM_SHARD_SCHEMA, 'triples': TRIPLE_SHARD_SCHEMA}
+
+# The last "start-end" in a file name: "301-400 .csv", "01-Rows_With_Two 101-200.csv"
+RANGE_NAME = re.compile(r'(\d+)\s*-\s*(\d+)')
+
+
+class ShardReport(NamedTuple):
+    path: str
+    rows: int
+    id_range: Optional[tuple]  # (start, end) from the file name, None for a letter / unnamed shard
+
+    @property
+    def expected(self):
+        return self.id_range[1] - self.id_range[0] + 1 if self.id_range else None
+
+
+def shard_range(path):
+    """(start, end) of the ID range a shard's file name declares, or None."""
+    matches = RANGE_NAME.findall(os.path.splitext(os.path.basename(path))[0])
+    if not matches:
+        return None
+    start, end = map(int, matches[-1])
+    return (start, end) if start <= end else None
+
+
+def shard_sort_key(path):
+    """Range shards by (start, end); shards without a range after them, alphabetically."""
+    id_range = shard_range(path)
+    if id_range:
+        return (0, id_range, letter_sort_key(path))
+    return (1, (0, 0), letter_sort_key(path))
+
+
+def sort_shards(paths):
+    return sorted(paths, key=shard_sort_key)
+
+
+def read_shard(path, schema):
+    """One shard with the schema's dtypes (other columns are inferred)."""
+    return read_csv_auto(path, dtype={col: SCHEMA_DTYPES[kind] for col, kind in schema.items()})
+
+
+def conform(df, schema, name=''):
+    """df with exactly the schema's columns, in order and typed; extra columns are dropped with a note."""
+    extra = [c for c in df.columns if c not in schema and not str(c).startswith('Unnamed')]
+    if extra:
+        print(f"  {name}: dropping columns not in the schema: {extra}")
+    return apply_schema(df.reindex(columns=list(schema)), schema)
+
+
+def merge_shards(paths, output, schema, transform=None, sort=True):
+    """
+    Appends the shards to `output` (CSV, utf-8-sig) in range order (in the given
+    order with sort=False), one shard in memory at a time. transform(df, path) may
+    reshape a shard before it is conformed to the schema, or return None to skip it.
+    The file is written under a temporary name and moved into place at the end.
+    Returns [ShardReport] in merge order.
+    """
+    reports = []
+    tmp_path = output + '.tmp'
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(tmp_path, 'w', encoding='utf-8-sig', newline='') as f:
+        for path in (sort_shards(paths) if sort else paths):
+            name = os.path.basename(path)
+            try:
+                df = read_shard(path, schema)
+                if transform is not None:
+                    df = transform(df, path)
+                    if df is None:
+                        continue
+            except Exception as e:
+                print(f"  Error reading {name}: {e}")
+                continue
+            df = conform(df, schema, name)
+            df.to_csv(f, index=False, header=not reports, lineterminator='\n')
+            reports.append(ShardReport(path, len(df), shard_range(path)))
+        if not reports:
+            # An empty merge still gets its header
+            pd.DataFrame(columns=list(schema)).to_csv(f, index=False, lineterminator='\n')
+    os.replace(tmp_path, output)
+    return reports
+
+
+def id_span(start, end):
+    return f"ID {start}" if start == end else f"IDs {start}-{end}"
+
+
+def check_reports(reports):
+    """
+    Row counts against the range names, and gaps / overlaps between consecutive
+    ranges. Returns the list of problems (also printed); an LLM that splits an entry
+    into several rows shows up as a shard with extra rows.
+    """
+    problems = []
+    previous = None
+    for report in reports:
+        name = os.path.basename(report.path)
+        if report.id_range is None:
+            continue
+        if report.rows != report.expected:
+            problems.append(f"{name}: {report.rows} rows for a {report.expected}-row range "
+                            f"({report.rows - report.expected:+d})")
+        if previous is not None:
+            start, end = report.id_range[0], previous.id_range[1]
+            if start > end + 1:
+                problems.append(f"{name}: {id_span(end + 1, start - 1)} missing before this shard")
+            elif start <= end:
+                problems.append(f"{name}: {id_span(start, min(end, report.id_range[1]))} overlap "
+                                f"{os.path.basename(previous.path)}")
+        previous = report
+    for problem in problems:
+        print(f"  [Check] {problem}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge shard CSVs in ID-range order into one CSV, streaming.")
+    parser.add_argument('shards', nargs='+', help="Shard files")
+    parser.add_argument('-o', '--output', required=True)
+    parser.add_argument('--schema', choices=sorted(SCHEMAS), default='llm')
+    args = parser.parse_args()
+
+    reports = merge_shards(args.shards, args.output, SCHEMAS[args.schema])
+    check_reports(reports)
+    print(f"Merged {sum(r.rows for r in reports)} rows from {len(reports)} shards -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
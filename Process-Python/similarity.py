@@ -0,0 +1,183 @@
+import re
+
+import numpy as np
+
+# Batched string similarity on NumPy.
+# Strings are encoded as padded code-point arrays and every (query, candidate)
+# pair advances through the dynamic-programming table together, one row per
+# character of the longer side, instead of one SequenceMatcher call per pair.
+#
+# Metrics (all in [0, 1]):
+#   ratio         2 * LCS / (len(a) + len(b)) - the InDel ratio, the same measure as
+#                 rapidfuzz fuzz.ratio and a close stand-in for SequenceMatcher.ratio()
+#   levenshtein   1 - edit_distance / max(len(a), len(b))
+#   jaro_winkler  Jaro similarity with the Winkler prefix bonus (p = 0.1, up to 4 chars,
+#                 applied above a Jaro score of 0.7)
+#   token_set     fuzzywuzzy-style token set ratio built on `ratio`
+
+CHUNK_PAIRS = 20000  # Pairs per kernel call, bounds memory to CHUNK_PAIRS x max length
+
+
+def _encode(strings, pad):
+    """Returns (codes, lengths): a padded int32 code-point matrix and the string lengths."""
+    lengths = np.array([len(s) for s in strings], dtype=np.int64)
+    width = max(int(lengths.max()) if len(strings) else 0, 1)
+    codes = np.full((len(strings), width), pad, dtype=np.int32)
+    for row, s in enumerate(strings):
+        if s:
+            codes[row, :len(s)] = np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
+    return codes, lengths
+
+
+def _lcs_ratio(A, la, B, lb):
+    n = len(la)
+    prev = np.zeros((n, B.shape[1] + 1), dtype=np.int32)
+    lcs = np.zeros(n, dtype=np.int64)
+    rows = np.arange(n)
+    for i in range(A.shape[1]):
+        eq = (B == A[:, i:i + 1]).astype(np.int32)
+        cur = np.empty_like(prev)
+        cur[:, 0] = 0
+        cur[:, 1:] = np.maximum(prev[:, :-1] + eq, prev[:, 1:])
+        # The left neighbour only ever carries a value forward: a running max
+        np.maximum.accumulate(cur, axis=1, out=cur)
+        done = la == i + 1
+        lcs[done] = cur[rows[done], lb[done]]
+        prev = cur
+    total = la + lb
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(total > 0, 2.0 * lcs / np.maximum(total, 1), 1.0)
+
+
+def _levenshtein(A, la, B, lb):
+    n = len(la)
+    width = B.shape[1] + 1
+    offsets = np.arange(width, dtype=np.int32)
+    prev = np.tile(offsets, (n, 1))
+    dist = lb.copy()  # Empty query: distance is the candidate length
+    rows = np.arange(n)
+    for i in range(A.shape[1]):
+        cost = (B != A[:, i:i + 1]).astype(np.int32)
+        cur = np.empty_like(prev)
+        cur[:, 0] = i + 1
+        cur[:, 1:] = np.minimum(prev[:, :-1] + cost, prev[:, 1:] + 1)
+        # Insertions: d[j] = min_k (t[k] + j - k), i.e. a running min of t[k] - k
+        cur = np.minimum.accumulate(cur - offsets, axis=1) + offsets
+        done = la == i + 1
+        dist[done] = cur[rows[done], lb[done]]
+        prev = cur
+    longest = np.maximum(la, lb)
+    return np.where(longest > 0, 1.0 - dist / np.maximum(longest, 1), 1.0)
+
+
+def _jaro_winkler(A, la, B, lb, prefix_weight=0.1, boost_threshold=0.7):
+    n = len(la)
+    rows = np.arange(n)
+    cols = np.arange(B.shape[1])
+    window = np.maximum(np.maximum(la, lb) // 2 - 1, 0)
+    b_used = np.zeros(B.shape, dtype=bool)
+    a_used = np.zeros(A.shape, dtype=bool)
+    for i in range(A.shape[1]):
+        # First unused equal character of b inside the match window
+        near = np.abs(cols[None, :] - i) <= window[:, None]
+        mask = (B == A[:, i:i + 1]) & ~b_used & near & (i < la)[:, None]
+        found = mask.any(axis=1)
+        j = mask.argmax(axis=1)
+        b_used[rows[found], j[found]] = True
+        a_used[found, i] = True
+    matches = a_used.sum(axis=1)
+    # Matched characters in order on both sides; transpositions are the mismatches / 2
+    a_seq = np.take_along_axis(A, np.argsort(~a_used, axis=1, kind='stable'), axis=1)
+    b_seq = np.take_along_axis(B, np.argsort(~b_used, axis=1, kind='stable'), axis=1)
+    width = min(a_seq.shape[1], b_seq.shape[1])
+    in_match = np.arange(width)[None, :] < matches[:, None]
+    transpositions = ((a_seq[:, :width] != b_seq[:, :width]) & in_match).sum(axis=1) / 2
+    m = np.maximum(matches, 1)
+    jaro = np.where(matches > 0,
+                    (matches / np.maximum(la, 1) + matches / np.maximum(lb, 1) + (matches - transpositions) / m) / 3,
+                    0.0)
+    jaro = np.where((la == 0) & (lb == 0), 1.0, jaro)
+    k = min(4, A.shape[1], B.shape[1])
+    same = (A[:, :k] == B[:, :k]) & (np.arange(k)[None, :] < np.minimum(la, lb)[:, None])
+    prefix = np.cumprod(same, axis=1).sum(axis=1)
+    return np.where(jaro > boost_threshold, jaro + prefix * prefix_weight * (1 - jaro), jaro)
+
+
+def _string_ratio(a, b):
+    return _lcs_ratio(*_encode(a, -1), *_encode(b, -2))
+
+
+def _token_set(a, b):
+    t0s, t1s, t2s, one_empty = [], [], [], []
+    for x, y in zip(a, b):
+        tx, ty = set(re.findall(r'\w+', x)), set(re.findall(r'\w+', y))
+        common = " ".join(sorted(tx & ty))
+        t1 = " ".join(filter(None, [common, " ".join(sorted(tx - ty))]))
+        t2 = " ".join(filter(None, [common, " ".join(sorted(ty - tx))]))
+        t0s.append(common)
+        t1s.append(t1)
+        t2s.append(t2)
+        one_empty.append(bool(tx) != bool(ty))
+    # With no shared tokens t0 is empty and only the t1 / t2 comparison counts; a side
+    # without any tokens scores 0 (t0 and t2 would both be '' and compare as equal)
+    score = np.maximum(_string_ratio(t1s, t2s), np.maximum(_string_ratio(t0s, t1s), _string_ratio(t0s, t2s)))
+    return np.where(one_empty, 0.0, score)
+
+
+# Kernels over encoded (codes, lengths) arrays; token_set works on the strings themselves
+METRICS = {
+    'ratio': _lcs_ratio,
+    'levenshtein': _levenshtein,
+    'jaro_winkler': _jaro_winkler,
+    'token_set': None,
+}
+
+
+def _prepare(strings, lower):
+    return [str(x).lower() if lower else str(x) for x in strings]
+
+
+def _score_indexed(a, b, ia, ib, metric):
+    """Scores pairs (a[ia[k]], b[ib[k]]), encoding each distinct string only once."""
+    out = np.empty(len(ia), dtype=np.float64)
+    if metric == 'token_set':
+        for start in range(0, len(ia), CHUNK_PAIRS):
+            sl = slice(start, start + CHUNK_PAIRS)
+            out[sl] = _token_set([a[k] for k in ia[sl]], [b[k] for k in ib[sl]])
+        return out
+    kernel = METRICS[metric]
+    A, la = _encode(a, -1)
+    B, lb = _encode(b, -2)
+    # Group pairs of similar length so little work is spent on padding
+    order = np.argsort(np.maximum(la[ia], lb[ib]), kind='stable')
+    for start in range(0, len(order), CHUNK_PAIRS):
+        idx = order[start:start + CHUNK_PAIRS]
+        ra, rb = ia[idx], ib[idx]
+        wa, wb = max(int(la[ra].max()), 1), max(int(lb[rb].max()), 1)
+        out[idx] = kernel(A[ra, :wa], la[ra], B[rb, :wb], lb[rb])
+    return out
+
+
+def pair_scores(a, b, metric='ratio', lower=True):
+    """Similarity of a[k] vs b[k] for every k. Non-strings are converted with str()."""
+    if len(a) != len(b):
+        raise ValueError("pair_scores needs two sequences of equal length")
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}; expected one of {sorted(METRICS)}")
+    if not len(a):
+        return np.zeros(0)
+    k = np.arange(len(a))
+    return _score_indexed(_prepare(a, lower), _prepare(b, lower), k, k, metric)
+
+
+def similarity_matrix(queries, candidates, metric='ratio', lower=True):
+    """Returns a len(queries) x len(candidates) array of similarities."""
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}; expected one of {sorted(METRICS)}")
+    queries = _prepare(queries, lower)
+    candidates = _prepare(candidates, lower)
+    if not queries or not candidates:
+        return np.zeros((len(queries), len(candidates)))
+    ia = np.repeat(np.arange(len(queries)), len(candidates))
+    ib = np.tile(np.arange(len(candidates)), len(queries))
+    return _score_indexed(queries, candidates, ia, ib, metric).reshape(len(queries), len(candidates))
@@ -0,0 +1,144 @@
+import os
+
+import pandas as pd
+
+from encoding_repair import read_csv_auto
+
+try:
+    import pyarrow  # noqa: F401  (listed in requirements.txt) enables Parquet intermediates
+except ImportError:
+    pyarrow = None
+
+# Shared table I/O for the pipeline stages.
+# A stage writes its result as a columnar intermediate (Parquet with pyarrow, else a
+# pandas pickle) next to the CSV/XLSX path it names, keyed on the full file name
+# (04-X.csv -> 04-X.csv.parquet, 04-X.xlsx -> 04-X.xlsx.parquet); the CSV/XLSX
+# deliverable is an optional export of the same frame. Readers load the intermediate
+# when it is at least as new as the text file, so a reload takes milliseconds and needs
+# no encoding guesswork. A text file with no (or an older) intermediate is parsed, with
+# the encoding sniffed once by encoding_repair; readers never write intermediates,
+# only write_table does.
+
+COLUMNAR_EXT = '.parquet' if pyarrow else '.pkl'
+
+# Explicit column types: 'text' (str or missing), 'int' (nullable integer) or
+# 'category' (low-cardinality labels). Columns not listed keep the type pandas infers.
+SCHEMA_DTYPES = {'text': object, 'int': 'Int64', 'category': 'category'}
+
+RECHECK_SCHEMA = {
+    'Original_Entry': 'text',
+    'Refined_Formal_Name': 'text',
+    'Refined_Category': 'text',
+    'Status/Notes': 'text',
+    'QID': 'text',
+    'Original-QID': 'text',
+    'Original-Refined_Category': 'text',
+    'Original-Status/Notes': 'text',
+    'Second-Query_QID': 'text',
+    'Second-Query_Label': 'text',
+    'Second-Query_Description': 'text',
+    'Second-Query_Logic': 'text',
+}
+
+TRIPLE_SCHEMA = {
+    '序号': 'int',
+    'Subject': 'text',
+    'Subject QID': 'text',
+    'Predicate': 'text',
+    'Object': 'text',
+    'Object QID': 'text',
+    'Source_Raw': 'text',
+}
+
+# Shards as they come out of an LLM batch / a per-letter extraction
+LLM_SHARD_SCHEMA = {
+    'Original_Entry': 'text',
+    'Refined_Formal_Name': 'text',
+    'Refined_Category': 'category',
+    'Status/Notes': 'text',
+}
+
+TRIPLE_SHARD_SCHEMA = {
+    'Subject': 'text',
+    'Subject QID': 'text',
+    'Predicate': 'category',
+    'Object': 'text',
+    'Object QID': 'text',
+    'Source_Raw': 'text',
+}
+
+
+def columnar_path(path):
+    """The intermediate file for a CSV/XLSX path: the full file name plus the columnar extension."""
+    return path + COLUMNAR_EXT
+
+
+def apply_schema(df, schema):
+    """
+    Casts the schema's columns in place ('text' -> object column of str or NaN,
+    'int' -> Int64, 'category' -> categorical); returns df. Columns already of that dtype (an intermediate
+    written through this module) are left as they are.
+    """
+    for col, kind in (schema or {}).items():
+        if col not in df.columns or df[col].dtype == SCHEMA_DTYPES[kind]:
+            continue
+        if kind == 'int':
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
+        elif kind == 'category':
+            df[col] = df[col].astype('category')
+        else:
+            values = df[col].astype(object)
+            present = values.notna()
+            values[present] = values[present].map(str)
+            df[col] = values
+    return df
+
+
+def write_columnar(df, path):
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_pickle(path)
+
+
+def read_columnar(path):
+    return pd.read_parquet(path) if path.endswith('.parquet') else pd.read_pickle(path)
+
+
+def read_text_table(path):
+    """Parses a CSV (encoding sniffed, one parse) or an Excel workbook."""
+    if path.lower().endswith(('.xlsx', '.xls')):
+        return pd.read_excel(path)
+    return read_csv_auto(path)
+
+
+def read_table(path, schema=None):
+    """
+    Loads a stage table by its CSV/XLSX path. The columnar intermediate is used when
+    it exists and the text file is missing or not newer; otherwise the text file is
+    parsed (nothing is written).
+    """
+    cache = columnar_path(path)
+    if os.path.exists(cache) and (not os.path.exists(path) or os.path.getmtime(cache) >= os.path.getmtime(path)):
+        return apply_schema(read_columnar(cache), schema)
+    return apply_schema(read_text_table(path), schema)
+
+
+def export_table(df, path):
+    """Writes the CSV (utf-8-sig) or XLSX deliverable."""
+    if path.lower().endswith('.xlsx'):
+        df.to_excel(path, index=False, engine='openpyxl')
+    else:
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def write_table(df, path, schema=None, export=True):
+    """
+    Saves a stage table under its CSV/XLSX path: the columnar intermediate always,
+    the text deliverable when export is set. The intermediate is written last so
+    read_table prefers it.
+    """
+    apply_schema(df, schema)
+    if export:
+        export_table(df, path)
+    write_columnar(df, columnar_path(path))